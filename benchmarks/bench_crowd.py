@@ -0,0 +1,66 @@
+"""
+Cost per frame of an audience of creatures blinking and looking at a mobject, played one by one
+(one updater and one animation per creature) and as a :class:`CreatureCrowd`.
+
+Run it from the root of the repository with::
+
+    python benchmarks/bench_crowd.py
+    python benchmarks/bench_crowd.py --creatures 100 200 400 --frames 120
+"""
+
+import argparse
+import time
+
+from manim import *
+from manim_digital_presenter import *
+
+
+def build_audience(creatures: int) -> list[Creature]:
+    """
+    Build a grid of creatures with a plain :class:`Circle` as body, so no LaTeX is needed.
+    """
+
+    positions = [[-6 + (i % 20)*0.6, -3 + (i // 20)*0.6, 0] for i in range(creatures)]
+    return Creature.spawn(creatures, positions=positions, seeds=list(range(creatures)),
+                          core=Circle(radius=0.25, fill_opacity=1), eye_body_ratio=0.4)
+
+
+def frame_cost(audience: Mobject, animations: list[Animation], frames: int) -> float:
+    """
+    Return the mean time (in milliseconds) of updating the audience and interpolating its animations for one frame.
+    """
+
+    scene = Scene()
+    scene.add(audience)
+    for animation in animations:
+        animation.begin()
+    dt = 1 / config.frame_rate
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        alpha = (frame + 1) / frames
+        for animation in animations:
+            animation.interpolate(alpha)
+        scene.update_mobjects(dt)
+    return 1e3 * (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--creatures", type=int, nargs="+", default=[10, 100, 400])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    speaker = Dot(UP*3)
+    print(f"{'creatures':>10} {'one by one (ms)':>16} {'crowd (ms)':>11}")
+    for creatures in args.creatures:
+        members = build_audience(creatures)
+        one_by_one = frame_cost(Group(*members), [member.look_at(speaker) for member in members], args.frames)
+
+        crowd = CreatureCrowd(*build_audience(creatures), seed=0)
+        vectorised = frame_cost(crowd, [crowd.look_at(speaker)], args.frames)
+        print(f"{creatures:>10} {one_by_one:>16.2f} {vectorised:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
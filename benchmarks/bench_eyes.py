@@ -0,0 +1,69 @@
+"""
+Frames per second of scenes full of :class:`Creature`, comparing the legacy ``always_redraw`` eyes
+against the in-place eye rig.
+
+Run it from the root of the repository with::
+
+    python benchmarks/bench_eyes.py
+    python benchmarks/bench_eyes.py --frames 120 --render
+
+Without ``--render`` only the updaters are stepped (what :meth:`Scene.update_mobjects` does every
+frame). With ``--render`` every frame is also rasterised with the default cairo :class:`Camera`.
+"""
+
+import argparse
+import time
+
+from manim import *
+from manim_digital_presenter import *
+
+
+def build_cast(n: int, redraw_eyes: bool) -> list[Creature]:
+    """
+    Build ``n`` creatures in a grid. The body is a plain :class:`Circle`, so no LaTeX is needed.
+    """
+
+    cast = []
+    for i in range(n):
+        creature = Creature(core=Circle(radius=0.5, fill_opacity=1),
+                            eye_body_ratio=0.4,
+                            redraw_eyes=redraw_eyes)
+        creature.scale(0.3).move_to([-6 + (i % 10) * 1.3, 3 - (i // 10) * 1.5, 0])
+        cast.append(creature)
+    return cast
+
+
+def frames_per_second(n: int, redraw_eyes: bool, frames: int = 60, render: bool = False) -> float:
+    """
+    Step ``frames`` frames of a scene with ``n`` creatures and return the achieved frame rate.
+    """
+
+    cast = build_cast(n, redraw_eyes)
+    camera = Camera() if render else None
+    dt = 1 / config.frame_rate
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for creature in cast:
+            creature.update(dt)
+        if camera is not None:
+            camera.reset()
+            camera.capture_mobjects(cast)
+    return frames / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--render", action="store_true", help="Also rasterise every frame.")
+    args = parser.parse_args()
+
+    print(f"{'creatures':>10} {'always_redraw fps':>18} {'in-place rig fps':>17} {'speedup':>8}")
+    for n in (1, 10, 50):
+        before = frames_per_second(n, redraw_eyes=True, frames=args.frames, render=args.render)
+        after = frames_per_second(n, redraw_eyes=False, frames=args.frames, render=args.render)
+        print(f"{n:>10} {before:>18.1f} {after:>17.1f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
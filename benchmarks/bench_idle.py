@@ -0,0 +1,62 @@
+"""
+Cost per creature of :meth:`Scene.update_mobjects`, for creatures with no idle behaviour, with
+blinking only, and with every idle behaviour enabled.
+
+Run it from the root of the repository with::
+
+    python benchmarks/bench_idle.py
+    python benchmarks/bench_idle.py --creatures 50 --frames 600
+"""
+
+import argparse
+import time
+
+from manim import *
+from manim_digital_presenter import *
+
+# Each setup builds fresh keyword arguments, so no behaviour is shared between creatures.
+SETUPS = {
+    "no idle": lambda: dict(blink_rate=0),
+    "blink": lambda: dict(),
+    "blink + breathe + glow + levitate": lambda: dict(idle=[Breathe(), Glow(), Levitate()]),
+}
+
+
+def build_creature(setup: str) -> Creature:
+    """
+    Build a creature for one of the :data:`SETUPS`. The body is a plain :class:`Circle`, so no LaTeX is needed.
+    """
+
+    return Creature(core=Circle(radius=0.5, fill_opacity=1), eye_body_ratio=0.4, **SETUPS[setup]())
+
+
+def update_cost(setup: str, creatures: int = 10, frames: int = 300) -> float:
+    """
+    Return the mean time (in microseconds) that :meth:`Scene.update_mobjects` spends per creature and frame.
+    """
+
+    scene = Scene()
+    scene.add(*[build_creature(setup) for _ in range(creatures)])
+    dt = 1 / config.frame_rate
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        scene.update_mobjects(dt)
+    return 1e6 * (time.perf_counter() - start) / (frames * creatures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--creatures", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'idle behaviours':>35} {'updaters':>9} {'us / creature / frame':>22}")
+    for setup in SETUPS:
+        updaters = sum(len(mob.updaters) for mob in build_creature(setup).get_family())
+        cost = update_cost(setup, creatures=args.creatures, frames=args.frames)
+        print(f"{setup:>35} {updaters:>9} {cost:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Cost per frame of playing a long timeline: each animation turned into an updater (the previous
+``play_timeline``) against the interval-indexed :class:`TimelineEngine`. Frames are stepped with
+:meth:`Scene.update_mobjects`, nothing is rendered.
+
+Run it from the root of the repository with::
+
+    python benchmarks/bench_timeline.py
+    python benchmarks/bench_timeline.py --entries 50 500 5000
+"""
+
+import argparse
+import time
+
+from manim import *
+from manim_digital_presenter import *
+
+
+def build_timeline(entries: int, spacing: float = 0.5) -> dict[float, list]:
+    """
+    Build a timeline like the one of a script: every entry fades in a dot, moves it and fades it out, overlapping the next entries.
+    """
+
+    timeline = {}
+    for i in range(entries):
+        dot = Dot([-6 + (i % 24)*0.5, 3 - (i // 24 % 12)*0.5, 0])
+        timeline.setdefault(i*spacing, []).extend([FadeIn(dot, run_time=0.5),
+                                                   dot.animate(run_time=1).shift(0.2*UP)])
+        timeline.setdefault(i*spacing + 1, []).append(FadeOut(dot, run_time=0.5))
+    return timeline
+
+
+def updater_frames(scene: Scene, timeline: dict, dt: float) -> int:
+    """
+    Play the timeline as the previous ``play_timeline`` did, turning every animation into an updater. Return the number of frames.
+    """
+
+    frames = 0
+    previous_t = 0
+    ending_time = 0
+    for t, anims in sorted(timeline.items()):
+        while previous_t < t:
+            scene.update_mobjects(dt)
+            previous_t += dt
+            frames += 1
+        for anim in anims:
+            if not isinstance(anim, Animation):
+                anim = anim.build()
+            turn_animation_into_updater(anim)
+            scene.add(anim.mobject)
+            ending_time = max(ending_time, t + anim.run_time)
+    while previous_t < ending_time:
+        scene.update_mobjects(dt)
+        previous_t += dt
+        frames += 1
+    return frames
+
+
+def engine_frames(scene: Scene, timeline: dict, dt: float) -> int:
+    """
+    Play the timeline with a :class:`TimelineEngine`. Return the number of frames.
+    """
+
+    engine = TimelineEngine(timeline)
+    engine.attach(scene)
+    frames = 0
+    while engine.time < engine.duration:
+        scene.update_mobjects(dt)
+        frames += 1
+    engine.detach()
+    return frames
+
+
+def frame_cost(play, entries: int) -> float:
+    """
+    Return the mean time (in microseconds) of one frame of a timeline with a given number of entries.
+    """
+
+    scene = Scene()
+    timeline = build_timeline(entries)
+    dt = 1 / config.frame_rate
+
+    start = time.perf_counter()
+    frames = play(scene, timeline, dt)
+    return 1e6 * (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[50, 500])
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'updaters (us / frame)':>22} {'engine (us / frame)':>20}")
+    for entries in args.entries:
+        updaters = frame_cost(updater_frames, entries)
+        engine = frame_cost(engine_frames, entries)
+        print(f"{entries:>8} {updaters:>22.1f} {engine:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
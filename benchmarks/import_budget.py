@@ -0,0 +1,24 @@
+"""
+Import budget of manim_digital_presenter, shared by ``benchmarks/run.py`` and ``tests/test_imports.py``. Reading,
+laying out and timing a script must stay fast and must not import manim, so it can run in pre-commit hooks.
+"""
+
+# Longest import time allowed (milliseconds), whatever the baseline says.
+IMPORT_BUDGET_MS = {
+    "package_ms": 50,
+    "loader_ms": 50,
+    "dry_run_ms": 300,
+    "script_tools_ms": 300,
+}
+
+# What each import benchmark imports in a fresh interpreter, and whether it may import manim.
+IMPORTS = {
+    "package_ms": ("import manim_digital_presenter", False),
+    "loader_ms": ("from manim_digital_presenter import load_csv_dialogue, iter_script_rows", False),
+    "dry_run_ms": ("from manim_digital_presenter import script_sequencer, script_timeline, timing_report", False),
+    "script_tools_ms": ("import manim_digital_presenter.script_controller.loader, "
+                        "manim_digital_presenter.script_controller.schedule, "
+                        "manim_digital_presenter.script_controller.dry_run, "
+                        "manim_digital_presenter.script_controller.layout", False),
+    "everything_ms": ("from manim_digital_presenter import *", True),
+}
@@ -0,0 +1,308 @@
+"""
+Benchmark suite of manim_digital_presenter: construction of eyes and creatures, per-frame update
+cost, timeline scheduling, script loading, pagination and sequencing, text reveal, audio mixdown, and the import time of the package. Nothing needs LaTeX.
+
+Run it from the root of the repository with::
+
+    python benchmarks/run.py                      # run everything, compare with benchmarks/baseline.json
+    python benchmarks/run.py --save-baseline      # run and store the results as the new baseline
+    python benchmarks/run.py --only update timeline --quick
+
+The results are written as JSON to ``benchmarks/results/``. Every metric is a time (or a 0/1 flag), so lower is better.
+When a baseline exists, metrics slower than the baseline by more than ``--tolerance`` are reported
+as regressions and the exit code is 1. The import benchmark also fails when reading or timing a script
+imports manim, or takes longer than ``IMPORT_BUDGET_MS``.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from manim import *
+from manim_digital_presenter import *
+from manim_digital_presenter.presenter.assets import DEFAULT_SVGS_DIR
+
+from bench_idle import update_cost
+from bench_timeline import build_timeline, engine_frames, frame_cost
+from import_budget import IMPORT_BUDGET_MS, IMPORTS
+
+HERE = Path(__file__).parent
+
+
+def best_of(function, repeat: int = 5) -> float:
+    """
+    Return the best wall time (in seconds) of several calls of a function, as :mod:`timeit` does.
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench_construction(quick: bool) -> dict[str, float]:
+    """
+    Time to build one :class:`Eyes`, and one :class:`Creature` with and without hands (microseconds).
+    """
+
+    hand = load_svg(str(Path(DEFAULT_SVGS_DIR) / "blob_hand.svg"))
+    repeat = 3 if quick else 10
+    return {
+        "eyes_us": 1e6 * best_of(lambda: Eyes(), repeat),
+        "creature_no_hands_us": 1e6 * best_of(lambda: Creature(core=Circle(fill_opacity=1)), repeat),
+        "creature_hands_us": 1e6 * best_of(lambda: Creature(core=Circle(fill_opacity=1), hand=hand.copy()), repeat),
+        "creature_clone_us": 1e6 * best_of(Creature(core=Circle(fill_opacity=1), hand=hand.copy()).clone, repeat),
+    }
+
+
+def bench_update(quick: bool) -> dict[str, float]:
+    """
+    Per-frame update cost of N creatures (microseconds per creature and frame).
+    """
+
+    creatures, frames = (10, 60) if quick else (50, 300)
+    return {
+        "no_idle_us": update_cost("no idle", creatures, frames),
+        "blink_us": update_cost("blink", creatures, frames),
+        "all_idle_us": update_cost("blink + breathe + glow + levitate", creatures, frames),
+    }
+
+
+def bench_timeline(quick: bool) -> dict[str, float]:
+    """
+    Scheduling of large timelines: building the engine, a dry-run timing report and the cost of a frame.
+    """
+
+    entries = 500 if quick else 5000
+    timeline = build_timeline(entries)
+    return {
+        f"engine_build_{entries}_ms": 1e3 * best_of(lambda: TimelineEngine(timeline), 3),
+        f"timing_report_{entries}_ms": 1e3 * best_of(lambda: timing_report(timeline), 3),
+        "engine_frame_500_us": frame_cost(engine_frames, 500),
+    }
+
+
+def bench_loading(quick: bool) -> dict[str, float]:
+    """
+    Throughput of :func:`load_csv_dialogue` and :func:`iter_script_rows` on a long script (microseconds per line).
+    """
+
+    lines = 2000 if quick else 20000
+    with tempfile.TemporaryDirectory() as folder:
+        script = Path(folder) / "script.csv"
+        with open(script, "w", newline="") as stream:
+            writer = csv.writer(stream, delimiter="/")
+            for i in range(lines):
+                writer.writerow([("none", "surprise", "thinking")[i % 3], f"This is the line number {i} of the script.", i*3, 3])
+        return {
+            "load_csv_dialogue_us_per_line": 1e6 * best_of(lambda: load_csv_dialogue(script), 3) / lines,
+            "iter_script_rows_us_per_line": 1e6 * best_of(lambda: list(iter_script_rows(script)), 3) / lines,
+        }
+
+
+def bench_layout(quick: bool) -> dict[str, float]:
+    """
+    Wrapping and pagination of a long script in the default :class:`Text_Box` with :func:`paginate_dialogue` (microseconds per line).
+    """
+
+    lines = 2000 if quick else 20000
+    rows = [ScriptRow("none", f"This is the line number {i} of the script, long enough to be wrapped over two lines of the box, "
+                              f"and sometimes over two pages when the creature has a lot to say about {{\\bf line {i}}}.")
+            for i in range(lines)]
+    # A new GlyphMetrics each time, so no word width comes from its cache.
+    return {"paginate_us_per_line": 1e6 * best_of(lambda: paginate_dialogue(rows, (11.2, 1.6), metrics=GlyphMetrics()), 3) / lines}
+
+
+def bench_sequencer(quick: bool) -> dict[str, float]:
+    """
+    Iteration of :func:`script_sequencer`, with mobjects and as a dry run (microseconds per line).
+    """
+
+    lines = 200 if quick else 1000
+    texts = [VMobject() for _ in range(lines)]
+    triangle = Triangle()
+    dialogue = [f"line {i}" for i in range(lines)]
+    return {
+        "sequencer_us_per_line": 1e6 * best_of(lambda: list(script_sequencer(texts, triangle)), 3) / lines,
+        "sequencer_dry_run_us_per_line": 1e6 * best_of(lambda: list(script_sequencer(dialogue, None, dry_run=True)), 3) / lines,
+    }
+
+
+def time_import(statement: str) -> tuple[float, bool]:
+    """
+    Run an import statement in a fresh interpreter and return how long it took (milliseconds) and whether it imported manim.
+    """
+
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(1e3 * (time.perf_counter() - start), 'manim' in sys.modules)")
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    elapsed, manim = output.split()
+    return float(elapsed), manim == "True"
+
+
+def bench_import(quick: bool) -> dict[str, float]:
+    """
+    Import time of the package, of the script loader, of the dry-run timing tools and of the modules reading, laying out and timing a script, each in a fresh interpreter (milliseconds).
+    """
+
+    repeat = 3 if quick else 7
+    results = {}
+    for name, (statement, _) in IMPORTS.items():
+        runs = [time_import(statement) for _ in range(repeat)]
+        results[name] = min(elapsed for elapsed, _ in runs)
+        results[name.replace("_ms", "_imports_manim")] = float(any(manim for _, manim in runs))
+    return results
+
+
+def check_import_budget(results: dict[str, float]) -> list[str]:
+    """
+    Return the import benchmarks that imported manim when they should not, or went over their budget.
+    """
+
+    failures = []
+    for name, (_, manim_allowed) in IMPORTS.items():
+        if not manim_allowed and results[name.replace("_ms", "_imports_manim")]:
+            failures.append(f"import.{name} (imports manim)")
+        budget = IMPORT_BUDGET_MS.get(name)
+        if budget is not None and results[name] > budget:
+            failures.append(f"import.{name} ({results[name]:.1f} ms > {budget} ms)")
+    return failures
+
+
+def bench_reveal(quick: bool) -> dict[str, float]:
+    """
+    Cost of a frame of the reveal of a dialogue line of 80 glyphs, with :class:`Create` and with :class:`Typewriter` (microseconds per frame), and of loading a line into a :class:`TextSlot` (microseconds per line).
+    """
+
+    frames = 60 if quick else 240
+
+    def frame_cost(animation_class) -> float:
+        line = VGroup(*(Square(0.1).shift(0.12 * i * RIGHT) for i in range(80)))
+
+        def reveal():
+            animation = animation_class(line, run_time=frames / 60)
+            animation.begin()
+            for frame in range(1, frames + 1):
+                animation.interpolate(frame / frames)
+        return 1e6 * best_of(reveal, 3) / frames
+
+    # Loading lines into a TextSlot, which reuses its glyphs instead of adding a new mobject per line.
+    lines = [VGroup(*(Square(0.1).shift(0.12 * i * RIGHT) for i in range(count))) for count in (80, 60, 40, 70)]
+    slot = TextSlot()
+
+    def load_lines():
+        for line in lines:
+            slot.load(line)
+
+    return {"create_us_per_frame": frame_cost(Create),
+            "typewriter_us_per_frame": frame_cost(Typewriter),
+            "text_slot_load_us_per_line": 1e6 * best_of(load_lines, 3) / len(lines)}
+
+
+def bench_audio(quick: bool) -> dict[str, float]:
+    """
+    Mixdown of the beeps of a long script into one track, one beep every 3 seconds, and synthesis of the voice of a 300-line script (milliseconds).
+    """
+
+    beeps = 100 if quick else 500
+    track = AudioTrack()
+    for i in range(beeps):
+        track.add(3 * i)
+    lines = [f"This is the line number {i} of the script, said by the creature." for i in range(300)]
+    return {f"mix_{beeps}_beeps_ms": 1e3 * best_of(track.mix, 3),
+            # A new voice each time, so nothing comes from its cache.
+            "voice_300_lines_ms": 1e3 * best_of(lambda: [voice.line(line, 3) for voice in [Voice()] for line in lines], 3)}
+
+
+BENCHMARKS = {
+    "import": bench_import,
+    "construction": bench_construction,
+    "update": bench_update,
+    "timeline": bench_timeline,
+    "loading": bench_loading,
+    "layout": bench_layout,
+    "sequencer": bench_sequencer,
+    "reveal": bench_reveal,
+    "audio": bench_audio,
+}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Print every metric next to its baseline and return the names of the ones that regressed.
+    """
+
+    regressions = []
+    print(f"{'metric':<50} {'baseline':>12} {'current':>12} {'change':>8}")
+    for group, metrics in results.items():
+        for name, value in metrics.items():
+            reference = baseline.get(group, {}).get(name)
+            if reference is None:
+                print(f"{group + '.' + name:<50} {'-':>12} {value:>12.3f}")
+                continue
+            change = value / reference - 1 if reference else 0
+            flag = ""
+            if change > tolerance:
+                flag = "  REGRESSION"
+                regressions.append(f"{group}.{name}")
+            print(f"{group + '.' + name:<50} {reference:>12.3f} {value:>12.3f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Run only these benchmarks.")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes, for a fast check.")
+    parser.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before a regression. Defaults to 0.2 (20%%).")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        print(f"running {name}...", file=sys.stderr)
+        results[name] = BENCHMARKS[name](args.quick)
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    report = {"timestamp": stamp,
+              "quick": args.quick,
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "results": results}
+    output = HERE / "results" / f"{stamp}.json"
+    output.parent.mkdir(exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}", file=sys.stderr)
+
+    regressions = []
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("quick") != args.quick:
+            print("warning: the baseline was run with a different --quick setting", file=sys.stderr)
+        regressions = compare(results, baseline["results"], args.tolerance)
+    else:
+        compare(results, {}, args.tolerance)
+    if "import" in results:
+        regressions += check_import_budget(results["import"])
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"baseline saved to {args.baseline}", file=sys.stderr)
+
+    if regressions:
+        print(f"{len(regressions)} regressions: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
-from .script_controller import *
-from .presenter import *
+from ._lazy import lazy_exports
+from . import script_controller, presenter
 
-__all__ = []
-__all__ += script_controller.__all__
-__all__ += presenter.__all__
+# Nothing heavy is imported here: every name is loaded from its submodule when first used,
+# and ``from manim_digital_presenter import *`` still imports everything.
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "script_controller": script_controller.__all__,
+    "presenter": presenter.__all__,
+    "profiling": ["Profiler", "enable_profiling", "disable_profiling", "active_profiler"],
+    "metrics": ["counters", "reset_counters"],
+})
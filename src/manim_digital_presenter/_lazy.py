@@ -0,0 +1,41 @@
+import importlib
+
+
+def lazy_exports(package: str, exports: dict[str, list[str]]):
+    """
+    Build the ``__all__``, ``__getattr__`` and ``__dir__`` of a package whose submodules are only imported when one of their names is first used. Importing the package itself is then almost free, and tools that only need e.g. :func:`load_csv_dialogue` do not import manim.
+
+    :param package: ``__name__`` of the package.
+    :type package: str
+
+    :param exports: Maps each submodule to the public names it defines, in the order of ``__all__``.
+    :type exports: dict[str, list[str]]
+
+    :return: ``__all__``, ``__getattr__`` and ``__dir__`` for the package.
+    :rtype: tuple[list[str], Callable, Callable]
+
+    :raises ValueError: If two submodules export the same name, since one would silently hide the other.
+
+    """
+
+    modules = {}
+    for module, names in exports.items():
+        for name in names:
+            if modules.setdefault(name, module) != module:
+                raise ValueError(f"{package} exports {name!r} from both {modules[name]!r} and {module!r}")
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        if name in exports:
+            value = importlib.import_module(f"{package}.{name}")
+        elif name in modules:
+            value = getattr(importlib.import_module(f"{package}.{modules[name]}"), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value  # Later lookups do not go through __getattr__.
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(modules) | set(exports))
+
+    return list(modules), __getattr__, __dir__
@@ -0,0 +1,65 @@
+import logging
+from collections import Counter
+
+__all__ = ["counters", "reset_counters"]
+
+# Logger of the whole package. It is silent unless the application configures logging, e.g.
+# ``logging.getLogger("manim_digital_presenter").setLevel(logging.DEBUG)`` with a handler.
+logger = logging.getLogger("manim_digital_presenter")
+logger.addHandler(logging.NullHandler())
+
+_counters = Counter()
+
+
+def count(name: str, amount: int = 1):
+    """
+    Add to a counter. It costs one dictionary update, so it can be called on hot paths.
+
+    :param name: Name of the counter, e.g. ``"animations.surprise"``.
+    :type name: str
+
+    :param amount: How much to add. Defaults to 1.
+    :type amount: int, optional
+
+    """
+
+    _counters[name] += amount
+
+
+def counters(prefix: str = "") -> dict[str, int]:
+    """
+    Return the counters of the package since the start of the process (or the last :func:`reset_counters`):
+
+    - ``animations.<method>``: animations built by each creature method (``surprise``, ``look_at``...).
+    - ``creatures.constructed`` and ``creatures.cloned``: creatures built from scratch and with :meth:`Creature.clone`.
+    - ``svg_cache.hits``/``misses`` and ``tex_cache.hits``/``misses``: lookups in the SVG registry and in the LaTeX caches.
+    - ``text_slot.glyphs_allocated`` and ``text_slot.glyphs_reused``: glyphs created and reused by the :class:`TextSlot` pools.
+    - ``render.succeeded`` and ``render.failed``: scripts rendered by :func:`render_scripts`.
+
+    :param prefix: Only return the counters whose name starts with it. Defaults to "" (all of them).
+    :type prefix: str, optional
+
+    :return: A copy of the counters, sorted by name.
+    :rtype: dict[str, int]
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        class Lesson(Scene):
+            def construct(self):
+                ...
+                # e.g. sent to the metrics collector of a render farm
+                print(json.dumps(counters()))
+
+    """
+
+    return {name: _counters[name] for name in sorted(_counters) if name.startswith(prefix)}
+
+
+def reset_counters():
+    """
+    Set every counter back to zero, e.g. between the scenes of a batch render.
+    """
+
+    _counters.clear()
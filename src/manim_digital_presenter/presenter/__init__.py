@@ -1,6 +1,11 @@
-from .eyes import *
-from .creature import *
+from .._lazy import lazy_exports
 
-__all__ = []
-__all__ += creature.__all__
-__all__ += eyes.__all__
+# The submodules (and manim) are imported when one of their names is first used.
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "creature": ["Creature"],
+    "eyes": ["Eyes"],
+    "crowd": ["CreatureCrowd"],
+    "idle": ["IdleBehaviour", "Blink", "Breathe", "Glow", "Levitate"],
+    "assets": ["load_svg", "preload_default_assets", "svg_cache_info", "clear_svg_cache"],
+    "actions": ["creature_action"],
+})
@@ -0,0 +1,43 @@
+import functools
+import inspect
+from .. import metrics
+
+__all__ = ["creature_action"]
+
+
+def creature_action(method):
+    """
+    Decorator for the animation methods of :class:`Eyes` and :class:`Creature` (``look_at``, ``surprise``...). The animation returned by the method is tagged with its name in ``creature_method``, so timing reports (see :func:`timing_report`) can tell which creature methods fire, and counted in the ``animations.<name>`` counter (see :func:`counters`).
+
+    The decorated method also gets a ``planned_run_time`` function, which returns the run time the method would use for some arguments, without building any animation. It is what a dry run of a script uses.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        class Blob(Creature):
+            @creature_action
+            def wave(self, rf=there_and_back, rt=2):
+                return Rotate(self.r_hand, angle=PI/4, rate_func=rf, run_time=rt)
+
+        Blob.wave.planned_run_time(rt=1.5)  # 1.5
+
+    """
+
+    signature = inspect.signature(method)
+    counter = f"animations.{method.__name__}"
+
+    @functools.wraps(method)
+    def action(self, *args, **kwargs):
+        animation = method(self, *args, **kwargs)
+        animation.creature_method = method.__name__
+        metrics.count(counter)
+        return animation
+
+    def planned_run_time(*args, **kwargs) -> float:
+        arguments = signature.bind_partial(None, *args, **kwargs)
+        arguments.apply_defaults()
+        return float(arguments.arguments.get("rt", 0))
+
+    action.planned_run_time = planned_run_time
+    return action
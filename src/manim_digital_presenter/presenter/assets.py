@@ -0,0 +1,93 @@
+from ..my_imports import *
+import os
+import threading
+from .. import metrics
+
+__all__ = ["load_svg", "preload_default_assets", "svg_cache_info", "clear_svg_cache"]
+
+DEFAULT_SVGS_DIR = path.join(path.dirname(__file__), "default_svgs")
+
+# Process-wide registry: one parsed prototype per file (and set of SVGMobject options).
+_SVG_PROTOTYPES = {}
+_SVG_STATS = {"hits": 0, "misses": 0}
+_SVG_LOCK = threading.Lock()
+
+
+def load_svg(file_name: str, **kwargs) -> SVGMobject:
+    """
+    Load an SVG file through the process-wide asset registry. Each file is parsed only once; every call returns a cheap copy of the parsed geometry, so building many creatures (or rebuilding them between scenes) does not parse the same file again.
+
+    The registry notices when the file changes on the disk and parses it again.
+
+    :param file_name: Path to the SVG file.
+    :type file_name: str
+
+    :param kwargs: Options of :class:`SVGMobject` (e.g. ``height``, ``fill_color``). Different options are cached separately.
+
+    :returns: An independent copy of the parsed SVG.
+    :rtype: :class:`SVGMobject`
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        body = load_svg("svg_files/blob_body.svg")
+        hand = load_svg("svg_files/blob_hand.svg")
+        cast = [Creature(core=body.copy(), hand=hand.copy()) for _ in range(20)]
+
+    """
+
+    full_path = path.abspath(file_name)
+    key = (full_path, path.getmtime(full_path), tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+
+    with _SVG_LOCK:
+        prototype = _SVG_PROTOTYPES.get(key)
+        outcome = "hits" if prototype is not None else "misses"
+        _SVG_STATS[outcome] += 1
+    metrics.count(f"svg_cache.{outcome}")
+
+    if prototype is None:
+        prototype = SVGMobject(full_path, **kwargs)
+        with _SVG_LOCK:
+            prototype = _SVG_PROTOTYPES.setdefault(key, prototype)
+
+    return prototype.copy()
+
+
+def preload_default_assets():
+    """
+    Parse every default asset of the package (the accessories of :class:`Creature` and the blob body and hand) into the registry, so the first creature of a scene, or of a worker process, does not pay for it.
+    """
+
+    for file_name in sorted(os.listdir(DEFAULT_SVGS_DIR)):
+        if file_name.endswith(".svg"):
+            load_svg(path.join(DEFAULT_SVGS_DIR, file_name))
+
+
+def svg_cache_info() -> dict[str, int]:
+    """
+    Return the state of the SVG registry: number of parsed files, hits, misses and the memory used by the geometry arrays of the prototypes.
+
+    :rtype: dict[str, int]
+
+    """
+
+    with _SVG_LOCK:
+        prototypes = list(_SVG_PROTOTYPES.values())
+        stats = dict(_SVG_STATS)
+
+    stats["entries"] = len(prototypes)
+    stats["bytes"] = sum(mob.points.nbytes
+                         for prototype in prototypes
+                         for mob in prototype.family_members_with_points())
+    return stats
+
+
+def clear_svg_cache():
+    """
+    Forget every parsed SVG and reset the counters of the registry.
+    """
+
+    with _SVG_LOCK:
+        _SVG_PROTOTYPES.clear()
+        _SVG_STATS.update(hits=0, misses=0)
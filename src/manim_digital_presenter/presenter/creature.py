@@ -1,5 +1,8 @@
 from ..my_imports import *
+from .assets import *
 from .eyes import *
+from .actions import *
+from .. import metrics
 
 
 __all__ = ["Creature"]
@@ -53,8 +56,8 @@ class Creature(Eyes, VMobject):
 
                 positions = [LEFT, RIGHT, DOWN, UP, UL, UR, DL, DR]
                 # Creature body parts and definition
-                body = SVGMobject("svg_files/blob_body.svg")
-                lh = SVGMobject("svg_files/blob_hand.svg")
+                body = load_svg("svg_files/blob_body.svg")
+                lh = load_svg("svg_files/blob_hand.svg")
                 my_creature = Creature(eyelid_color_input=BLUE,
                                        relative_eye_position=0.1,
                                        eye_body_ratio=0.3,
@@ -128,14 +131,15 @@ class Creature(Eyes, VMobject):
 
 
         # Extra accessories
+        # Accessories come from the shared asset registry, so each file is only parsed once per process.
         get_bulb_path = path.join(path.dirname(__file__), "default_svgs/lightbulb.svg")
         get_question_path = path.join(path.dirname(__file__), "default_svgs/question_mark.svg")
 
-        self.question = SVGMobject(get_question_path).set_color(self.eyelid_color_input)
+        self.question = load_svg(get_question_path).set_color(self.eyelid_color_input)
         self.question.scale(0.2).next_to(self.oculii, UP, buff=0.2)
         self.question.set_opacity(0)
 
-        self.bulb = SVGMobject(get_bulb_path)
+        self.bulb = load_svg(get_bulb_path)
         self.bulb.scale(0.3).next_to(self.oculii, UP, buff=0.2)
         self.bulb.set_opacity(0)
         
@@ -154,39 +158,119 @@ class Creature(Eyes, VMobject):
             self.add(self.core, self.frown, self.l_shoulder, self.r_shoulder, self.l_hand, self.r_hand, self.question, self.bulb)
 
         else:
-            print("---------- Warning ----------\n",
-                  "The creature has no hands\n",
-                  "All creature animations will load without hand animations\n",
-                  "-----------------------------")
+            metrics.logger.info("The creature has no hands, its animations will load without hand animations")
             self.add(self.core, self.frown, self.l_shoulder, self.r_shoulder, self.question, self.bulb)
+        metrics.count("creatures.constructed")
+
+    @classmethod
+    def spawn(cls,
+              n: int,
+              positions: list[np.ndarray] = None,
+              colors: list[ParsableManimColor] = None,
+              seeds: list[int] = None,
+              **kwargs) -> list["Creature"]:
+        """
+        Build a crowd of creatures. Only one creature is fully built (eyes laid out, accessories loaded, hands mirrored); the rest are copies of its geometry, placed and recoloured with :meth:`clone`. Each creature keeps its own updaters and idle state.
+
+        :param n: Number of creatures.
+        :type n: int
+
+        :param positions: Where to place each creature. Defaults to None (all at the position of the prototype).
+        :type positions: list[np.ndarray], optional
+
+        :param colors: Colour of each creature. Defaults to None (the colour given in ``kwargs``).
+        :type colors: list[ParsableManimColor], optional
+
+        :param seeds: Blink seed of each creature. Defaults to None (a different random seed for each copy).
+        :type seeds: list[int], optional
+
+        :param kwargs: Parameters of the prototype, as in :class:`Creature`.
 
-        self.go_live() 
+        :return: The creatures.
+        :rtype: list[:class:`Creature`]
+
+        **Example usage:**
+
+        .. code-block:: python
+
+            audience = Creature.spawn(12,
+                                      positions=[[-5 + i, -3, 0] for i in range(12)],
+                                      colors=[BLUE, GREEN, ORANGE]*4,
+                                      core=load_svg("svg_files/blob_body.svg"),
+                                      hand=load_svg("svg_files/blob_hand.svg"))
+            self.add(*audience)
 
-    def go_live(self):
         """
-        Dummy function to make the creature alive. It uses its own timer to make the creature blink and any other passive changes on the creature (for example, one can adapt an updater to make the creature breath, or shine based on this dummy element)
-        
+
+        for name, values in (("positions", positions), ("colors", colors), ("seeds", seeds)):
+            if values is not None and len(values) != n:
+                raise ValueError(f"{name} must have {n} entries, it has {len(values)}")
+
+        prototype = cls(**kwargs)
+        creatures = [prototype] + [prototype.clone() for _ in range(n - 1)]
+        for i, creature in enumerate(creatures):
+            creature._vary(position=positions[i] if positions is not None else None,
+                           color=colors[i] if colors is not None else None,
+                           seed=seeds[i] if seeds is not None else None,
+                           reseed=seeds is not None)
+        return creatures
+
+    def clone(self,
+              position: np.ndarray = None,
+              color: ParsableManimColor = None,
+              seed: int = None) -> "Creature":
         """
+        Return a copy of the creature, built by copying its geometry instead of laying it out again. The copy has its own updaters and idle state, and blinks on its own schedule.
 
-        time = 0
-        dummy_element = VMobject()
+        :param position: Where to place the copy. Defaults to None (same position).
+        :type position: np.ndarray, optional
 
-        def living(mob, dt):
-            nonlocal time
-            time += dt
-            self.pulse(time)
-        dummy_element.add_updater(living)
-        self.add(dummy_element)
+        :param color: Colour of the copy. Defaults to None (same colour).
+        :type color: ParsableManimColor, optional
 
-    def pulse(self, time):
+        :param seed: Blink seed of the copy. Defaults to None (a new random seed).
+        :type seed: int, optional
+
+        :rtype: :class:`Creature`
+
+        """
+
+        metrics.count("creatures.cloned")
+        return self.copy()._vary(position=position, color=color, seed=seed)
+
+    def _vary(self, position=None, color=None, seed=None, reseed=True):
         """
-        Obsolet function to use previous :meth:`go_live` and make the creature glow. It requires a glow mobject to iluminate.
+        Give a copy its own look: position, colour and blink seed.
         """
 
-        # self.glow.set_opacity(1-0.6*np.cos(time)**2)
-        # This can perhaps be improved to make the whole creature levitate (oscillate around a point depending on a time parameter or any other time dependence)
+        if reseed:
+            for behaviour in self.idle_behaviours:
+                if isinstance(behaviour, Blink):
+                    behaviour.reseed(seed)
+        if color is not None:
+            self.recolor(color)
+        if position is not None:
+            self.move_to(position)
+        return self
+
+    def recolor(self, color: ParsableManimColor):
+        """
+        Paint the creature with a new colour, as ``eyelid_color_input`` does at construction: eyelids, body, hands and question mark.
+
+        :param color: The new colour of the creature.
+        :type color: ParsableManimColor
 
+        """
+
+        super().recolor(color)
+        self.core.set_fill(color)
+        self.question.set_color(color)
+        if self.hand is not None:
+            self.l_hand.set_fill(color)
+            self.r_hand.set_fill(color)
+        return self
 
+    @creature_action
     def point_at(self,
                 direction: list | Mobject, # That bar allows for either class
                 rf: float = there_and_back_with_pause,
@@ -223,6 +307,7 @@ class Creature(Eyes, VMobject):
                            run_time=rt),
                            lag_ratio=0.1)
     
+    @creature_action
     def surprise(self,
                   rf: float = there_and_back_with_pause,
                   rt: float = 3) -> Animation:
@@ -259,6 +344,7 @@ class Creature(Eyes, VMobject):
         else:
             return AnimationGroup(super().surprised())
 
+    @creature_action
     def thinking(self,
                  rf: float = there_and_back_with_pause,
                  rt: float = 3) -> Animation:
@@ -295,6 +381,7 @@ class Creature(Eyes, VMobject):
                     self.question.animate(run_time=rt, rate_func=rf).set_opacity(1))
 
     
+    @creature_action
     def dont_know(self,
                  rf: float = there_and_back_with_pause,
                  rt: float = 3) -> Animation:
@@ -326,6 +413,7 @@ class Creature(Eyes, VMobject):
                     super().look_at(self.pupil_to_eye_rate*UP))
 
     
+    @creature_action
     def have_idea(self,
                  rf: float = there_and_back_with_pause,
                  rt: float = 3) -> Animation:
@@ -386,12 +474,12 @@ class Creature(Eyes, VMobject):
             new_direction = input
 
         if new_direction[0] > 0:
-            print("greater")
+            metrics.logger.debug("Pointing with the right hand at %s", new_direction)
             chosen_hand = self.r_hand
             chosen_shoulder = self.r_shoulder
             delta_func = 0
         else:
-            print("smaller")
+            metrics.logger.debug("Pointing with the left hand at %s", new_direction)
             chosen_hand = self.l_hand
             chosen_shoulder = self.l_shoulder
             delta_func= 1
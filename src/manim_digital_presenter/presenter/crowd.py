@@ -0,0 +1,265 @@
+from ..my_imports import *
+from .eyes import *
+from .idle import Blink
+from .. import profiling
+
+__all__ = ["CreatureCrowd"]
+
+
+class CreatureCrowd(VGroup):
+    """
+    A container for many :class:`Eyes` or :class:`Creature` (an audience, a class...) driven from NumPy arrays instead of one set of Python updaters and animations per member.
+
+    The pupil offsets, pupil scales and blink state of all the members are stored in contiguous arrays. The points of every pupil and reflection are views on one single buffer, so moving all the pupils is one array operation. Blinking is run by one updater for the whole crowd, which only touches the members whose eyelids open or close in that frame.
+
+    :param members: The :class:`Eyes` or :class:`Creature` of the crowd.
+    :type members: :class:`Eyes`
+
+    :param blink_rate: Average number of blinks per second of each member. Defaults to 0.7. If 0, nobody blinks.
+    :type blink_rate: float, optional
+
+    :param blink_duration: How long the eyelids stay closed on each blink, in seconds. Defaults to 0.1.
+    :type blink_duration: float, optional
+
+    :param seed: Seed of the blinks of the crowd. Defaults to None (drawn from :mod:`random`).
+    :type seed: int, optional
+
+    :ivar pupil_offsets: Shift of the pupils of each member from their rest position, shape (n, 3).
+    :vartype pupil_offsets: np.ndarray
+
+    :ivar pupil_scales: Size of the pupils of each member relative to their rest size, shape (n,).
+    :vartype pupil_scales: np.ndarray
+
+    :ivar blink_closed: Whether the eyelids of each member are closed, shape (n,).
+    :vartype blink_closed: np.ndarray
+
+    .. note::
+        The crowd replaces the :class:`Blink` behaviour of its members. Other idle behaviours keep running. Moving members (or playing their own eye animations) is fine: the pupil buffer is gathered again at the start of the next crowd animation.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        audience = CreatureCrowd(*Creature.spawn(100,
+                                                 positions=[[-6 + (i % 20)*0.6, -3 + (i // 20)*0.6, 0] for i in range(100)],
+                                                 core=Circle(fill_opacity=1)))
+        self.add(audience)
+        self.play(audience.look_at(speaker))
+        self.play(audience.surprised())
+
+    """
+
+    def __init__(self,
+                 *members: Eyes,
+                 blink_rate: float = 0.7,
+                 blink_duration: float = 0.1,
+                 seed: int = None,
+                 **kwargs):
+        super().__init__(*members, **kwargs)
+        self.members = list(members)
+        self.blink_rate = blink_rate
+        self.blink_duration = blink_duration
+
+        n = len(self.members)
+        self.pupil_offsets = np.zeros((n, 3))
+        self.pupil_scales = np.ones(n)
+        self.blink_closed = np.zeros(n, dtype=bool)
+        self.pupil_to_eye_rates = np.array([member.pupil_to_eye_rate for member in self.members], dtype=float)
+
+        self.time = 0
+        self._rng = np.random.default_rng(seed if seed is not None else random.getrandbits(32))
+        self._blink_next = 0.2 + self._open_times(n)  # No blinking at the beginning of the scene.
+
+        for member in self.members:
+            member.remove_idle(Blink)
+        self._buffer = None
+        self.relink()
+        if self.blink_rate > 0:
+            self.add_updater(self._crowd_update)
+
+    def relink(self):
+        """
+        Gather the current points of every pupil and reflection into the shared buffer, and make the points of each of them a view on it. It does nothing if they are all still linked.
+        """
+
+        leaves = [leaf for member in self.members for leaf in member.sight.family_members_with_points()]
+        if self._buffer is not None and all(leaf.points.base is self._buffer for leaf in leaves):
+            return
+
+        sizes = np.array([len(leaf.points) for leaf in leaves], dtype=int)
+        self._buffer = np.concatenate([leaf.points for leaf in leaves]).astype(float) if leaves else np.zeros((0, 3))
+        starts = np.concatenate(([0], np.cumsum(sizes)))
+        for leaf, start, end in zip(leaves, starts[:-1], starts[1:]):
+            leaf.points = self._buffer[start:end]
+
+        # Which member, and which eye (pupil + reflection, scaled about its own center), each point belongs to.
+        member_points = [sum(len(leaf.points) for leaf in member.sight.family_members_with_points())
+                         for member in self.members]
+        self._point_member = np.repeat(np.arange(len(self.members)), member_points)
+        self._member_starts = np.concatenate(([0], np.cumsum(member_points)[:-1])).astype(int)
+        eye_points = [sum(len(leaf.points) for leaf in eye.family_members_with_points())
+                      for member in self.members for eye in member.sight]
+        self._eye_member = np.repeat(np.arange(len(self.members)), [len(member.sight) for member in self.members])
+        self._point_eye = np.repeat(np.arange(len(eye_points)), eye_points)
+        self._eye_starts = np.concatenate(([0], np.cumsum(eye_points)[:-1])).astype(int)
+
+    def _open_times(self, n: int) -> np.ndarray:
+        if self.blink_rate <= 0:
+            return np.full(n, np.inf)
+        mean_open = max(1/self.blink_rate - self.blink_duration, self.blink_duration)
+        return self._rng.exponential(mean_open, n)
+
+    def _crowd_update(self, mob, dt):
+        profiler = profiling._active
+        if profiler is None:
+            self._blink_step(dt)
+        else:
+            profiler.call("CreatureCrowd.blink", "idle", self._blink_step, dt)
+
+    def _blink_step(self, dt):
+        self.time += dt
+        while True:
+            flips = np.flatnonzero(self._blink_next <= self.time)
+            if not len(flips):
+                break
+            self.blink_closed[flips] = ~self.blink_closed[flips]
+            closed = self.blink_closed[flips]
+            self._blink_next[flips] += np.where(closed, self.blink_duration, self._open_times(len(flips)))
+            # Only the eyelids whose state changed are touched.
+            for index, is_closed in zip(flips, closed):
+                oculii = self.members[index].oculii
+                oculii[0][2].set_opacity(int(is_closed))
+                oculii[1][2].set_opacity(int(is_closed))
+
+    def _eye_centers(self) -> np.ndarray:
+        """
+        Center of the pupils of every eye, computed from the buffer with one reduction.
+        """
+
+        lows = np.minimum.reduceat(self._buffer, self._eye_starts)
+        highs = np.maximum.reduceat(self._buffer, self._eye_starts)
+        return (lows + highs) / 2
+
+    def member_centers(self) -> np.ndarray:
+        """
+        Return the rest position of the pupils of every member, shape (n, 3).
+
+        :rtype: np.ndarray
+
+        """
+
+        self.relink()
+        lows = np.minimum.reduceat(self._buffer, self._member_starts)
+        highs = np.maximum.reduceat(self._buffer, self._member_starts)
+        return (lows + highs) / 2 - self.pupil_offsets
+
+    def set_pupils(self, offsets: np.ndarray = None, scales: np.ndarray = None):
+        """
+        Move and scale the pupils of every member at once.
+
+        :param offsets: New shift of the pupils of each member from their rest position, shape (n, 3). Defaults to None (unchanged).
+        :type offsets: np.ndarray, optional
+
+        :param scales: New size of the pupils of each member relative to their rest size, shape (n,). Defaults to None (unchanged).
+        :type scales: np.ndarray, optional
+
+        """
+
+        if not len(self.members):
+            return self
+        buffer = self._buffer
+        if scales is not None and np.any(scales != self.pupil_scales):
+            ratio = (scales / self.pupil_scales)[self._eye_member][self._point_eye, None]
+            centers = self._eye_centers()[self._point_eye]
+            buffer -= centers
+            buffer *= ratio
+            buffer += centers
+            self.pupil_scales = np.array(scales, dtype=float)
+        if offsets is not None:
+            buffer += (offsets - self.pupil_offsets)[self._point_member]
+            self.pupil_offsets = np.array(offsets, dtype=float)
+        return self
+
+    def look_at(self,
+                direction: list | Mobject,
+                rf: float = there_and_back_with_pause,
+                rt: float = 3) -> Animation:
+        """
+        Make every member look at the same direction or mobject. All the direction vectors are computed at once, from the position of each member.
+
+        :param direction: The direction or the object to look at.
+        :type direction: list | Mobject
+
+        :param rf: Animation rate function. Defaults to :meth: `there_and_back_with_pause`.
+        :type rf: `func`
+
+        :param rt: Animation duration. Defaults to 3".
+        :type rt: float
+
+        :returns: The animation of the whole crowd.
+        :rtype: `Animation`
+
+        """
+
+        def targets(crowd):
+            if isinstance(direction, Mobject):
+                vectors = direction.get_center() - crowd.member_centers()
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                directions = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+            else:
+                directions = np.tile(np.asarray(direction, dtype=float), (len(crowd.members), 1))
+            return 0.2*crowd.pupil_to_eye_rates[:, None]*directions, None
+
+        return _CrowdAnimation(self, targets, rate_func=rf, run_time=rt)
+
+    def surprised(self,
+                  rf: float = there_and_back_with_pause,
+                  rt: float = 3) -> Animation:
+        """
+        Make every member look surprised (pupils shrink), as :meth:`Eyes.surprised`.
+
+        :rtype: `Animation`
+
+        """
+
+        return _CrowdAnimation(self, lambda crowd: (None, 0.5*crowd.pupil_scales), rate_func=rf, run_time=rt)
+
+    def excited(self,
+                rf: float = there_and_back_with_pause,
+                rt: float = 3) -> Animation:
+        """
+        Make every member look amused by something (pupils grow), as :meth:`Eyes.excited`.
+
+        :rtype: `Animation`
+
+        """
+
+        return _CrowdAnimation(self, lambda crowd: (None, 1.2*crowd.pupil_scales), rate_func=rf, run_time=rt)
+
+
+class _CrowdAnimation(Animation):
+    """
+    Animation of the pupils of a whole :class:`CreatureCrowd`. It interpolates the state arrays of the crowd instead of the points of every submobject, and it does not copy the crowd when it begins.
+    """
+
+    def __init__(self, crowd: CreatureCrowd, targets: Callable, **kwargs):
+        super().__init__(crowd, suspend_mobject_updating=False, **kwargs)
+        self.targets = targets
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self):
+        crowd = self.mobject
+        crowd.relink()
+        self.start_offsets = crowd.pupil_offsets.copy()
+        self.start_scales = crowd.pupil_scales.copy()
+        target_offsets, target_scales = self.targets(crowd)
+        self.target_offsets = self.start_offsets if target_offsets is None else target_offsets
+        self.target_scales = self.start_scales if target_scales is None else target_scales
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        t = self.rate_func(alpha)
+        self.mobject.set_pupils(self.start_offsets + t*(self.target_offsets - self.start_offsets),
+                                self.start_scales + t*(self.target_scales - self.start_scales))
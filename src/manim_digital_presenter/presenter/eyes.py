@@ -1,4 +1,8 @@
 from ..my_imports import *
+from .idle import *
+from .actions import *
+from ..script_controller.voice import Voice, default_voice
+from .. import profiling
 
 __all__ = ["Eyes"]
 
@@ -25,6 +29,21 @@ class Eyes(VMobject):
     :param eyes_distance: A vector that indicates the distance between the eyes (measured from each pupil center). Defaults to [1,0,0].
     :type eyes_distance: list[float]
 
+    :param redraw_eyes: If True, :attr:`oculii` and :attr:`sight` are rebuilt with :func:`always_redraw` on every frame (legacy behaviour). Defaults to False, where the eye rig is built once and every animation moves or restyles it in place.
+    :type redraw_eyes: bool, optional
+
+    :param blink_rate: Average number of blinks per second. Defaults to 0.7. If 0, the eyes never blink.
+    :type blink_rate: float, optional
+
+    :param blink_duration: How long the eyelids stay closed on each blink, in seconds. Defaults to 0.1.
+    :type blink_duration: float, optional
+
+    :param blink_seed: Seed of the blink schedule. Two eyes with the same seed and rate blink at exactly the same times, so renders are reproducible. Defaults to None, which draws the seed from :mod:`random` (seeded by manim when the scene has a ``random_seed``).
+    :type blink_seed: int, optional
+
+    :param idle: Extra idle behaviours (see :class:`IdleBehaviour`), such as :class:`Breathe`, :class:`Glow` or :class:`Levitate`. They all run, together with the blinking, from one single updater. Defaults to None.
+    :type idle: list[IdleBehaviour], optional
+
 
     .. note::
         Animations of the :class:`Eyes` will be called in the :class:`Creature` by the :method:`super()`.
@@ -60,6 +79,11 @@ class Eyes(VMobject):
                  pupil_color_input: ParsableManimColor = BLACK,
                  reflection_direction: list[float] = UR,
                  eyes_distance: str = 0.1,  # If 0, the eyes will be touching.
+                 redraw_eyes: bool = False,
+                 blink_rate: float = 0.7,
+                 blink_duration: float = 0.1,
+                 blink_seed: int = None,
+                 idle: list[IdleBehaviour] = None,
                  **kwargs):
         super().__init__(**kwargs)
 
@@ -71,6 +95,12 @@ class Eyes(VMobject):
         self.pupil_color_input = pupil_color_input
         self.reflection_direction = reflection_direction
         self.eyes_distance = eyes_distance
+        self.redraw_eyes = redraw_eyes
+        self.blink_rate = blink_rate
+        self.blink_duration = blink_duration
+        self.blink_seed = blink_seed
+        self.idle_behaviours = []
+        self.idle_time = 0
 
         # eyes
         self.eye = Circle(color=self.eyeball_color_input,
@@ -120,50 +150,105 @@ class Eyes(VMobject):
                                half_eyelid_down, self.sight)
         self.full_eye_2 = self.full_eye.copy().next_to(self.full_eye, buff=eyes_distance)
 
-        self.oculii = always_redraw(lambda:
-                                    VGroup(self.full_eye, self.full_eye_2))
-        self.sight = always_redraw(lambda: VGroup(self.full_eye[-1], self.full_eye_2[-1]))
+        if self.redraw_eyes:
+            self.oculii = always_redraw(profiling.profiled("Eyes.redraw oculii", "redraw", lambda:
+                                        VGroup(self.full_eye, self.full_eye_2)))
+            self.sight = always_redraw(profiling.profiled("Eyes.redraw sight", "redraw", lambda:
+                                       VGroup(self.full_eye[-1], self.full_eye_2[-1])))
+        else:
+            # The rig is built once. Both groups share their submobjects with full_eye and full_eye_2,
+            # so any animation on them moves the very same pupils, eyelids... in place.
+            self.oculii = VGroup(self.full_eye, self.full_eye_2)
+            self.sight = VGroup(self.full_eye[-1], self.full_eye_2[-1])
         self.oculii.move_to([0, 0, 0])
         self.add(self.oculii)
+        if self.blink_rate > 0:
+            self.to_blink()  # self function to start the blinking of the eyes.
+        self.add_idle(*(idle or []))
+
+    def go_live(self):
+        """
+        Start the idle scheduler of the eyes: one single updater that advances the timer :attr:`idle_time` and runs every behaviour in :attr:`idle_behaviours`. It registers nothing if there are no idle behaviours. It is called by :meth:`add_idle`, so there is usually no need to call it by hand.
+        """
+
+        if self.idle_behaviours and self._idle_update not in self.updaters:
+            self.add_updater(self._idle_update)
+
+    def _idle_update(self, mob, dt):
+        self.idle_time += dt
+        profiler = profiling._active
+        for behaviour in self.idle_behaviours:
+            if profiler is None:
+                behaviour.update(self, self.idle_time, dt)
+            else:
+                profiler.call(f"{type(behaviour).__name__}.update", "idle", behaviour.update, self, self.idle_time, dt)
+
+    def add_idle(self, *behaviours: IdleBehaviour):
+        """
+        Add idle behaviours to the eyes and make sure the idle scheduler is running.
+
+        :param behaviours: The behaviours to add, e.g. :class:`Breathe` or :class:`Levitate`.
+        :type behaviours: :class:`IdleBehaviour`
+
+        """
+
+        self.idle_behaviours.extend(behaviours)
         self.go_live()
-        self.to_blink()  # self function to start the blinking of the eyes.
+        return self
 
-    def to_blink(self):
+    def remove_idle(self, *kinds: type | IdleBehaviour):
         """
-        Method to make the eyes blink. It uses its own timer (nonlocal) to make the blinking. Its main feature is the counter "time" that increments independently and it is used in the following functions.
+        Remove idle behaviours, given either the behaviour itself or its class. If no behaviour is left, the idle scheduler is removed too, so the eyes carry no updater at all.
+
+        :param kinds: Behaviours or classes of behaviours to remove, e.g. :class:`Blink`.
+        :type kinds: type | :class:`IdleBehaviour`
+
         """
 
-        time = 0
-        self.blinking = False
-        dummy_element = VMobject()
+        classes = tuple(kind for kind in kinds if isinstance(kind, type))
+        self.idle_behaviours = [behaviour for behaviour in self.idle_behaviours
+                                if behaviour not in kinds and not isinstance(behaviour, classes)]
+        if not self.idle_behaviours:
+            self.remove_updater(self._idle_update)
+        return self
+
+    def to_blink(self):
+        """
+        Method to make the eyes blink. It adds a :class:`Blink` behaviour built from :attr:`blink_rate`, :attr:`blink_duration` and :attr:`blink_seed`, whose whole blink timeline is drawn once as an array of (start, end) intervals.
+        """
 
-        def living(mob, dt):
-            nonlocal time
-            time += dt
-            self.blink(time)
-        dummy_element.add_updater(living)
-        self.add(dummy_element)
+        self.add_idle(Blink(rate=self.blink_rate,
+                            duration=self.blink_duration,
+                            seed=self.blink_seed))
 
     def blink(self, time):
         """
-        Conditional function. If a random number gets greater than some value, the creature will move its eyelid (i.e. will set opacity to them). Observe that has to be done to both eyelids separatly. Some issues with animation interaction.
+        Open or close the eyelids as the blink schedule says for a given time. The opacity of the eyelids is only touched when a blink starts or ends.
+
+        :param time: Time (in seconds) since the eyes started living.
+        :type time: float
+
         """
 
-        if time < 0.2:  # No blinking at the beginning of the scene
-            return
-        window = time % 1
-        if window < 0.2:
-            if not self.blinking:
-                if random.random() < 0.1:
-                    self.oculii[0][2].set_opacity(1)
-                    self.oculii[1][2].set_opacity(1)
-                    self.blinking = True
-        else:
-            if self.blinking:
-                self.oculii[0][2].set_opacity(0)
-                self.oculii[1][2].set_opacity(0)
-                self.blinking = False
+        for behaviour in self.idle_behaviours:
+            if isinstance(behaviour, Blink):
+                behaviour.update(self, time, 0)
+
+    def recolor(self, color: ParsableManimColor):
+        """
+        Paint the eyelids with a new colour, as ``eyelid_color_input`` does at construction. Their opacity (e.g. in the middle of a blink) is kept.
+
+        :param color: The new colour of the eyelids.
+        :type color: ParsableManimColor
+
+        """
+
+        self.eyelid_color_input = color
+        for eye in self.oculii:
+            eye[2:5].set_fill(color)  # eyelid and both half eyelids
+        return self
 
+    @creature_action
     def look_at(self,
                 direction: list | Mobject,
                 rf: float=there_and_back_with_pause,
@@ -194,6 +279,7 @@ class Eyes(VMobject):
 
         return AnimationGroup(self.sight.animate(rate_func=rf, run_time=rt).shift(0.2*self.pupil_to_eye_rate*new_direction))
 
+    @creature_action
     def bored(self,
               rf: float = there_and_back_with_pause,
               rt: float = 3) -> Animation:
@@ -215,6 +301,7 @@ class Eyes(VMobject):
                               self.oculii[1][3:4].animate(rate_func=rf).set_opacity(1),
                               self.sight.animate(rate_func=rf).shift(0.05*UP), 
                               run_time=rt)
+    @creature_action
     def surprised(self,
                  rf: float = there_and_back_with_pause,
                  rt: float = 3) -> Animation:
@@ -236,6 +323,7 @@ class Eyes(VMobject):
                                self.sight[-1].animate(rate_func=rf, run_time=rt).scale(0.5),
                                )
     
+    @creature_action
     def excited(self,
                  rf: float = there_and_back_with_pause,
                  rt: float = 3) -> Animation:
@@ -258,4 +346,62 @@ class Eyes(VMobject):
                                self.sight[-1].animate(rate_func=rf, run_time=rt).scale(1.2),
                                )
 
+    @creature_action
+    def talk(self,
+             line: str | Mobject,
+             rf: Callable = None,
+             rt: float = 4,
+             voice: Voice = None,
+             amplitude: float = 0.06) -> Animation:
+        """
+        Method to make the :class:`Eyes` bounce while a dialogue line is written, once per blip of the voice (see :class:`Voice`). Played together with :class:`Speak` (same line mobject, run time and voice), the bounces and the blips happen at the same times.
+
+        :param line: The dialogue line, or better its mobject, so the glyphs are counted as :class:`Speak` draws them.
+        :type line: str | Mobject
+
+        :param rf: Rate function applied to the whole line by the animation writing it, if any (see :func:`reveal_times`). Defaults to None, for :class:`Create`, :class:`Speak` and :class:`Typewriter`, which apply their rate function inside the slot of each glyph.
+        :type rf: `func`, optional
+
+        :param rt: Animation duration, the run time of the line. Defaults to 4".
+        :type rt: float
+
+        :param voice: The voice of the creature. Defaults to None (:func:`default_voice`).
+        :type voice: Voice, optional
+
+        :param amplitude: Height of a bounce. Defaults to 0.06.
+        :type amplitude: float
+
+        :returns: The animation of the talking eyes.
+        :rtype: `Animation`
+
+        """
+
+        voice = voice or default_voice()
+        return _EyeBounce(self, voice.line(line, rt, rf).times, voice.blip * voice.every, amplitude, run_time=rt)
+
+
+class _EyeBounce(Animation):
+    """
+    Bounce the eyes up a little at given times. Only the offset of the previous frame is undone, so the animation
+    does not fight with the idle behaviours (which keep running) or other animations of the eyes.
+    """
 
+    def __init__(self, eyes: Eyes, times: np.ndarray, bounce: float, amplitude: float, **kwargs):
+        self.times = np.asarray(times)
+        self.bounce = bounce
+        self.amplitude = amplitude
+        self._offset = 0
+        super().__init__(eyes, rate_func=linear, suspend_mobject_updating=False, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return Mobject()  # Only relative shifts are applied: no need for a copy of the creature.
+
+    def interpolate_mobject(self, alpha: float):
+        t = alpha * self.run_time
+        index = np.searchsorted(self.times, t, side="right") - 1
+        since = t - self.times[index] if index >= 0 else self.bounce
+        height = self.amplitude * np.sin(np.pi * since / self.bounce) if since < self.bounce and alpha < 1 else 0
+        if height != self._offset:
+            for eye in (self.mobject.full_eye, self.mobject.full_eye_2):
+                eye.shift((height - self._offset) * UP)
+            self._offset = height
@@ -0,0 +1,231 @@
+from ..my_imports import *
+from abc import ABC, abstractmethod
+
+__all__ = ["IdleBehaviour", "Blink", "Breathe", "Glow", "Levitate"]
+
+
+class IdleBehaviour(ABC):
+    """
+    Base class of the passive behaviours of :class:`Eyes` and :class:`Creature` (blinking, breathing, glowing...). All the behaviours of a creature are run from one single updater, its idle scheduler (see :meth:`Eyes.go_live`). A creature without idle behaviours carries no updater at all.
+
+    To create a new behaviour, subclass it and implement :meth:`update` (a subclass without it cannot be instantiated). Behaviours should apply changes relative to the previous frame (or only when something changes), so an animation of the whole creature (e.g. ``creature.animate.shift(RIGHT)``) and the behaviour add up.
+
+    .. warning::
+       Behaviours that move or scale the creature (:class:`Breathe`, :class:`Levitate`) do not reach the parts that are being animated on their own. A :class:`Transform` of a part (e.g. :meth:`Eyes.look_at` on the sight, or the rotation of a hand) interpolates from the copy of the part taken when the animation begins. That part does not follow the idle motion while the animation runs, and it ends offset from the rest of the creature by the motion it missed (at most the amplitude of the behaviour). Use small amplitudes, or remove these behaviours (see :meth:`Eyes.remove_idle`) around long animations of parts.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        class Wobble(IdleBehaviour):
+            def update(self, creature, time, dt):
+                creature.rotate(0.05*(np.sin(time) - np.sin(time - dt)))
+
+        my_creature = Creature(core=body, idle=[Wobble(), Breathe()])
+
+    """
+
+    @abstractmethod
+    def update(self, creature: Mobject, time: float, dt: float):
+        """
+        Advance the behaviour one frame.
+
+        :param creature: The :class:`Eyes` or :class:`Creature` running the behaviour.
+        :type creature: :class:`Eyes`
+
+        :param time: Time (in seconds) since the creature started living.
+        :type time: float
+
+        :param dt: Time elapsed since the previous frame.
+        :type dt: float
+
+        """
+
+
+class Blink(IdleBehaviour):
+    """
+    Natural blinking of the eyes. The whole blink timeline is drawn once from a seed and a rate as an array of (start, end) intervals. Every frame only a pointer to the next blink is bumped, and the opacity of the eyelids is only touched when a blink starts or ends.
+
+    :param rate: Average number of blinks per second. Defaults to 0.7.
+    :type rate: float, optional
+
+    :param duration: How long the eyelids stay closed on each blink, in seconds. Defaults to 0.1.
+    :type duration: float, optional
+
+    :param seed: Seed of the blink schedule. Same seed and rate give exactly the same blinks, so renders are reproducible. Defaults to None, which draws the seed from :mod:`random` (seeded by manim when the scene has a ``random_seed``).
+    :type seed: int, optional
+
+    """
+
+    def __init__(self,
+                 rate: float = 0.7,
+                 duration: float = 0.1,
+                 seed: int = None):
+        self.rate = rate
+        self.duration = duration
+        self.closed = False
+        self.reseed(seed)
+
+    def reseed(self, seed: int = None):
+        """
+        Restart the blink schedule from a new seed, e.g. so copies of a creature do not blink in sync.
+
+        :param seed: The new seed. If None, it is drawn from :mod:`random`.
+        :type seed: int, optional
+
+        """
+
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self._rng = np.random.default_rng(self.seed)
+        self._intervals = np.empty((0, 2))
+        self._index = 0
+        self._last_time = 0
+
+    def schedule(self, until: float) -> np.ndarray:
+        """
+        Return the blink intervals up to a given time. The schedule is extended lazily, in chunks, but it only depends on :attr:`seed`, :attr:`rate` and :attr:`duration`.
+
+        :param until: Time (in seconds since the creature started living) the schedule must cover.
+        :type until: float
+
+        :returns: Array of shape (n, 2) with the (start, end) of every blink starting before ``until``.
+        :rtype: np.ndarray
+
+        """
+
+        self._extend(until)
+        return self._intervals[self._intervals[:, 0] < until]
+
+    def _extend(self, until: float, chunk: int = 64):
+        """
+        Append blinks to the schedule until its last blink ends after ``until``. The open time between blinks is exponentially distributed, so blinks follow a Poisson-like rhythm with the requested rate. No blinking happens in the first 0.2 seconds of the scene.
+        """
+
+        if self.rate <= 0:
+            self._intervals = np.array([[np.inf, np.inf]])
+            return
+
+        mean_open = max(1/self.rate - self.duration, self.duration)
+        while not len(self._intervals) or self._intervals[-1, 1] <= until:
+            last_end = self._intervals[-1, 1] if len(self._intervals) else 0.2
+            starts = (last_end
+                      + np.cumsum(self._rng.exponential(mean_open, chunk))
+                      + self.duration*np.arange(chunk))
+            self._intervals = np.concatenate((self._intervals,
+                                              np.column_stack((starts, starts + self.duration))))
+
+    def is_closed(self, time: float) -> bool:
+        """
+        Tell whether the eyelids are closed at a given time. It bumps a pointer to the next blink, so calls with increasing times cost O(1). If the time goes back, the blink is found again with a binary search.
+
+        :param time: Time (in seconds) since the creature started living.
+        :type time: float
+
+        :returns: True if ``time`` falls inside a blink.
+        :rtype: bool
+
+        """
+
+        intervals = self._intervals
+        if time < self._last_time:
+            self._index = int(np.searchsorted(intervals[:, 1], time, side="right"))
+        self._last_time = time
+
+        while True:
+            if self._index >= len(intervals):
+                self._extend(time)
+                intervals = self._intervals
+            if intervals[self._index, 1] > time:
+                break
+            self._index += 1
+
+        return bool(intervals[self._index, 0] <= time)
+
+    def update(self, creature, time, dt):
+        closed = self.is_closed(time)
+        if closed != self.closed:
+            # Observe that has to be done to both eyelids separatly.
+            creature.oculii[0][2].set_opacity(int(closed))
+            creature.oculii[1][2].set_opacity(int(closed))
+            self.closed = closed
+
+
+class Breathe(IdleBehaviour):
+    """
+    Make the body of the creature (or the eyes, if it has none) slowly grow and shrink, standing on its bottom edge. Parts animated on their own do not follow it, see :class:`IdleBehaviour`.
+
+    :param amplitude: Relative change of size. Defaults to 0.02.
+    :type amplitude: float, optional
+
+    :param period: Duration of a whole breath, in seconds. Defaults to 4.
+    :type period: float, optional
+
+    """
+
+    def __init__(self,
+                 amplitude: float = 0.02,
+                 period: float = 4):
+        self.amplitude = amplitude
+        self.period = period
+
+    def _size(self, time):
+        return 1 + self.amplitude*np.sin(TAU*time/self.period)
+
+    def update(self, creature, time, dt):
+        target = getattr(creature, "core", creature.oculii)
+        target.scale(self._size(time)/self._size(time - dt), about_edge=DOWN)
+
+
+class Glow(IdleBehaviour):
+    """
+    Make a mobject of the creature shine, by oscillating its fill opacity as ``1 - amplitude*cos(time)**2``.
+
+    :param mobject: The mobject to illuminate. Defaults to None, which takes the body of the creature.
+    :type mobject: :class:`VMobject`, optional
+
+    :param amplitude: How much of the opacity is lost at the darkest point. Defaults to 0.6.
+    :type amplitude: float, optional
+
+    :param speed: Angular speed of the oscillation. Defaults to 1.
+    :type speed: float, optional
+
+    """
+
+    def __init__(self,
+                 mobject: VMobject = None,
+                 amplitude: float = 0.6,
+                 speed: float = 1):
+        self.mobject = mobject
+        self.amplitude = amplitude
+        self.speed = speed
+
+    def update(self, creature, time, dt):
+        target = self.mobject if self.mobject is not None else getattr(creature, "core", None)
+        if not isinstance(target, VMobject):  # No body: a creature without core has an empty Mobject.
+            raise ValueError("Glow needs a mobject to illuminate, but the creature has no body.")
+        target.set_fill(opacity=1 - self.amplitude*np.cos(self.speed*time)**2)
+
+
+class Levitate(IdleBehaviour):
+    """
+    Make the whole creature float up and down around its position. Parts animated on their own do not follow it, see :class:`IdleBehaviour`.
+
+    :param amplitude: Maximum vertical displacement. Defaults to 0.05.
+    :type amplitude: float, optional
+
+    :param period: Duration of a whole oscillation, in seconds. Defaults to 2.
+    :type period: float, optional
+
+    """
+
+    def __init__(self,
+                 amplitude: float = 0.05,
+                 period: float = 2):
+        self.amplitude = amplitude
+        self.period = period
+
+    def _height(self, time):
+        return self.amplitude*np.sin(TAU*time/self.period)
+
+    def update(self, creature, time, dt):
+        creature.shift((self._height(time) - self._height(time - dt))*UP)
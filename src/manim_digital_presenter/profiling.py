@@ -0,0 +1,274 @@
+import atexit
+import json
+import os
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+__all__ = ["Profiler", "enable_profiling", "disable_profiling", "active_profiler"]
+
+# The profiler the instrumented code reports to. When it is None, instrumented code pays one global lookup.
+_active = None
+
+_EVENT = np.dtype([("name", np.int32), ("category", np.int32), ("start", np.float64), ("duration", np.float64)])
+
+
+class Profiler:
+    """
+    Records how long each part of a presenter scene takes: every idle behaviour of :class:`Eyes` and :class:`Creature`, the redraws of ``redraw_eyes=True``, every animation stepped by :func:`play_timeline` and every text pulled by :func:`script_sequencer`. Events are stored in a fixed-size ring buffer, so a long render keeps only the latest ones and never grows in memory.
+
+    It is usually created with :func:`enable_profiling`.
+
+    :param capacity: Number of events kept in the ring buffer. Defaults to 65536.
+    :type capacity: int, optional
+
+    :ivar dropped: Number of events overwritten because the buffer was full.
+    :vartype dropped: int
+
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.capacity = capacity
+        self.dropped = 0
+        self._events = np.zeros(capacity, dtype=_EVENT)
+        self._count = 0
+        self._names = {}
+        self._origin = perf_counter()
+
+    def _intern(self, name: str) -> int:
+        index = self._names.get(name)
+        if index is None:
+            index = self._names[name] = len(self._names)
+        return index
+
+    def record(self, name: str, category: str, start: float, duration: float):
+        """
+        Store one event.
+
+        :param name: What ran, e.g. ``"Blink.update"``.
+        :type name: str
+
+        :param category: Kind of event, e.g. ``"idle"`` or ``"animation"``.
+        :type category: str
+
+        :param start: Start time, from :func:`time.perf_counter`.
+        :type start: float
+
+        :param duration: Wall time in seconds.
+        :type duration: float
+
+        """
+
+        if self._count >= self.capacity:
+            self.dropped += 1
+        self._events[self._count % self.capacity] = (self._intern(name), self._intern(category),
+                                                     start - self._origin, duration)
+        self._count += 1
+
+    def call(self, name: str, category: str, function, *args):
+        """
+        Call a function and record how long it took.
+
+        :return: Whatever the function returns.
+
+        """
+
+        start = perf_counter()
+        result = function(*args)
+        self.record(name, category, start, perf_counter() - start)
+        return result
+
+    def events(self) -> np.ndarray:
+        """
+        Return the events in the buffer, oldest first.
+
+        :return: Structured array with the fields ``name``, ``category`` (indices in :meth:`names`), ``start`` and ``duration`` (seconds).
+        :rtype: np.ndarray
+
+        """
+
+        if self._count <= self.capacity:
+            return self._events[:self._count].copy()
+        split = self._count % self.capacity
+        return np.concatenate((self._events[split:], self._events[:split]))
+
+    def names(self) -> list[str]:
+        """
+        Return the interned names and categories, in index order.
+
+        :rtype: list[str]
+
+        """
+
+        return list(self._names)
+
+    def summary(self) -> list[dict]:
+        """
+        Aggregate the events by name: number of calls, total, mean and maximum wall time (in milliseconds), slowest first.
+
+        :rtype: list[dict]
+
+        """
+
+        events = self.events()
+        names = self.names()
+        rows = []
+        for index in np.unique(events["name"]):
+            selected = events[events["name"] == index]
+            durations = 1e3 * selected["duration"]
+            rows.append({"name": names[index],
+                         "category": names[selected["category"][0]],
+                         "calls": len(selected),
+                         "total_ms": float(durations.sum()),
+                         "mean_ms": float(durations.mean()),
+                         "max_ms": float(durations.max())})
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def format_summary(self) -> str:
+        """
+        Return :meth:`summary` as a text table.
+
+        :rtype: str
+
+        """
+
+        lines = [f"{'name':<40} {'category':<10} {'calls':>8} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        for row in self.summary():
+            lines.append(f"{row['name'][:40]:<40} {row['category']:<10} {row['calls']:>8} "
+                         f"{row['total_ms']:>10.2f} {row['mean_ms']:>9.4f} {row['max_ms']:>9.4f}")
+        if self.dropped:
+            lines.append(f"({self.dropped} older events were dropped from the ring buffer)")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        """
+        Write the events as a Chrome trace (``chrome://tracing``, Perfetto, speedscope...).
+
+        :param path: Where to write the JSON file.
+        :type path: str | Path
+
+        :return: The path of the trace.
+        :rtype: Path
+
+        """
+
+        events = self.events()
+        names = self.names()
+        pid = os.getpid()
+        trace = {"displayTimeUnit": "ms",
+                 "traceEvents": [{"name": names[event["name"]],
+                                  "cat": names[event["category"]],
+                                  "ph": "X",
+                                  "ts": 1e6 * float(event["start"]),
+                                  "dur": 1e6 * float(event["duration"]),
+                                  "pid": pid,
+                                  "tid": 0}
+                                 for event in events]}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(trace))
+        return path
+
+    def clear(self):
+        """
+        Forget every event.
+        """
+
+        self._count = 0
+        self.dropped = 0
+
+
+def enable_profiling(capacity: int = 1 << 16, trace_path: str | Path = None) -> Profiler:
+    """
+    Start recording the frame time of creatures, timelines and sequencers. While profiling is disabled (the default), the instrumented code only checks one global variable.
+
+    :param capacity: Number of events kept, see :class:`Profiler`. Defaults to 65536.
+    :type capacity: int, optional
+
+    :param trace_path: If given, a Chrome trace is written there, and the summary table next to it (with the ``.txt`` suffix), when the render ends.
+    :type trace_path: str | Path, optional
+
+    :return: The new profiler.
+    :rtype: Profiler
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        class Lesson(Scene):
+            def construct(self):
+                enable_profiling(trace_path="media/profile/lesson.json")
+                ...
+
+    """
+
+    global _active
+    _active = Profiler(capacity)
+    if trace_path is not None:
+        atexit.register(_export, _active, Path(trace_path))
+    return _active
+
+
+def disable_profiling() -> Profiler | None:
+    """
+    Stop recording.
+
+    :return: The profiler that was active, with its events, or None.
+    :rtype: Profiler | None
+
+    """
+
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+def active_profiler() -> Profiler | None:
+    """
+    Return the profiler currently recording, or None.
+
+    :rtype: Profiler | None
+
+    """
+
+    return _active
+
+
+def profiled_iter(iterable, name: str, category: str):
+    """
+    Iterate and record how long each item took to produce (e.g. a lazily compiled dialogue line).
+    """
+
+    iterator = iter(iterable)
+    while True:
+        profiler = _active
+        start = perf_counter() if profiler is not None else 0
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        if profiler is not None:
+            profiler.record(name, category, start, perf_counter() - start)
+        yield item
+
+
+def profiled(name: str, category: str, function):
+    """
+    Wrap a function so its calls are recorded while profiling is enabled.
+    """
+
+    def wrapper(*args, **kwargs):
+        profiler = _active
+        if profiler is None:
+            return function(*args, **kwargs)
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        profiler.record(name, category, start, perf_counter() - start)
+        return result
+    return wrapper
+
+
+def _export(profiler: Profiler, trace_path: Path):
+    profiler.export_chrome_trace(trace_path)
+    trace_path.with_suffix(".txt").write_text(profiler.format_summary() + "\n")
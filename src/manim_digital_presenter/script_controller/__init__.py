@@ -1,12 +1,22 @@
-from .beeper import *
-from .loader import *
-from .timeline import *
-from .tbox import *
-from .sequencer import *
+from .._lazy import lazy_exports
 
-__all__ = []
-__all__ += beeper.__all__
-__all__ += loader.__all__
-__all__ += timeline.__all__
-__all__ += tbox.__all__
-__all__ += sequencer.__all__
\ No newline at end of file
+# The submodules are imported when one of their names is first used: reading scripts and timing them
+# (loader, layout, schedule, dry_run, sequencer) works without importing manim.
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "beeper": ["Fwc", "Speak"],
+    "voice": ["Voice", "VoiceLine", "default_voice", "spoken_text", "reveal_times"],
+    "typewriter": ["Typewriter"],
+    "text_slot": ["TextSlot", "WriteInSlot"],
+    "audio": ["SOUNDS_DIR", "DEFAULT_BEEP", "resolve_sound", "load_sound", "AudioTrack"],
+    "tex_cache": ["TexCache", "default_tex_cache", "tex_key", "tex_to_arrays", "arrays_to_tex"],
+    "loader": ["ScriptRow", "iter_script_rows", "load_csv_dialogue"],
+    "dialogue": ["create_dialogue_tex", "iter_dialogue_tex"],
+    "layout": ["GlyphMetrics", "wrap_dialogue", "paginate_dialogue"],
+    "schedule": ["Cue", "TimelineBuilder", "PlannedAnimation", "script_timeline"],
+    "dry_run": ["TimingEntry", "TimingReport", "timing_report"],
+    "timeline": ["play_timeline", "TimelineEngine"],
+    "compiled": ["CompiledScript", "compile_script", "load_compiled_script"],
+    "tbox": ["Text_Box", "BlinkIndicator"],
+    "sequencer": ["script_sequencer"],
+    "render": ["RenderResult", "render_scripts"],
+})
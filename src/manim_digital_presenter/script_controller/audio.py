@@ -0,0 +1,302 @@
+from collections.abc import Iterator
+from functools import lru_cache
+from os import path
+import wave
+
+import numpy as np
+
+__all__ = ["SOUNDS_DIR", "DEFAULT_BEEP", "resolve_sound", "load_sound", "AudioTrack"]
+
+SOUNDS_DIR = path.join(path.dirname(__file__), "sounds")
+DEFAULT_BEEP = path.join(SOUNDS_DIR, "beep.wav")
+
+
+def resolve_sound(sound: str) -> str:
+    """
+    Find a sound file: as given (absolute, or relative to the working directory), or else in the ``sounds`` folder of the package. The old default ``"sounds/beep.wav"`` then works from any working directory.
+
+    :param sound: Path or name of the sound file.
+    :type sound: str
+
+    :return: The absolute path of the file.
+    :rtype: str
+
+    :raises FileNotFoundError: If the file is in neither place.
+
+    """
+
+    if path.isfile(sound):
+        return path.abspath(sound)
+    packaged = path.join(SOUNDS_DIR, path.basename(sound))
+    if path.isfile(packaged):
+        return packaged
+    raise FileNotFoundError(f"Sound file not found: {sound} (also looked in {SOUNDS_DIR})")
+
+
+def load_sound(sound: str) -> tuple[np.ndarray, int]:
+    """
+    Decode a sound file once per process (until it changes on the disk).
+
+    :param sound: Path or name of the sound file, see :func:`resolve_sound`.
+    :type sound: str
+
+    :return: The samples, as a float32 array of shape (frames, channels) in [-1, 1], and the sample rate.
+    :rtype: tuple[np.ndarray, int]
+
+    """
+
+    full_path = resolve_sound(sound)
+    return _decode(full_path, path.getmtime(full_path))
+
+
+@lru_cache(maxsize=64)
+def _decode(full_path: str, mtime: float) -> tuple[np.ndarray, int]:
+    if full_path.lower().endswith(".wav"):
+        try:
+            with wave.open(full_path) as stream:
+                width, channels, rate = stream.getsampwidth(), stream.getnchannels(), stream.getframerate()
+                data = stream.readframes(stream.getnframes())
+        except wave.Error:
+            width = None  # Compressed wav: let pydub decode it.
+        if width in (1, 2, 4):
+            samples = np.frombuffer(data, dtype={1: np.uint8, 2: np.int16, 4: np.int32}[width]).astype(np.float32)
+            if width == 1:
+                samples -= 128
+            samples = samples.reshape(-1, channels) / float(2 ** (8 * width - 1))
+            samples.setflags(write=False)
+            return samples, rate
+
+    from pydub import AudioSegment  # Other formats (mp3, ogg...) go through pydub, as in manim.
+    segment = AudioSegment.from_file(full_path)
+    samples = np.array(segment.get_array_of_samples(), dtype=np.float32).reshape(-1, segment.channels)
+    samples /= float(2 ** (8 * segment.sample_width - 1))
+    samples.setflags(write=False)
+    return samples, segment.frame_rate
+
+
+class AudioTrack:
+    """
+    Collects timed sounds (the beeps of :class:`Fwc`, or any other cue) and mixes them at the end, in chunks of about a minute that skip long silences (see :meth:`chunks`). Each sound file is decoded once, and every event is one NumPy addition, so hundreds of beeps cost almost nothing, instead of one file load and one overlay each.
+
+    :ivar events: The (time, sound, gain) of every event, in the order they were added.
+    :vartype events: list[tuple[float, str | VoiceLine, float]]
+
+    Example usage:
+
+    .. code-block:: python
+
+        track = AudioTrack()
+        for t in range(0, 300, 3):
+            track.add(t)  # The default beep.
+        samples, rate = track.mix()
+        track.export("media/beeps.wav")
+
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def add(self, time: float, sound: str = DEFAULT_BEEP, gain: float = 0):
+        """
+        Schedule a sound.
+
+        :param time: When the sound starts, in seconds.
+        :type time: float
+
+        :param sound: Path or name of the sound file (see :func:`resolve_sound`), or samples already in memory, like a :class:`VoiceLine`. Defaults to the beep of the package.
+        :type sound: str | VoiceLine, optional
+
+        :param gain: Gain in dB, as in :meth:`Scene.add_sound`. Defaults to 0.
+        :type gain: float, optional
+
+        """
+
+        self.events.append((float(time), sound, float(gain)))
+
+    def start(self) -> float:
+        """
+        Time of the first event, or 0 if there is none.
+        """
+
+        return min((time for time, _, _ in self.events), default=0)
+
+    def mix(self, start: float = None) -> tuple[np.ndarray, int]:
+        """
+        Mix every event into one buffer, at the sample rate of the first sound (the others are resampled) and with as many channels as the widest sound.
+
+        The buffer covers everything from ``start`` to the end of the last sound, silence included, so its size grows with the length of the timeline. For long timelines use :meth:`chunks`, which only keeps one chunk in memory at a time.
+
+        :param start: Time of the first sample of the buffer. Defaults to None (the time of the first event).
+        :type start: float, optional
+
+        :return: The samples, as a float32 array of shape (frames, channels), and the sample rate.
+        :rtype: tuple[np.ndarray, int]
+
+        """
+
+        if start is None:
+            start = self.start()
+        if not self.events:
+            return np.zeros((0, 1), dtype=np.float32), 48000
+
+        sounds, rate, channels = self._conformed()
+        return _mix_events(self.events, start, sounds, rate, channels), rate
+
+    def chunks(self, length: float = 60) -> Iterator[tuple[float, np.ndarray, int]]:
+        """
+        Mix the events in chunks of about ``length`` seconds. A chunk starts with an event and only ends in silence, so no sound is cut, and stretches of silence longer than ``length`` get no chunk at all. Only one chunk is in memory at a time, whatever the length of the timeline.
+
+        :param length: Length of the chunks, in seconds. Chunks are longer when a sound is still playing at their end. Defaults to 60.
+        :type length: float, optional
+
+        :return: An iterator over the (start time, samples, sample rate) of the chunks, in time order. The samples are as in :meth:`mix`.
+        :rtype: Iterator[tuple[float, np.ndarray, int]]
+
+        """
+
+        if not self.events:
+            return
+        sounds, rate, channels = self._conformed()
+        events = sorted(self.events, key=lambda event: event[0])
+
+        chunk, chunk_start, chunk_end = [], events[0][0], events[0][0]
+        for event in events:
+            time, sound, _ = event
+            if chunk and time >= chunk_end and time - chunk_start >= length:  # Silence, and the chunk is long enough.
+                yield chunk_start, _mix_events(chunk, chunk_start, sounds, rate, channels), rate
+                chunk, chunk_start = [], time
+            chunk.append(event)
+            chunk_end = max(chunk_end, time + len(sounds[sound]) / rate)
+        yield chunk_start, _mix_events(chunk, chunk_start, sounds, rate, channels), rate
+
+    def to_audio_segment(self, start: float = None):
+        """
+        Return the mix as a pydub ``AudioSegment`` (16-bit), ready for :meth:`SceneFileWriter.add_audio_segment`. Like :meth:`mix`, it covers the whole timeline, see :meth:`chunks` for long ones.
+
+        :param start: Time of the first sample, see :meth:`mix`.
+        :type start: float, optional
+
+        """
+
+        buffer, rate = self.mix(start)
+        return _to_audio_segment(buffer, rate)
+
+    def add_to_scene(self, scene, length: float = 60):
+        """
+        Add the mix to the soundtrack of a scene, one chunk at a time (see :meth:`chunks`), at the time of the sounds in the movie.
+
+        :param scene: The scene.
+        :type scene: Scene
+
+        :param length: Length of the chunks, in seconds. Defaults to 60.
+        :type length: float, optional
+
+        """
+
+        for time, buffer, rate in self.chunks(length):
+            scene.renderer.file_writer.add_audio_segment(_to_audio_segment(buffer, rate), time=time)
+
+    def export(self, file_name: str, start: float = 0, length: float = 60) -> str:
+        """
+        Write the mix to a 16-bit wav file, one chunk at a time (see :meth:`chunks`).
+
+        :param file_name: Where to write the file.
+        :type file_name: str
+
+        :param start: Time of the first sample. Sounds before it are cut. Defaults to 0 (the start of the scene).
+        :type start: float, optional
+
+        :param length: Length of the chunks, in seconds. Defaults to 60.
+        :type length: float, optional
+
+        :return: The path of the file.
+        :rtype: str
+
+        """
+
+        channels, rate = 1, 48000
+        if self.events:
+            _, rate, channels = self._conformed()
+        with wave.open(file_name, "wb") as stream:
+            stream.setnchannels(channels)
+            stream.setsampwidth(2)
+            stream.setframerate(rate)
+            written = 0  # Frames written so far.
+            for time, buffer, _ in self.chunks(length):
+                offset = round((time - start) * rate)
+                if offset < written:  # Overlaps the end of the previous chunk, or starts before the file.
+                    buffer, offset = buffer[written - offset:], written
+                silence = offset - written
+                while silence > 0:  # In blocks, so long silences do not need a big buffer either.
+                    block = min(silence, rate * 10)
+                    stream.writeframes(bytes(2 * channels * block))
+                    silence -= block
+                stream.writeframes(_to_int16(buffer).tobytes())
+                written = offset + len(buffer)
+        return file_name
+
+    def _conformed(self) -> tuple[dict, int, int]:
+        """
+        Every sound of the events, decoded and brought to the rate and channels of the mix, with that rate and channels.
+        """
+
+        sounds = {sound: _load(sound) for sound in dict.fromkeys(sound for _, sound, _ in self.events)}
+        rate = _load(self.events[0][1])[1]
+        channels = max(samples.shape[1] for samples, _ in sounds.values())
+        sounds = {sound: _conform(samples, sound_rate, rate, channels)
+                  for sound, (samples, sound_rate) in sounds.items()}
+        return sounds, rate, channels
+
+    def clear(self):
+        self.events.clear()
+
+
+def _mix_events(events: list, start: float, sounds: dict, rate: int, channels: int) -> np.ndarray:
+    """
+    Add up events into a buffer starting at ``start``, with sounds already conformed by :meth:`AudioTrack._conformed`.
+    """
+
+    offsets = [round((time - start) * rate) for time, _, _ in events]
+    length = max(0, *(offset + len(sounds[sound]) for offset, (_, sound, _) in zip(offsets, events)))
+    buffer = np.zeros((length, channels), dtype=np.float32)
+    for offset, (_, sound, gain) in zip(offsets, events):
+        samples = sounds[sound]
+        if offset < 0:  # Starts before the buffer: keep the end only.
+            samples, offset = samples[-offset:], 0
+        buffer[offset:offset + len(samples)] += samples if gain == 0 else samples * 10 ** (gain / 20)
+    return buffer
+
+
+def _to_audio_segment(buffer: np.ndarray, rate: int):
+    from pydub import AudioSegment
+    return AudioSegment(data=_to_int16(buffer).tobytes(), sample_width=2, frame_rate=rate, channels=buffer.shape[1])
+
+
+def _load(sound) -> tuple[np.ndarray, int]:
+    """
+    Samples and rate of a sound file, or of an object carrying them (``samples`` and ``rate``).
+    """
+
+    if isinstance(sound, str):
+        return load_sound(sound)
+    return sound.samples, sound.rate
+
+
+def _conform(samples: np.ndarray, rate: int, target_rate: int, channels: int) -> np.ndarray:
+    """
+    Resample (linearly) and widen a sound to the rate and channels of the mix.
+    """
+
+    if rate != target_rate:
+        times = np.arange(round(len(samples) * target_rate / rate)) * (rate / target_rate)
+        samples = np.stack([np.interp(times, np.arange(len(samples)), channel) for channel in samples.T], axis=1)
+    if samples.shape[1] != channels:
+        samples = np.repeat(samples[:, :1], channels, axis=1)
+    return samples.astype(np.float32, copy=False)
+
+
+def _to_int16(buffer: np.ndarray) -> np.ndarray:
+    return (np.clip(buffer, -1, 1) * 32767).astype(np.int16)
@@ -1,16 +1,56 @@
 from ..my_imports import *
+from .audio import DEFAULT_BEEP
+from .voice import Voice, default_voice
 
-__all__ = ["Fwc"]
+__all__ = ["Fwc", "Speak"]
 
 class Fwc(FadeOut):
     """
     New class based on FadeOut. It now adds a beep sound when fading text. The idea is to simulate the sound when you press next in majority of RPG/ graphic adventure video games.
 
+    The beeps are mixed by :func:`play_timeline` into one audio track at the end of the timeline (see :class:`AudioTrack`).
+
+    :param mobjects: The mobjects to fade out.
+    :type mobjects: Mobject
+
+    :param sound_to_play: Path or name of the sound, see :func:`resolve_sound`. Defaults to the beep of the package.
+    :type sound_to_play: str, optional
+
+    :param sound_gain: Gain of the sound in dB. Defaults to 0.
+    :type sound_gain: float, optional
+
     """
 
     def __init__(self,
-                 sound_to_play: str = "sounds/beep.wav", 
+                 *mobjects: Mobject,
+                 sound_to_play: str = DEFAULT_BEEP,
+                 sound_gain: float = 0,
                  **kwargs):
-        super().__init__(**kwargs)
+        super().__init__(*mobjects, **kwargs)
         self.sound_to_play = sound_to_play
+        self.sound_gain = sound_gain
+
+
+class Speak(Create):
+    """
+    :class:`Create` with a voice: the line is written while a blip plays for its characters, as their glyphs start to be drawn (see :class:`Voice`). Like the beep of :class:`Fwc`, the voice is mixed by :func:`play_timeline`.
 
+    :param mobject: The dialogue line, usually from :func:`create_dialogue_tex`.
+    :type mobject: VMobject
+
+    :param voice: The voice. Defaults to None (:func:`default_voice`).
+    :type voice: Voice, optional
+
+    :param sound_gain: Gain of the voice in dB. Defaults to 0.
+    :type sound_gain: float, optional
+
+    """
+
+    def __init__(self,
+                 mobject: VMobject,
+                 voice: Voice = None,
+                 sound_gain: float = 0,
+                 **kwargs):
+        super().__init__(mobject, **kwargs)
+        self.sound_to_play = (voice or default_voice()).line(mobject, self.run_time)
+        self.sound_gain = sound_gain
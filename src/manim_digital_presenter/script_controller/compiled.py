@@ -0,0 +1,326 @@
+from ..my_imports import *
+from dataclasses import replace
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from .loader import ScriptRow, iter_script_rows
+from .dialogue import _compile_dialogue_arrays
+from .tex_cache import *
+from .schedule import script_timeline
+
+__all__ = ["CompiledScript", "compile_script", "load_compiled_script"]
+
+_MAGIC = b"DPSCRIPT"
+_VERSION = 1
+_ALIGNMENT = 64  # Every array starts on a 64 byte boundary, so it can be memory-mapped as it is.
+_PREFIX = struct.Struct("<8sIQ")  # magic, version, length of the JSON header
+
+# Arrays with one entry per glyph (leaf) of the dialogue, concatenated over all the rows, with their empty shape.
+_LEAF_ARRAYS = {"fill_rgba": (0, 4), "stroke_rgba": (0, 4), "stroke_width": (0,)}
+
+
+class CompiledScript:
+    """
+    A script compiled by :func:`compile_script`, loaded with :func:`load_compiled_script`. The glyph
+    geometry of every dialogue line is memory-mapped from the ``.dpscript`` file, so loading is
+    instant and lines are only read from the disk when their mobjects are built.
+
+    :ivar rows: The rows of the script, as read from the CSV file.
+    :vartype rows: list[ScriptRow]
+
+    :ivar starts: Resolved start time of every row, in seconds.
+    :vartype starts: np.ndarray
+
+    :ivar durations: Resolved duration of every row, in seconds.
+    :vartype durations: np.ndarray
+
+    Example usage:
+
+    .. code-block:: python
+
+        script = load_compiled_script(compile_script("dialogue/example_script.csv"))
+        steps = script_sequencer(script.iter_dialogue_tex(position=text_box.get_center()),
+                                 text_box.get_triangle())
+        play_timeline(self, script.timeline(actions, steps))
+
+    """
+
+    def __init__(self, path: str | Path, header: dict, arrays: dict[str, np.ndarray]):
+        self.path = Path(path)
+        self.header = header
+        self.arrays = arrays
+        self.rows = [ScriptRow(**row) for row in header["rows"]]
+        self.hashes = header["hashes"]
+        self.starts = arrays["starts"]
+        self.durations = arrays["durations"]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def row_arrays(self, index: int) -> dict[str, np.ndarray]:
+        """
+        Return the glyph arrays of one row, in the format of :func:`tex_to_arrays`. They are views
+        on the memory-mapped file.
+
+        :param index: Position of the row in the script.
+        :type index: int
+
+        :rtype: dict[str, np.ndarray]
+
+        """
+
+        arrays = self.arrays
+        first_leaf, last_leaf = arrays["row_leaf_offsets"][index:index + 2]
+        first_group, last_group = arrays["row_group_offsets"][index:index + 2]
+        leaf_offsets = arrays["leaf_offsets"][first_leaf:last_leaf + 1]
+
+        row = {name: arrays[name][first_leaf:last_leaf] for name in _LEAF_ARRAYS}
+        row["points"] = arrays["points"][leaf_offsets[0]:leaf_offsets[-1]]
+        row["leaf_offsets"] = leaf_offsets - leaf_offsets[0]
+        row["group_sizes"] = arrays["group_sizes"][first_group:last_group]
+        return row
+
+    def dialogue_tex(self, index: int, position=None) -> VGroup:
+        """
+        Build the mobject of the dialogue of one row, without LaTeX.
+
+        :param index: Position of the row in the script.
+        :type index: int
+
+        :param position: Position to place the text. If None, no positioning is applied.
+        :type position: np.ndarray, optional
+
+        :rtype: VGroup
+
+        """
+
+        tex = arrays_to_tex(self.row_arrays(index), tex_string=self.rows[index].dialogue)
+        if position is not None:
+            tex.move_to(position)
+        return tex
+
+    def iter_dialogue_tex(self, position=None) -> Iterator[VGroup]:
+        """
+        Lazily yield the dialogue mobject of every row, ready to feed :func:`script_sequencer`.
+
+        :param position: Position to place the texts. If None, no positioning is applied.
+        :type position: np.ndarray, optional
+
+        :rtype: Iterator[VGroup]
+
+        """
+
+        for index in range(len(self)):
+            yield self.dialogue_tex(index, position)
+
+    def resolved_rows(self) -> list[ScriptRow]:
+        """
+        Return the rows with the start and duration resolved at compilation time.
+
+        :rtype: list[ScriptRow]
+
+        """
+
+        return [replace(row, start=float(start), duration=float(duration))
+                for row, start, duration in zip(self.rows, self.starts, self.durations)]
+
+    def timeline(self, actions: dict[str, Callable] = None, steps: Iterator = None) -> dict[float, list]:
+        """
+        Build the timeline of the script for :func:`play_timeline`, with the times resolved at
+        compilation (see :func:`script_timeline`).
+
+        :rtype: dict[float, list]
+
+        """
+
+        return script_timeline(self.resolved_rows(), actions, steps)
+
+
+def compile_script(csv_path: str | Path,
+                   output: str | Path = None,
+                   tex_template: TexTemplate = TexFontTemplates.comic_sans,
+                   tex_color: ParsableManimColor = WHITE,
+                   font_size: float = 35,
+                   start: float = 0,
+                   duration: float = 3,
+                   delimiter: str = '/',
+                   cache: TexCache | bool = True,
+                   workers: int = 1) -> Path:
+    """
+    Compile a CSV script into a ``.dpscript`` file: the parsed rows, the resolved timeline and the
+    glyph geometry of every dialogue line as NumPy arrays, in one binary file. Rendering a scene from
+    it (see :func:`load_compiled_script`) skips CSV parsing and LaTeX completely.
+
+    If the output file already exists, only the rows whose dialogue (or LaTeX settings) changed are
+    compiled again. If nothing changed, the file is left untouched.
+
+    :param csv_path: Path to the CSV script.
+    :type csv_path: str | Path
+
+    :param output: Path of the compiled script. Defaults to the CSV path with the ``.dpscript`` suffix.
+    :type output: str | Path, optional
+
+    :param start: Time of the first row without start column. Defaults to 0.
+    :type start: float, optional
+
+    :param duration: Duration of the rows without duration column. Defaults to 3.
+    :type duration: float, optional
+
+    The rest of the parameters are the same as in :func:`create_dialogue_tex` and :func:`iter_script_rows`.
+
+    :return: The path of the compiled script.
+    :rtype: Path
+
+    Example usage:
+
+    .. code-block:: python
+
+        compiled = compile_script("dialogue/example_script.csv", workers=None)
+        script = load_compiled_script(compiled)
+
+    """
+
+    csv_path = Path(csv_path)
+    output = Path(output) if output is not None else csv_path.with_suffix(".dpscript")
+    source_hash = hashlib.sha256(csv_path.read_bytes()).hexdigest()
+    settings = {"start": start, "duration": duration, "delimiter": delimiter,
+                "tex": tex_key("", tex_template, font_size, tex_color)}
+
+    previous = None
+    if output.exists():
+        try:
+            previous = load_compiled_script(output)
+        except ValueError:
+            previous = None
+    if previous is not None and previous.header["source_hash"] == source_hash \
+            and previous.header["settings"] == settings:
+        return output
+
+    rows = list(iter_script_rows(csv_path, delimiter=delimiter))
+    hashes = [tex_key(row.dialogue, tex_template, font_size, tex_color) for row in rows]
+
+    # Reuse the geometry of the rows that did not change, compile the rest.
+    reusable = {}
+    if previous is not None:
+        for index, key in enumerate(previous.hashes):
+            reusable.setdefault(key, index)
+    compiled = {}
+    for row, key in zip(rows, hashes):
+        if key in reusable and key not in compiled:
+            compiled[key] = {name: np.array(array) for name, array in previous.row_arrays(reusable[key]).items()}
+    pending = [(row, key) for row, key in zip(rows, hashes) if key not in compiled]
+    if cache is True:
+        cache = default_tex_cache()
+    fresh = _compile_dialogue_arrays([row.dialogue for row, _ in pending], [row.line_number for row, _ in pending],
+                                     tex_template, tex_color, font_size, cache, workers or os.cpu_count())
+    for row, key in pending:
+        compiled[key] = fresh[row.dialogue]
+    del previous  # Release the memory map before replacing the file.
+
+    starts, durations = [], []
+    t = start
+    for row in rows:
+        if row.start is not None:
+            t = row.start
+        starts.append(t)
+        durations.append(row.duration if row.duration is not None else duration)
+        t += durations[-1]
+
+    arrays = _concatenate_rows([compiled[key] for key in hashes])
+    arrays["starts"] = np.array(starts, dtype=float)
+    arrays["durations"] = np.array(durations, dtype=float)
+    header = {"source": str(csv_path),
+              "source_hash": source_hash,
+              "settings": settings,
+              "rows": [vars(row) for row in rows],
+              "hashes": hashes}
+    _write_dpscript(output, header, arrays)
+    return output
+
+
+def load_compiled_script(path: str | Path) -> CompiledScript:
+    """
+    Load a script compiled with :func:`compile_script`. The arrays are memory-mapped, not read.
+
+    :param path: Path of the ``.dpscript`` file.
+    :type path: str | Path
+
+    :rtype: CompiledScript
+
+    :raises ValueError: If the file is not a compiled script, or was written by another version.
+
+    """
+
+    with open(path, "rb") as stream:
+        magic, version, header_size = _PREFIX.unpack(stream.read(_PREFIX.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a compiled script")
+        if version != _VERSION:
+            raise ValueError(f"{path} was compiled with format {version}, expected {_VERSION}")
+        header = json.loads(stream.read(header_size))
+
+    arrays = {}
+    for name, spec in header.pop("arrays").items():
+        shape = tuple(spec["shape"])
+        if 0 in shape:
+            arrays[name] = np.empty(shape, dtype=spec["dtype"])
+        else:
+            arrays[name] = np.memmap(path, dtype=spec["dtype"], mode="r", offset=spec["offset"], shape=shape)
+    return CompiledScript(path, header, arrays)
+
+
+def _concatenate_rows(rows: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """
+    Concatenate the arrays of :func:`tex_to_arrays` of all the rows, with offset tables to find
+    each row back.
+    """
+
+    points = [row["points"] for row in rows]
+    point_offsets = np.cumsum([0] + [len(row_points) for row_points in points])
+    leaf_offsets = [row["leaf_offsets"][:-1] + offset for row, offset in zip(rows, point_offsets)]
+
+    arrays = {
+        "points": np.concatenate(points) if points else np.zeros((0, 3)),
+        "leaf_offsets": np.concatenate(leaf_offsets + [point_offsets[-1:]]).astype(np.int64),
+        "group_sizes": np.concatenate([row["group_sizes"] for row in rows] or [[]]).astype(np.int64),
+        "row_leaf_offsets": np.cumsum([0] + [len(row["leaf_offsets"]) - 1 for row in rows]).astype(np.int64),
+        "row_group_offsets": np.cumsum([0] + [len(row["group_sizes"]) for row in rows]).astype(np.int64),
+    }
+    for name, empty_shape in _LEAF_ARRAYS.items():
+        arrays[name] = np.concatenate([row[name] for row in rows]) if rows else np.zeros(empty_shape)
+    return arrays
+
+
+def _write_dpscript(path: Path, header: dict, arrays: dict[str, np.ndarray]):
+    """
+    Write the header and the arrays, each of them aligned, to a temporary file that then replaces ``path``.
+    """
+
+    def aligned(position):
+        return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    # The offsets depend on the size of the header, which depends on the offsets. Grow it until they agree.
+    header_size = 0
+    while True:
+        offset = aligned(_PREFIX.size + header_size)
+        table = {}
+        for name, array in arrays.items():
+            table[name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            offset = aligned(offset + array.nbytes)
+        encoded = json.dumps({**header, "arrays": table}).encode()
+        if len(encoded) <= header_size:
+            break
+        header_size = aligned(len(encoded))
+    encoded = encoded.ljust(header_size)
+
+    handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(handle, "wb") as stream:
+        stream.write(_PREFIX.pack(_MAGIC, _VERSION, header_size))
+        stream.write(encoded)
+        for name, array in arrays.items():
+            stream.seek(table[name]["offset"])
+            stream.write(array.tobytes())
+    os.replace(temporary, path)
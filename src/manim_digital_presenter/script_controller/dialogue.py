@@ -0,0 +1,235 @@
+from manim import *
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import itertools
+import os
+from .loader import ScriptRow, _numbered_lines
+from .tex_cache import *
+
+__all__ = ["create_dialogue_tex", "iter_dialogue_tex"]
+
+
+def create_dialogue_tex(
+    dialogue: list[str | ScriptRow],
+    tex_template: type = TexFontTemplates.comic_sans,
+    tex_color: str = WHITE,
+    font_size: int = 35,
+    position = None,
+    cache: TexCache | bool = False,
+    workers: int = 1,
+    row_numbers: list[int] = None) -> list[VMobject]:
+    """
+    Convert a list of dialogue strings to Tex objects.
+
+    :param dialogue: List of dialogue strings (or rows of :func:`iter_script_rows`) to convert to Tex objects
+    :type dialogue: list[str | ScriptRow]
+    
+    :param tex_template: LaTeX template to use for rendering. Defaults to TexFontTemplates.comic_sans
+    :type tex_template: type, optional
+
+    :param tex_color: Color for the text. Defaults to WHITE
+    :type tex_color: str, optional
+
+    :param font_size: Font size for the text in points. Defaults to 35
+    :type font_size: int, optional
+
+    :param position: Position to place all text objects. If None, no positioning is applied.
+    :type position: np.ndarray, optional
+
+    :param cache: Cache of compiled lines. If True, the shared :func:`default_tex_cache` is used, so lines compiled in previous runs (or other scenes) are loaded without invoking LaTeX. The lines then come back as plain :class:`VGroup` objects with the glyphs of the :class:`Tex` (one group per substring) and its ``tex_string``, but without the methods of :class:`Tex` such as ``get_part_by_tex``. If False, every line is compiled into a :class:`Tex`. Defaults to False.
+    :type cache: TexCache | bool, optional
+
+    :param workers: Number of processes compiling lines at the same time. All the unique lines missing from the cache are compiled in one batch across a process pool, and the mobjects are built from the results in the original order. If None, one process per core is used. Defaults to 1 (no pool).
+    :type workers: int, optional
+
+    :param row_numbers: CSV row of each dialogue line, used to report the line that failed to compile. Defaults to None, which takes the line number of each :class:`ScriptRow` or numbers the lines from 1.
+    :type row_numbers: list[int], optional
+
+    :return: List of Tex objects created from the dialogue strings
+    :rtype: list[VMobject]
+
+    :raises ValueError: If a line cannot be compiled. The message contains the line and its row.
+
+    Example usage:
+
+    .. code-block:: python
+
+       from manim_digital_presenter import *
+       from manim import *
+
+       dialogue = ["Hello!", "How are you?", "Nice to meet you!"]
+       tex_objects = create_dialogue_tex(
+           dialogue,
+           font_size=40,
+           tex_color=YELLOW
+       )
+
+       # Reuse the lines compiled in previous renders, and see how many skipped LaTeX
+       tex_objects = create_dialogue_tex(dialogue, cache=True)
+       print(default_tex_cache().stats())
+
+       # Compile a long script on all the cores of the machine
+       actions, dialogue = load_csv_dialogue('your_path/your_script.csv')
+       tex_objects = create_dialogue_tex(dialogue, workers=None)
+
+    """
+
+    Tex.set_default(tex_template=tex_template)
+    Tex.set_default(color=tex_color)
+
+    if cache is True:
+        cache = default_tex_cache()
+    if workers is None:
+        workers = os.cpu_count()
+    numbered = list(_numbered_lines(dialogue, row_numbers))
+    dialogue = [line for line, _ in numbered]
+    row_numbers = [row for _, row in numbered]
+
+    if cache or workers > 1:
+        tex_objects = _compile_dialogue(dialogue, row_numbers, tex_template, tex_color, font_size, cache, workers)
+    else:
+        tex_objects = []
+        for line, row in zip(dialogue, row_numbers):
+            try:
+                tex_objects.append(Tex(line, font_size=font_size))
+            except Exception as error:
+                raise ValueError(f"Could not compile dialogue line {line!r} (row {row}): {error}") from error
+
+    if position is not None:
+        for tex in tex_objects:
+            tex.move_to(position)
+
+    return tex_objects
+
+
+def iter_dialogue_tex(
+    dialogue: Iterable[str | ScriptRow],
+    tex_template: type = TexFontTemplates.comic_sans,
+    tex_color: str = WHITE,
+    font_size: int = 35,
+    position = None,
+    cache: TexCache | bool = False,
+    prefetch: int = 0,
+    row_numbers: Iterable[int] = None) -> Iterator[VMobject]:
+    """
+    Lazy version of :func:`create_dialogue_tex`. It yields the mobject of each dialogue line only when it is requested, so it can feed :func:`script_sequencer` with roughly constant memory, whatever the length of the script.
+
+    :param dialogue: The dialogue lines, or rows of :func:`iter_script_rows`. It can be a lazy iterable too.
+    :type dialogue: Iterable[str | ScriptRow]
+
+    :param prefetch: Number of upcoming lines compiled in a background thread while the current line is shown. Defaults to 0 (compile each line when requested).
+    :type prefetch: int, optional
+
+    :param row_numbers: CSV row of each dialogue line, used to report the line that failed to compile. Defaults to None, which takes the line number of each :class:`ScriptRow` or numbers the lines from 1.
+    :type row_numbers: Iterable[int], optional
+
+    The rest of the parameters are the same as in :func:`create_dialogue_tex`.
+
+    :return: An iterator over the mobjects of the lines.
+    :rtype: Iterator[VMobject]
+
+    Example usage:
+
+    .. code-block:: python
+
+       rows = iter_script_rows('your_path/your_script.csv')
+       texts = iter_dialogue_tex(rows, prefetch=2, position=text_box.get_center())
+       sequence = script_sequencer(texts, text_box.get_triangle())
+
+    """
+
+    if cache is True:
+        cache = default_tex_cache()
+
+    def materialise(line, row):
+        if cache:
+            tex = _compile_dialogue([line], [row], tex_template, tex_color, font_size, cache, 1)[0]
+        else:
+            try:
+                tex = Tex(line, tex_template=tex_template, font_size=font_size, color=tex_color)
+            except Exception as error:
+                raise ValueError(f"Could not compile dialogue line {line!r} (row {row}): {error}") from error
+        if position is not None:
+            tex.move_to(position)
+        return tex
+
+    lines = _numbered_lines(dialogue, row_numbers)
+    if prefetch <= 0:
+        for line, row in lines:
+            yield materialise(line, row)
+        return
+
+    # A single background thread keeps the cache access sequential.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        upcoming = deque(pool.submit(materialise, line, row) for line, row in itertools.islice(lines, prefetch))
+        while upcoming:
+            tex = upcoming.popleft().result()
+            following = next(lines, None)
+            if following is not None:
+                upcoming.append(pool.submit(materialise, *following))
+            yield tex
+
+
+def _compile_line(line, tex_template, tex_color, font_size) -> dict:
+    """
+    Compile one dialogue line and flatten it with :func:`tex_to_arrays`, so it can travel back from a worker process.
+    """
+
+    return tex_to_arrays(Tex(line, tex_template=tex_template, font_size=font_size, color=tex_color))
+
+
+def _compile_dialogue(dialogue, row_numbers, tex_template, tex_color, font_size, cache, workers) -> list[VGroup]:
+    """
+    Compile every unique line of the dialogue once (see :func:`_compile_dialogue_arrays`) and return the mobjects in the original order, with one independent mobject per line even when lines repeat.
+    """
+
+    compiled = _compile_dialogue_arrays(dialogue, row_numbers, tex_template, tex_color, font_size, cache, workers)
+    return [arrays_to_tex(compiled[line], tex_string=line) for line in dialogue]
+
+
+def _compile_dialogue_arrays(dialogue, row_numbers, tex_template, tex_color, font_size, cache, workers) -> dict[str, dict]:
+    """
+    Compile every unique line of the dialogue once (in parallel if ``workers > 1``), loading from and storing into the cache when there is one. Return the arrays of :func:`tex_to_arrays` of each unique line.
+    """
+
+    first_row = {}
+    for line, row in zip(dialogue, row_numbers):
+        first_row.setdefault(line, row)
+
+    compiled = {}
+    keys = {}
+    if cache:
+        for line in first_row:
+            keys[line] = cache.key(line, tex_template, font_size, tex_color)
+            arrays = cache.get(keys[line])
+            if arrays is not None:
+                compiled[line] = arrays
+    pending = [line for line in first_row if line not in compiled]
+
+    def failure(line, error):
+        return ValueError(f"Could not compile dialogue line {line!r} (row {first_row[line]}): {error}")
+
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {pool.submit(_compile_line, line, tex_template, tex_color, font_size): line
+                       for line in pending}
+            for future in as_completed(futures):
+                line = futures[future]
+                try:
+                    compiled[line] = future.result()
+                except Exception as error:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise failure(line, error) from error
+    else:
+        for line in pending:
+            try:
+                compiled[line] = _compile_line(line, tex_template, tex_color, font_size)
+            except Exception as error:
+                raise failure(line, error) from error
+
+    if cache:
+        for line in pending:
+            cache.put(keys[line], compiled[line])
+
+    return compiled
@@ -0,0 +1,177 @@
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from .schedule import PlannedAnimation, TimelineBuilder, _flatten, _animated_keys
+
+__all__ = ["TimingEntry", "TimingReport", "timing_report"]
+
+
+@dataclass(frozen=True)
+class TimingEntry:
+    """
+    One animation of a timed timeline.
+
+    :ivar start: Start time, in seconds.
+    :ivar end: End time, in seconds.
+    :ivar name: Type of the animation (or name of a :class:`PlannedAnimation`).
+    :ivar label: The dialogue line (or LaTeX string) it shows, if any.
+    :ivar overlap: Seconds during which it animates a mobject that an entry starting at another time is still animating.
+    :ivar creature_method: The creature method that created it, if any.
+    :ivar timed: Whether its run time is known (see :class:`PlannedAnimation`). Untimed entries count as 0 seconds, so the end, overlaps and total may be short.
+
+    """
+
+    start: float
+    end: float
+    name: str
+    label: str | None = None
+    overlap: float = 0
+    creature_method: str | None = None
+    timed: bool = True
+
+
+class TimingReport:
+    """
+    Timing of every animation of a timeline, computed by :func:`timing_report` (or ``play_timeline(..., dry_run=True)``) without rendering anything.
+
+    :ivar entries: The entries, sorted by start time.
+    :vartype entries: list[TimingEntry]
+
+    :ivar total: Length of the whole timeline, in seconds.
+    :vartype total: float
+
+    """
+
+    def __init__(self, entries: list[TimingEntry]):
+        self.entries = sorted(entries, key=lambda entry: entry.start)
+        self.total = max((entry.end for entry in self.entries), default=0)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def overlapping(self) -> list[TimingEntry]:
+        """
+        Return the entries that overlap an entry starting at another time on the same mobject.
+
+        :rtype: list[TimingEntry]
+
+        """
+
+        return [entry for entry in self.entries if entry.overlap > 0]
+
+    def untimed(self) -> list[TimingEntry]:
+        """
+        Return the entries whose run time is unknown (actions that are not a :func:`creature_action`).
+
+        :rtype: list[TimingEntry]
+
+        """
+
+        return [entry for entry in self.entries if not entry.timed]
+
+    def method_counts(self) -> Counter:
+        """
+        Count how many times each creature method fires.
+
+        :rtype: Counter
+
+        """
+
+        return Counter(entry.creature_method for entry in self.entries if entry.creature_method)
+
+    def check(self):
+        """
+        Raise if the timeline has overlapping entries. Meant for pre-commit checks of scripts.
+
+        :raises ValueError: If some entries overlap.
+
+        """
+
+        overlapping = self.overlapping()
+        if overlapping:
+            lines = "\n".join(f"  {entry.start:8.2f}s {entry.name} {entry.label or ''} overlaps {entry.overlap:.2f}s"
+                              for entry in overlapping)
+            raise ValueError(f"{len(overlapping)} overlapping entries:\n{lines}")
+
+    def format(self) -> str:
+        """
+        Return the report as a text table.
+
+        :rtype: str
+
+        """
+
+        lines = [f"{'start':>8} {'end':>8} {'overlap':>8}  {'animation':<14} {'method':<12} label"]
+        for entry in self.entries:
+            label = (entry.label or "")[:40]
+            end = f"{entry.end:8.2f}" if entry.timed else f"{'untimed':>8}"
+            lines.append(f"{entry.start:8.2f} {end} {entry.overlap:8.2f}  {entry.name:<14} "
+                         f"{entry.creature_method or '':<12} {label}")
+        lines.append(f"total: {self.total:.2f}s, {len(self.entries)} animations, "
+                     f"{len(self.overlapping())} overlapping, {len(self.untimed())} untimed")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def timing_report(timeline: dict[float, object] | TimelineBuilder) -> TimingReport:
+    """
+    Time a timeline without playing it: the start, end and overlap of every animation, the total length and the creature methods that fire. Timelines of :class:`PlannedAnimation` (from a dry run of :func:`script_sequencer` and :func:`script_timeline`) need neither mobjects nor LaTeX.
+
+    :param timeline: A timeline for :func:`play_timeline`.
+    :type timeline: dict[float, object] | TimelineBuilder
+
+    :rtype: TimingReport
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        rows = list(iter_script_rows("dialogue/example_script.csv"))
+        steps = script_sequencer([row.dialogue for row in rows], None, dry_run=True)
+        timeline = script_timeline(rows, {"surprise": Creature.surprise}, steps, dry_run=True)
+        report = timing_report(timeline)
+        print(report)
+        report.check()
+
+    """
+
+    if isinstance(timeline, TimelineBuilder):
+        timeline = timeline.build(validate=False)
+
+    spans = []  # (start, end, cue, animation)
+    for cue, (t, anims) in enumerate(sorted(timeline.items(), key=lambda item: item[0])):
+        anims = anims if isinstance(anims, Iterable) else [anims]
+        for anim in _flatten(anims):
+            spans.append((float(t), float(t) + float(anim.get_run_time()), cue, anim))
+
+    # Overlap of every span with the spans of other cues on the same mobjects: sweep them by start,
+    # remembering the latest end of the two latest-ending cues.
+    by_target = {}
+    for index, (start, end, cue, anim) in enumerate(spans):
+        for key in _animated_keys(anim):
+            by_target.setdefault(key, []).append(index)
+    overlaps = [0.0]*len(spans)
+    for indices in by_target.values():
+        indices.sort(key=lambda index: spans[index][0])
+        latest = []  # Up to two (end, cue), from different cues.
+        for index in indices:
+            start, end, cue, _ = spans[index]
+            other_end = max((latest_end for latest_end, latest_cue in latest if latest_cue != cue), default=start)
+            overlaps[index] = max(overlaps[index], min(end, other_end) - start)
+            ends = {latest_cue: latest_end for latest_end, latest_cue in latest}
+            ends[cue] = max(end, ends.get(cue, end))
+            latest = sorted(((latest_end, latest_cue) for latest_cue, latest_end in ends.items()), reverse=True)[:2]
+
+    entries = []
+    for (start, end, cue, anim), overlap in zip(spans, overlaps):
+        mobject = getattr(anim, "mobject", None)
+        label = getattr(anim, "label", None) or getattr(mobject, "tex_string", None)
+        entries.append(TimingEntry(start, end,
+                                   anim.name if isinstance(anim, PlannedAnimation) else type(anim).__name__,
+                                   label,
+                                   max(overlap, 0),
+                                   getattr(anim, "creature_method", None),
+                                   getattr(anim, "timed", True)))
+    return TimingReport(entries)
@@ -0,0 +1,310 @@
+from collections.abc import Iterable
+from dataclasses import replace
+import math
+import re
+import string
+from .loader import ScriptRow
+
+__all__ = ["GlyphMetrics", "wrap_dialogue", "paginate_dialogue"]
+
+# Advance widths (in em) of Computer Modern Roman, the default LaTeX font.
+_COMPUTER_MODERN = {
+    **dict(zip("abcdefghijklmnopqrstuvwxyz",
+               (.5, .556, .444, .556, .444, .306, .5, .556, .278, .306, .528, .278, .833,
+                .556, .5, .556, .528, .392, .394, .389, .556, .528, .722, .528, .528, .444))),
+    **dict(zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+               (.75, .708, .722, .764, .681, .653, .785, .75, .361, .514, .778, .625, .917,
+                .75, .778, .681, .778, .736, .556, .722, .75, .75, 1.028, .75, .75, .611))),
+    **dict.fromkeys(string.digits, .5),
+    **dict(zip(".,;:!?'\"()-/", (.278, .278, .278, .278, .278, .472, .278, .5, .389, .389, .333, .5))),
+    " ": .333,
+}
+
+# Characters measured by GlyphMetrics.measure. Others get the default width.
+_MEASURED = string.ascii_letters + string.digits + ".,;:!?'()-/"
+
+# LaTeX commands, braces and math markers take no room on the line.
+_MARKUP = re.compile(r"\\[A-Za-z]+\*?|[{}$^_]")
+
+# LaTeX line break between the lines of a page.
+_NEWLINE = r" \\ "
+
+# Baseline to baseline distance of LaTeX, in em.
+_LINE_SPACING = 1.2
+
+# Comic Sans, the default font of create_dialogue_tex, is wider than Computer Modern. Without measured widths,
+# lines are measured as Computer Modern this much wider, so they wrap a little early rather than overflow.
+_COMIC_SANS_SCALE = 1.2
+
+
+class GlyphMetrics:
+    """
+    Widths of the characters of a font, to measure dialogue lines without compiling them. The width of every word is cached, so laying out a whole script costs a few dictionary lookups per word.
+
+    Widths are in em. With manim, one em of a :class:`Tex` is ``font_size / 96`` units (10 pt of LaTeX at ``font_size / 960`` units per point).
+
+    The default widths are the ones of Computer Modern, the default LaTeX font. For other templates (like the Comic Sans of :func:`create_dialogue_tex`), use :meth:`measure`. Without metrics, :func:`wrap_dialogue` and :func:`paginate_dialogue` assume that Comic Sans, with the Computer Modern widths made 20% wider: lines then wrap a little early rather than overflow the box.
+
+    :param widths: Advance width of each character, in em. Defaults to None (Computer Modern).
+    :type widths: dict[str, float], optional
+
+    :param default: Width of the characters missing from ``widths``, in em. Defaults to 0.5.
+    :type default: float, optional
+
+    :param scale: Factor applied to every width, e.g. 1.1 for a slightly wider font. Defaults to 1.
+    :type scale: float, optional
+
+    """
+
+    def __init__(self,
+                 widths: dict[str, float] = None,
+                 default: float = .5,
+                 scale: float = 1):
+        self.widths = dict(_COMPUTER_MODERN if widths is None else widths)
+        self.default = default
+        self.scale = scale
+        self._words = {}
+
+    @classmethod
+    def measure(cls, tex_template=None, cache=True) -> "GlyphMetrics":
+        """
+        Measure the advance widths of the letters, digits, punctuation and space of a LaTeX template, with one single LaTeX compilation (stored in the Tex cache, so it only happens once per template).
+
+        Every character is written between two capital I, so the distance between the left edges of the I is the advance width of the character (plus the one of I, measured on a pair of I).
+
+        :param tex_template: The template. Defaults to None (``TexFontTemplates.comic_sans``, as :func:`create_dialogue_tex`).
+        :type tex_template: TexTemplate, optional
+
+        :param cache: Cache of compiled lines, see :func:`create_dialogue_tex`. Defaults to True.
+        :type cache: TexCache | bool, optional
+
+        :rtype: GlyphMetrics
+
+        :raises ValueError: If the compiled glyphs do not match the measured characters.
+
+        """
+
+        from manim import Tex, TexFontTemplates, WHITE
+        from .tex_cache import default_tex_cache
+
+        if tex_template is None:
+            tex_template = TexFontTemplates.comic_sans
+        if cache is True:
+            cache = default_tex_cache()
+        line = "II" + "".join(f"{character}I" for character in _MEASURED) + r"\ I"
+        if cache:
+            tex = cache.get_or_create(line, tex_template, font_size=96, tex_color=WHITE)
+        else:
+            tex = Tex(line, tex_template=tex_template, font_size=96, color=WHITE)
+
+        # At font size 96, one em is one unit. The fences are the odd glyphs, and the last one.
+        glyphs = tex.family_members_with_points()
+        if len(glyphs) != 2 + 2*len(_MEASURED) + 1:
+            raise ValueError(f"Expected {2 + 2*len(_MEASURED) + 1} glyphs when measuring the font, got {len(glyphs)}")
+        lefts = [glyph.get_left()[0] for glyph in glyphs]
+        fence = lefts[1] - lefts[0]
+        fences = lefts[1::2]
+        widths = {character: after - before - fence
+                  for character, before, after in zip(_MEASURED, fences, fences[1:])}
+        widths[" "] = lefts[-1] - lefts[-2] - fence
+        return cls(widths, default=sum(widths.values()) / len(widths))
+
+    def width(self, text: str, font_size: float = 35) -> float:
+        """
+        Width of a piece of dialogue, in manim units. LaTeX commands, braces and math markers are not counted.
+
+        :param text: The text, one line.
+        :type text: str
+
+        :param font_size: Font size of the :class:`Tex`. Defaults to 35.
+        :type font_size: float, optional
+
+        :rtype: float
+
+        """
+
+        em = sum(self._word_width(word) for word in text.split(" ")) + self.widths[" "] * text.count(" ")
+        return em * self.scale * font_size / 96
+
+    def _word_width(self, word: str) -> float:
+        width = self._words.get(word)
+        if width is None:
+            width = self._words[word] = sum(self.widths.get(character, self.default)
+                                            for character in _MARKUP.sub("", word))
+        return width
+
+
+def wrap_dialogue(text: str,
+                  width: float,
+                  font_size: float = 35,
+                  metrics: GlyphMetrics = None) -> list[str]:
+    """
+    Break a dialogue line into lines no wider than ``width``, at spaces. Groups in braces and math in ``$`` are never broken, and words wider than a whole line are cut between characters (unless they contain LaTeX).
+
+    :param text: The dialogue line.
+    :type text: str
+
+    :param width: Width available, in manim units.
+    :type width: float
+
+    :param font_size: Font size of the :class:`Tex`. Defaults to 35.
+    :type font_size: float, optional
+
+    :param metrics: Widths of the font. Defaults to None (an estimate on the safe side for the Comic Sans of :func:`create_dialogue_tex`, see :class:`GlyphMetrics`).
+    :type metrics: GlyphMetrics, optional
+
+    :return: The lines.
+    :rtype: list[str]
+
+    """
+
+    metrics = metrics or _default_metrics()
+    em = metrics.scale * font_size / 96
+    limit = width / em  # Width available, in em.
+    space = metrics.widths[" "]
+
+    lines, current, used = [], [], 0.0
+    for word in _split_words(text):
+        word_width = metrics._word_width(word)
+        if word_width > limit and not _MARKUP.search(word):
+            pieces = _cut_word(word, limit, metrics)
+        else:
+            pieces = [word]
+        for piece in pieces:
+            piece_width = metrics._word_width(piece)
+            if current and used + space + piece_width > limit:
+                lines.append(" ".join(current))
+                current, used = [], 0.0
+            used += (space if current else 0) + piece_width
+            current.append(piece)
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
+def paginate_dialogue(dialogue: Iterable[str | ScriptRow],
+                      box,
+                      font_size: float = 35,
+                      metrics: GlyphMetrics = None,
+                      padding: float = 0.3) -> list[str | ScriptRow]:
+    """
+    Wrap every dialogue entry to the width of a dialogue box, and split it into pages that fit its height. Each page is one entry of the result, so it is shown as a separate "next" step by :func:`script_sequencer`. The lines of a page are separated with LaTeX line breaks.
+
+    Text is measured with cached glyph widths (see :class:`GlyphMetrics`), without compiling anything, so a whole script is laid out in milliseconds.
+
+    :param dialogue: The dialogue lines, or the rows of :func:`iter_script_rows`. The first page of a row keeps its action and start time; the next pages have no action, follow the previous one and last the duration of the row.
+    :type dialogue: Iterable[str | ScriptRow]
+
+    :param box: The :class:`Text_Box`, any mobject with a width and a height, or a (width, height) tuple in manim units.
+    :type box: Text_Box | Mobject | tuple[float, float]
+
+    :param font_size: Font size of the :class:`Tex`. Defaults to 35.
+    :type font_size: float, optional
+
+    :param metrics: Widths of the font. Defaults to None (an estimate on the safe side for the Comic Sans of :func:`create_dialogue_tex`, see :class:`GlyphMetrics`).
+    :type metrics: GlyphMetrics, optional
+
+    :param padding: Margin kept free inside the box, on every side, in manim units. Defaults to 0.3.
+    :type padding: float, optional
+
+    :return: The pages, as strings or rows like the input.
+    :rtype: list[str | ScriptRow]
+
+    Example usage:
+
+    .. code-block:: python
+
+        text_box = Text_Box()
+        metrics = GlyphMetrics.measure()  # Exact widths of Comic Sans, the default of create_dialogue_tex
+        rows = paginate_dialogue(iter_script_rows("dialogue/long_script.csv"), text_box, metrics=metrics)
+        texts = iter_dialogue_tex(rows, position=text_box.get_center())
+        play_timeline(self, script_timeline(rows, actions, script_sequencer(texts, text_box.get_triangle())))
+
+    """
+
+    metrics = metrics or _default_metrics()
+    width, height = _box_size(box)
+    line_height = _LINE_SPACING * metrics.scale * font_size / 96
+    per_page = max(1, math.floor((height - 2*padding) / line_height))
+
+    pages = []
+    for entry in dialogue:
+        text = entry.dialogue if isinstance(entry, ScriptRow) else entry
+        lines = wrap_dialogue(text, width - 2*padding, font_size, metrics) or [""]
+        for number, first in enumerate(range(0, len(lines), per_page)):
+            page = _NEWLINE.join(lines[first:first + per_page])
+            if not isinstance(entry, ScriptRow):
+                pages.append(page)
+            elif number == 0:
+                pages.append(replace(entry, dialogue=page))
+            else:
+                pages.append(replace(entry, action="", dialogue=page, start=None))
+    return pages
+
+
+_DEFAULT_METRICS = None
+
+
+def _default_metrics() -> GlyphMetrics:
+    global _DEFAULT_METRICS
+    if _DEFAULT_METRICS is None:
+        _DEFAULT_METRICS = GlyphMetrics(scale=_COMIC_SANS_SCALE)
+    return _DEFAULT_METRICS
+
+
+def _box_size(box) -> tuple[float, float]:
+    """
+    Width and height of a dialogue box: a Text_Box (its box), a mobject or a (width, height) tuple.
+    """
+
+    if isinstance(box, tuple):
+        return box
+    if hasattr(box, "get_box"):
+        box = box.get_box()
+    return box.width, box.height
+
+
+def _split_words(text: str) -> list[str]:
+    """
+    Split a line at the spaces that are outside braces and math.
+    """
+
+    if "{" not in text and "$" not in text:
+        return text.split()
+    words, current, depth, math_mode, escaped = [], [], 0, False, False
+    for character in text:
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif character == "$":
+            math_mode = not math_mode
+        elif character == "{":
+            depth += 1
+        elif character == "}":
+            depth = max(depth - 1, 0)
+        elif character == " " and depth == 0 and not math_mode:
+            if current:
+                words.append("".join(current))
+                current = []
+            continue
+        current.append(character)
+    if current:
+        words.append("".join(current))
+    return words
+
+
+def _cut_word(word: str, limit: float, metrics: GlyphMetrics) -> list[str]:
+    """
+    Cut a word wider than a line into pieces that fit.
+    """
+
+    pieces, start, used = [], 0, 0.0
+    for index, character in enumerate(word):
+        character_width = metrics.widths.get(character, metrics.default)
+        if index > start and used + character_width > limit:
+            pieces.append(word[start:index])
+            start, used = index, 0.0
+        used += character_width
+    pieces.append(word[start:])
+    return pieces
@@ -1,16 +1,52 @@
-from manim import *
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 import csv
+import itertools
+import math
+import warnings
 
-__all__ = ["load_csv_dialogue", "create_dialogue_tex"]
+__all__ = ["ScriptRow", "iter_script_rows", "load_csv_dialogue"]
 
-def load_csv_dialogue(csv_path: str, 
-                      delimiter: str = '/') -> tuple[list[str], list[str]]:
+
+@dataclass(frozen=True)
+class ScriptRow:
     """
-    Extract dialogue and actions from a CSV file.
+    One row of a CSV script, as yielded by :func:`iter_script_rows`.
 
-    This function reads a CSV file containing a script with two columns:
-    the first column contains action identifiers, and the second contains
-    dialogue text. Both are returned as separate lists.
+    :ivar action: Identifier of the action of the creature (first column).
+    :vartype action: str
+
+    :ivar dialogue: What the creature says (second column).
+    :vartype dialogue: str
+
+    :ivar start: Optional start time of the row, in seconds (third column).
+    :vartype start: float | None
+
+    :ivar duration: Optional duration of the row, in seconds (fourth column).
+    :vartype duration: float | None
+
+    :ivar line_number: Line of the CSV file where the row starts.
+    :vartype line_number: int
+
+    """
+
+    action: str
+    dialogue: str
+    start: float | None = None
+    duration: float | None = None
+    line_number: int = 0
+
+
+def iter_script_rows(csv_path: str,
+                     delimiter: str = '/',
+                     comment: str = '#',
+                     errors: str = 'raise') -> Iterator[ScriptRow]:
+    """
+    Stream the rows of a CSV script one at a time, with constant memory whatever the size of the file.
+
+    Each row has two mandatory columns, action and dialogue, and two optional ones, start time and duration (in seconds). Blank lines and lines starting with ``comment`` are skipped.
+
+    The dialogue can contain the delimiter (e.g. "and/or" or "$1/2$"): only the last fields of a row that are numbers are read as start and duration, and the rest is the dialogue. A dialogue ending with the delimiter and a number (e.g. "half is 1/2") must be quoted, ``action/"half is 1/2"``, or its last number would be read as the start.
 
     :param csv_path: Path to the CSV file containing the script
     :type csv_path: str
@@ -18,97 +54,159 @@ def load_csv_dialogue(csv_path: str,
     :param delimiter: Delimiter used in the CSV file. Defaults to '/'.
     :type delimiter: str
 
-    :return: A tuple containing (actions, dialogue)
-    :rtype: tuple[list[str], list[str]]
-    
-    :raises FileNotFoundError: If the CSV file is not found at the specified path
-    :raises ValueError: If any row has fewer than 2 columns
+    :param comment: Prefix of the comment lines. Defaults to '#'.
+    :type comment: str
+
+    :param errors: What to do with malformed rows: 'raise' a ValueError, or 'skip' them with a warning. Either way the message contains the line of the file. Defaults to 'raise'.
+    :type errors: str
+
+    :return: An iterator over the rows of the script.
+    :rtype: Iterator[ScriptRow]
 
-    .. warning::
-       Do NOT include empty lines at the end of the CSV file.
-       Trailing empty rows will cause the function to fail.
+    :raises FileNotFoundError: If the CSV file is not found at the specified path
+    :raises ValueError: If a row is malformed and errors='raise'
 
     Example usage:
 
     .. code-block:: python
 
        from manim_digital_presenter import *
-       actions, dialogue = load_csv_dialogue('your_paty/your_script.csv')
+
+       for row in iter_script_rows('your_path/your_script.csv'):
+           print(row.line_number, row.action, row.dialogue)
 
     The CSV file format should be::
 
+        # action/dialogue/start/duration
         action_1/dialogue_1
-        action_2/dialogue_2
-        action_3/dialogue_3
+        action_2/dialogue_2/4.5
+        action_3/dialogue_3/9/2
 
     """
 
-    actions = []
-    dialogue = []
+    if errors not in ('raise', 'skip'):
+        raise ValueError(f"errors must be 'raise' or 'skip', not {errors!r}")
 
     try:
-        with open(csv_path) as file_to_read:
-            script = csv.reader(file_to_read, delimiter=delimiter)
-            for row in script:
-                if len(row) < 2:
-                    raise ValueError(f"Row does not have 2 columns: {row}")
-                actions.append(row[0])
-                dialogue.append(row[1])
+        file_to_read = open(csv_path, newline='')
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file not found at path: {csv_path}")
 
-    return actions, dialogue
+    with file_to_read:
+        script = csv.reader(file_to_read, delimiter=delimiter)
+        last_line = 0
+        for fields in script:
+            line_number, last_line = last_line + 1, script.line_num
+            if not any(field.strip() for field in fields) or fields[0].lstrip().startswith(comment):
+                continue
+
+            try:
+                yield _parse_script_row(fields, line_number, delimiter)
+            except ValueError as error:
+                message = f"{csv_path}, line {line_number}: {error}"
+                if errors == 'raise':
+                    raise ValueError(message) from None
+                warnings.warn(message, stacklevel=2)
+
 
-def create_dialogue_tex(
-    dialogue: list[str],
-    tex_template: type = TexFontTemplates.comic_sans,
-    tex_color: str = WHITE,
-    font_size: int = 35,
-    position = None) -> list[VMobject]:
+def _parse_script_row(fields: list[str], line_number: int, delimiter: str = '/') -> ScriptRow:
     """
-    Convert a list of dialogue strings to Tex objects.
+    Turn the fields of one CSV row into a :class:`ScriptRow`, raising ValueError if they are malformed.
 
-    :param dialogue: List of dialogue strings to convert to Tex objects
-    :type dialogue: list[str]
-    
-    :param tex_template: LaTeX template to use for rendering. Defaults to TexFontTemplates.comic_sans
-    :type tex_template: type, optional
+    Only the last fields that are numbers (or empty) are read as start and duration. The other fields after the action are joined back with the delimiter, since a delimiter inside the dialogue (e.g. "and/or" or "$1/2$") splits it too.
+    """
+
+    if len(fields) < 2:
+        raise ValueError(f"Row must have at least 2 columns, it has {len(fields)}: {fields}")
+
+    rest = fields[1:]
+    columns = []
+    while len(rest) > 1 and len(columns) < 2 and _is_timing(rest[-1]):
+        columns.insert(0, rest.pop())
 
-    :param tex_color: Color for the text. Defaults to WHITE
-    :type tex_color: str, optional
+    timing = []
+    for name, field in zip(("start", "duration"), columns):
+        value = float(field) if field.strip() else None
+        if value is not None and value < 0:
+            raise ValueError(f"Column {name} cannot be negative: {value}")
+        timing.append(value)
+    timing += [None] * (2 - len(timing))
 
-    :param font_size: Font size for the text in points. Defaults to 35
-    :type font_size: int, optional
+    return ScriptRow(fields[0].strip(), delimiter.join(rest), *timing, line_number=line_number)
 
-    :param position: Position to place all text objects. If None, no positioning is applied.
-    :type position: np.ndarray, optional
 
-    :return: List of Tex objects created from the dialogue strings
-    :rtype: list[VMobject]
+def _is_timing(field: str) -> bool:
+    """
+    Tell whether a field can be a start or duration column: a number, or empty.
+    """
+
+    if not field.strip():
+        return True
+    try:
+        return math.isfinite(float(field))  # Not "nan" or "infinity", which are words of the dialogue.
+    except ValueError:
+        return False
+
+
+def load_csv_dialogue(csv_path: str, 
+                      delimiter: str = '/') -> tuple[list[str], list[str]]:
+    """
+    Extract dialogue and actions from a CSV file.
+
+    This function reads a CSV file containing a script with two columns:
+    the first column contains action identifiers, and the second contains
+    dialogue text. Both are returned as separate lists.
+
+    :param csv_path: Path to the CSV file containing the script
+    :type csv_path: str
+
+    :param delimiter: Delimiter used in the CSV file. Defaults to '/'.
+    :type delimiter: str
+
+    :return: A tuple containing (actions, dialogue)
+    :rtype: tuple[list[str], list[str]]
+    
+    :raises FileNotFoundError: If the CSV file is not found at the specified path
+    :raises ValueError: If any row has fewer than 2 columns (or is otherwise malformed, see :func:`iter_script_rows`)
+
+    .. note::
+       Blank lines and comment lines (starting with '#') are skipped. To stream
+       long scripts row by row, with their line numbers, use :func:`iter_script_rows`.
 
     Example usage:
 
     .. code-block:: python
 
        from manim_digital_presenter import *
-       from manim import *
+       actions, dialogue = load_csv_dialogue('your_paty/your_script.csv')
 
-       dialogue = ["Hello!", "How are you?", "Nice to meet you!"]
-       tex_objects = create_dialogue_tex(
-           dialogue,
-           font_size=40,
-           tex_color=YELLOW
-       )
+    The CSV file format should be::
+
+        action_1/dialogue_1
+        action_2/dialogue_2
+        action_3/dialogue_3
 
     """
 
-    Tex.set_default(tex_template=tex_template)
-    Tex.set_default(color=tex_color)
+    actions = []
+    dialogue = []
 
-    tex_objects = [Tex(line, font_size=font_size) for line in dialogue]
+    for row in iter_script_rows(csv_path, delimiter=delimiter):
+        actions.append(row.action)
+        dialogue.append(row.dialogue)
 
-    if position is not None:
-        for tex in tex_objects:
-            tex.move_to(position)
+    return actions, dialogue
+
+
+def _numbered_lines(dialogue: Iterable[str | ScriptRow], row_numbers: Iterable[int] = None) -> Iterator[tuple[str, int]]:
+    """
+    Lazily pair each dialogue line with its CSV row, taken from ``row_numbers``, from the :class:`ScriptRow` itself, or counting from 1.
+    """
 
-    return tex_objects
+    if row_numbers is None:
+        row_numbers = itertools.count(1)
+    for item, row in zip(dialogue, row_numbers):
+        if isinstance(item, ScriptRow):
+            yield item.dialogue, item.line_number
+        else:
+            yield item, row
@@ -0,0 +1,186 @@
+from manim import *
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+import os
+import re
+import traceback
+from .loader import iter_script_rows
+from .tex_cache import default_tex_cache
+from .dialogue import _compile_dialogue_arrays
+from ..presenter.assets import preload_default_assets
+from .. import metrics
+
+__all__ = ["RenderResult", "render_scripts"]
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """
+    Outcome of the render of one script by :func:`render_scripts`.
+
+    :ivar script: Path of the CSV script.
+    :vartype script: str
+
+    :ivar seconds: Wall time of the render, in seconds.
+    :vartype seconds: float
+
+    :ivar output: Path of the rendered movie, or None if the render failed.
+    :vartype output: str | None
+
+    :ivar error: Traceback of the failure, or None if the render succeeded.
+    :vartype error: str | None
+
+    :ivar worker: Process id of the worker that rendered the script.
+    :vartype worker: int | None
+
+    """
+
+    script: str
+    seconds: float
+    output: str | None = None
+    error: str | None = None
+    worker: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def render_scripts(paths: list[str | Path],
+                   scene: type,
+                   workers: int = None,
+                   options: dict = None,
+                   precompile: dict = None,
+                   warm_up: Callable = None) -> list[RenderResult]:
+    """
+    Render one scene per CSV script across a pool of processes, e.g. all the lessons of a course with the same creature and text box.
+
+    Each worker imports manim once, loads the SVG assets of the package and the index of the shared :func:`default_tex_cache`, and then renders one script after another. The scripts are handed out longest first, so the workers stay busy until the end. A failing script does not stop the others: its traceback is in its :class:`RenderResult`.
+
+    The scene gets the path of its script in ``self.script_path``. Each script is rendered by a subclass of ``scene`` named after the script (e.g. ``Lesson_intro`` for ``intro.csv``), so the movies and their partial movie files do not collide.
+
+    :param paths: The CSV scripts.
+    :type paths: list[str | Path]
+
+    :param scene: The scene class. It must be importable by the workers (defined at the top level of a module), and the call must be under ``if __name__ == "__main__":``.
+    :type scene: type
+
+    :param workers: Number of processes. If None, one per core. With 1, the scripts are rendered in this process. Defaults to None.
+    :type workers: int, optional
+
+    :param options: Manim configuration used for every render (see :func:`tempconfig`), e.g. ``{"pixel_height": 480, "frame_rate": 30}``. Defaults to None.
+    :type options: dict, optional
+
+    :param precompile: Settings of :func:`create_dialogue_tex` used by the scene (``tex_template``, ``tex_color``, ``font_size``). If given, every unique dialogue line of all the scripts is compiled once into the Tex cache before rendering, so lines shared between scripts are not compiled by several workers. The scene must then create its lines with ``cache=True`` to load them. Defaults to None.
+    :type precompile: dict, optional
+
+    :param warm_up: Function called once in each worker before its first render, e.g. to load custom SVGs with :func:`load_svg`. It must be importable by the workers. Defaults to None.
+    :type warm_up: Callable, optional
+
+    :return: The result of every script, in the order of ``paths``.
+    :rtype: list[RenderResult]
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        class Lesson(Scene):
+            def construct(self):
+                rows = list(iter_script_rows(self.script_path))
+                texts = iter_dialogue_tex(rows, font_size=35, cache=True)
+                ...
+
+        if __name__ == "__main__":
+            results = render_scripts(sorted(Path("course").glob("*.csv")), Lesson, precompile={"font_size": 35})
+            for result in results:
+                print(result.script, f"{result.seconds:.1f}s", result.output or result.error)
+
+    """
+
+    paths = [str(path) for path in paths]
+    options = options or {}
+    if workers is None:
+        workers = os.cpu_count()
+    workers = max(1, min(workers, len(paths)))
+
+    if precompile is not None:
+        _precompile(paths, options, precompile, workers)
+
+    start = perf_counter()
+    results = {}
+    if workers == 1:
+        _warm_up(options, warm_up)
+        for path in paths:
+            results[path] = _report(_render_script(scene, path, options))
+    else:
+        longest_first = sorted(paths, key=os.path.getsize, reverse=True)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up, initargs=(options, warm_up)) as pool:
+            futures = {pool.submit(_render_script, scene, path, options): path for path in longest_first}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception:
+                    # The worker died (e.g. BrokenProcessPool), so there is no result from inside it.
+                    result = RenderResult(path, 0, error=traceback.format_exc())
+                results[path] = _report(result)
+
+    failed = sum(not result.ok for result in results.values())
+    metrics.logger.info("Rendered %d scripts in %.1fs with %d workers, %d failed",
+                        len(paths), perf_counter() - start, workers, failed)
+    return [results[path] for path in paths]
+
+
+def _precompile(paths: list[str], options: dict, settings: dict, workers: int):
+    """
+    Compile every unique dialogue line of the scripts into the shared Tex cache, across ``workers`` processes.
+    """
+
+    settings = {"tex_template": TexFontTemplates.comic_sans, "tex_color": WHITE, "font_size": 35, **settings}
+    rows = [row for path in paths for row in iter_script_rows(path)]
+    with tempconfig(options):
+        _compile_dialogue_arrays([row.dialogue for row in rows], [row.line_number for row in rows],
+                                 settings["tex_template"], settings["tex_color"], settings["font_size"],
+                                 default_tex_cache(), workers)
+
+
+def _warm_up(options: dict, warm_up: Callable = None):
+    """
+    Initializer of the workers: fill the caches every render uses.
+    """
+
+    preload_default_assets()
+    with tempconfig(options):
+        default_tex_cache().size()  # Loads the index of the cache entries.
+    if warm_up is not None:
+        warm_up()
+
+
+def _render_script(scene: type, path: str, options: dict) -> RenderResult:
+    """
+    Render the scene of one script and time it. Runs in a worker.
+    """
+
+    start = perf_counter()
+    stem = re.sub(r"\W", "_", Path(path).stem)
+    script_scene = type(f"{scene.__name__}_{stem}", (scene,), {"script_path": path, "__module__": scene.__module__})
+    try:
+        with tempconfig(options):
+            instance = script_scene()
+            instance.render()
+            output = instance.renderer.file_writer.movie_file_path
+    except Exception:
+        return RenderResult(path, perf_counter() - start, error=traceback.format_exc(), worker=os.getpid())
+    return RenderResult(path, perf_counter() - start, str(output) if output else None, worker=os.getpid())
+
+
+def _report(result: RenderResult) -> RenderResult:
+    if result.ok:
+        metrics.count("render.succeeded")
+        metrics.logger.info("Rendered %s in %.1fs", result.script, result.seconds)
+    else:
+        metrics.count("render.failed")
+        metrics.logger.error("Could not render %s:\n%s", result.script, result.error)
+    return result
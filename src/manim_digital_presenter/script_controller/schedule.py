@@ -0,0 +1,471 @@
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+import functools
+import inspect
+from itertools import islice
+import numpy as np
+import warnings
+from .loader import ScriptRow
+
+__all__ = ["Cue", "TimelineBuilder", "PlannedAnimation", "script_timeline"]
+
+
+@dataclass
+class Cue:
+    """
+    An entry of a :class:`TimelineBuilder`: some animations played together, with their resolved start time. Cues are returned by the builder so later entries can be placed relative to them.
+
+    :ivar start: Resolved start time, in seconds.
+    :vartype start: float
+
+    :ivar duration: Run time of the longest animation of the cue.
+    :vartype duration: float
+
+    :ivar animations: The animations of the cue.
+    :vartype animations: list
+
+    """
+
+    index: int
+    start: float
+    duration: float
+    animations: list = field(default_factory=list, repr=False)
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+class TimelineBuilder:
+    """
+    Builds a timeline for :func:`play_timeline` with relative times instead of a dictionary of absolute start times. Each entry is placed at a time (:meth:`at`), after an earlier entry (:meth:`after`) or together with it (:meth:`with_`), and :meth:`repeat` and :meth:`stagger` place whole series of entries.
+
+    Every entry is anchored on an entry added before it, so the times are resolved as the entries are added, in one pass. The builder knows the total duration of the scene before anything is rendered, and :meth:`validate` finds conflicting entries ahead of time.
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        schedule = TimelineBuilder()
+        hello = schedule.at(2, FadeIn(bloby))
+        schedule.with_(hello, bloby.look_at(text_box), offset=0.5)
+        # Each step must end before the next one touches the same mobjects: animation_rt <= every.
+        schedule.repeat(script_sequencer(texts, text_box.get_triangle(), animation_rt=3), every=3, after=hello)
+        schedule.after(None, bloby.have_idea(), gap=1)  # After the last entry.
+
+        play_timeline(self, schedule)
+
+    """
+
+    def __init__(self):
+        self.cues = []
+
+    @property
+    def duration(self) -> float:
+        """
+        Time at which the last animation of the timeline ends.
+        """
+
+        return max((cue.end for cue in self.cues), default=0)
+
+    def at(self, t: float, *animations) -> Cue:
+        """
+        Play animations at an absolute time.
+
+        :param t: Start time, in seconds.
+        :type t: float
+
+        :param animations: Animations, ``mobject.animate`` builders or lists of them (e.g. a step of :func:`script_sequencer`).
+
+        :rtype: Cue
+
+        """
+
+        if t < 0:
+            raise ValueError(f"Entries cannot start before the beginning of the timeline, got t={t}")
+        animations = _flatten(animations)
+        cue = Cue(len(self.cues), float(t), max((_run_time(anim) for anim in animations), default=0), animations)
+        self.cues.append(cue)
+        return cue
+
+    def after(self, prev: Cue | None, *animations, gap: float = 0) -> Cue:
+        """
+        Play animations when an earlier entry ends.
+
+        :param prev: The entry to follow. If None, the last entry added.
+        :type prev: Cue | None
+
+        :param gap: Time between the end of ``prev`` and the new entry. Negative gaps overlap them. Defaults to 0.
+        :type gap: float, optional
+
+        :rtype: Cue
+
+        """
+
+        return self.at(self._anchor(prev).end + gap, *animations)
+
+    def with_(self, prev: Cue | None, *animations, offset: float = 0) -> Cue:
+        """
+        Play animations together with an earlier entry (``with`` is a Python keyword).
+
+        :param prev: The entry to join. If None, the last entry added.
+        :type prev: Cue | None
+
+        :param offset: Delay from the start of ``prev``. Defaults to 0.
+        :type offset: float, optional
+
+        :rtype: Cue
+
+        """
+
+        return self.at(self._anchor(prev).start + offset, *animations)
+
+    def repeat(self,
+               source: Iterable | Callable[[int], object],
+               every: float,
+               times: int = None,
+               at: float = None,
+               after: Cue = None) -> list[Cue]:
+        """
+        Play a series of entries at a regular interval, e.g. the steps of :func:`script_sequencer`.
+
+        :param source: An iterable of entries, or a function returning the entry number ``i``.
+        :type source: Iterable | Callable[[int], object]
+
+        :param every: Time between the starts of two consecutive entries.
+        :type every: float
+
+        :param times: Number of entries. Required if ``source`` is a function; otherwise the iterable is consumed until it ends.
+        :type times: int, optional
+
+        :param at: Start time of the first entry. Defaults to None (when ``after`` ends).
+        :type at: float, optional
+
+        :param after: The entry after which the series starts. Defaults to None (the last entry added, or 0 if there is none).
+        :type after: Cue, optional
+
+        :rtype: list[Cue]
+
+        """
+
+        if callable(source):
+            if times is None:
+                raise ValueError("repeat needs the number of times when the source is a function")
+            make = source
+            source = (make(i) for i in range(times))
+        elif times is not None:
+            source = islice(source, times)
+
+        first = self._start(at, after)
+        return [self.at(first + i*every, entry) for i, entry in enumerate(source)]
+
+    def stagger(self,
+                animations: Iterable,
+                lag: float,
+                at: float = None,
+                after: Cue = None) -> list[Cue]:
+        """
+        Start animations one after the other, ``lag`` seconds apart, whatever their run time.
+
+        :param animations: The animations to stagger.
+        :type animations: Iterable
+
+        :param lag: Time between two consecutive starts.
+        :type lag: float
+
+        :param at: Start time of the first animation. Defaults to None (when ``after`` ends).
+        :type at: float, optional
+
+        :param after: The entry after which the animations start. Defaults to None (the last entry added, or 0 if there is none).
+        :type after: Cue, optional
+
+        :rtype: list[Cue]
+
+        """
+
+        return self.repeat(animations, every=lag, at=at, after=after)
+
+    def overlaps(self) -> list[tuple[Cue, Cue]]:
+        """
+        Find the entries that animate the same mobject at the same time, or a mobject and one of its parts (e.g. ``sight`` and ``sight[0]``). Animations of one single entry are not compared with each other.
+
+        :return: The pairs of conflicting entries.
+        :rtype: list[tuple[Cue, Cue]]
+
+        """
+
+        intervals = {}
+        for cue in self.cues:
+            for anim in cue.animations:
+                for key in _animated_keys(anim):
+                    intervals.setdefault(key, []).append((cue.start, cue.start + _run_time(anim), cue))
+
+        conflicts = {}  # A pair of entries can conflict on several parts: keep it once.
+        for spans in intervals.values():
+            spans.sort(key=lambda span: span[0])
+            latest_end, latest = -np.inf, None
+            for start, end, cue in spans:
+                if latest is not None and latest is not cue and start < latest_end and end > start:
+                    conflicts.setdefault((latest.index, cue.index), (latest, cue))
+                if end > latest_end:
+                    latest_end, latest = end, cue
+        return sorted(conflicts.values(), key=lambda pair: (pair[1].start, pair[0].start))
+
+    def validate(self, min_gap: float = None):
+        """
+        Check the timeline before rendering anything.
+
+        :param min_gap: Shortest time allowed between two different start times. Shorter gaps would be played as a wait of less than one frame. Defaults to None (one frame at the current frame rate).
+        :type min_gap: float, optional
+
+        :raises ValueError: If two entries animate the same mobject at the same time, or two entries start less than ``min_gap`` apart.
+
+        """
+
+        if min_gap is None:
+            from manim import config
+            min_gap = 1 / config.frame_rate
+
+        conflicts = self.overlaps()
+        if conflicts:
+            first, second = conflicts[0]
+            raise ValueError(f"{len(conflicts)} overlapping entries, e.g. the entry at {first.start:g}s "
+                             f"(until {first.end:g}s) and the one at {second.start:g}s animate the same mobject")
+
+        starts = np.unique([cue.start for cue in self.cues])
+        gaps = np.diff(starts)
+        short = np.flatnonzero(gaps < min_gap)
+        if len(short):
+            t = starts[short[0]]
+            raise ValueError(f"Entries at {t:g}s and {starts[short[0] + 1]:g}s are only {gaps[short[0]]:g}s apart, "
+                             f"less than {min_gap:g}s")
+
+    def build(self, validate: bool = True) -> dict[float, list]:
+        """
+        Return the timeline as a dictionary of absolute start times, as expected by :func:`play_timeline`.
+
+        :param validate: Whether to call :meth:`validate` first. Defaults to True.
+        :type validate: bool, optional
+
+        :rtype: dict[float, list]
+
+        """
+
+        if validate:
+            self.validate()
+        timeline = {}
+        for cue in self.cues:
+            if cue.animations:
+                timeline.setdefault(cue.start, []).extend(cue.animations)
+        return timeline
+
+    def _anchor(self, prev: Cue | None) -> Cue:
+        if prev is None:
+            if not self.cues:
+                raise ValueError("There is no previous entry to anchor on")
+            return self.cues[-1]
+        if prev.index >= len(self.cues) or self.cues[prev.index] is not prev:
+            raise ValueError("The entry to anchor on belongs to another timeline")
+        return prev
+
+    def _start(self, at: float | None, after: Cue | None) -> float:
+        if at is not None:
+            return at
+        if after is None and not self.cues:
+            return 0
+        return self._anchor(after).end
+
+
+class PlannedAnimation:
+    """
+    Stand-in for an animation in a dry run: it only knows its name, run time and target, so scripts can be
+    timed without building mobjects or compiling LaTeX. :func:`script_sequencer` and :func:`script_timeline`
+    yield them when ``dry_run=True``.
+
+    :param name: Name of the animation it stands for (e.g. ``"Create"``) or of the creature method.
+    :type name: str
+
+    :param run_time: Run time of the animation.
+    :type run_time: float
+
+    :param mobject: What the animation acts on: a mobject, a dialogue line or any placeholder object. It is only compared by identity, to find overlaps.
+    :type mobject: object, optional
+
+    :param creature_method: Name of the creature method it stands for, if any.
+    :type creature_method: str, optional
+
+    :param timed: Whether the run time is known. Actions that are not a :func:`creature_action` cannot be timed without calling them, so they are planned with a run time of 0 and ``timed=False``. Defaults to True.
+    :type timed: bool, optional
+
+    """
+
+    def __init__(self,
+                 name: str,
+                 run_time: float,
+                 mobject: object = None,
+                 creature_method: str = None,
+                 timed: bool = True):
+        self.name = name
+        self.run_time = run_time
+        self.mobject = mobject
+        self.creature_method = creature_method
+        self.timed = timed
+        self.label = mobject if isinstance(mobject, str) else getattr(mobject, "tex_string", None)
+
+    def get_run_time(self) -> float:
+        return self.run_time
+
+    def __repr__(self) -> str:
+        return f"PlannedAnimation({self.name!r}, {self.run_time!r})"
+
+
+def script_timeline(rows: Iterable[ScriptRow],
+                    actions: dict[str, Callable] = None,
+                    steps: Iterator = None,
+                    start: float = 0,
+                    duration: float = 3,
+                    dry_run: bool = False) -> dict[float, list]:
+    """
+    Build a timeline for :func:`play_timeline` straight from the rows of :func:`iter_script_rows`, so there is no need to zip lists or write ``next(script)`` entries by hand.
+
+    Each row starts at its own start column if it has one, or when the previous row ends otherwise. Rows last their duration column, or ``duration`` seconds.
+
+    :param rows: The rows of the script.
+    :type rows: Iterable[ScriptRow]
+
+    :param actions: Maps the action identifiers of the script to functions returning the animation(s) of the creature, e.g. ``{"surprise": my_creature.surprise}``. Actions without an entry (like "none") only play the dialogue. Defaults to None.
+    :type actions: dict[str, Callable], optional
+
+    :param steps: The dialogue steps yielded by :func:`script_sequencer`. One step is played with each row, and the last one (the fade out) when the script ends. Defaults to None.
+    :type steps: Iterator, optional
+
+    :param start: Time of the first row without start column. Defaults to 0.
+    :type start: float, optional
+
+    :param duration: Duration of the rows without duration column. Defaults to 3.
+    :type duration: float, optional
+
+    :param dry_run: Do not call the actions, put a :class:`PlannedAnimation` with their name and run time instead (see :func:`creature_action`). Actions can be creature methods or ``functools.partial`` of them, with their arguments; other functions are planned as untimed, with a warning. Defaults to False.
+    :type dry_run: bool, optional
+
+    :return: The timeline, mapping start times to lists of animations.
+    :rtype: dict[float, list]
+
+    :raises ValueError: If ``steps`` has no step left for a row.
+
+    Example usage:
+
+    .. code-block:: python
+
+        rows = list(iter_script_rows("dialogue/example_script.csv"))
+        texts = iter_dialogue_tex(rows, position=text_box.get_center())
+        actions = {"surprise": my_creature.surprise, "thinking": my_creature.thinking}
+        play_timeline(self, script_timeline(rows, actions, script_sequencer(texts, text_box.get_triangle())))
+
+    """
+
+    actions = actions or {}
+    if steps is not None:
+        steps = iter(steps)
+    timeline = {}
+    t = start
+    for row in rows:
+        if row.start is not None:
+            t = row.start
+        entry = []
+        if steps is not None:
+            step = next(steps, None)
+            if step is None:
+                raise ValueError(f"The dialogue steps ran out at row {row.line_number} ({row.dialogue!r}): "
+                                 f"the sequencer has fewer texts than the script has rows")
+            entry = list(step)
+        if row.action in actions and dry_run:
+            entry.append(_planned_action(actions[row.action]))
+        elif row.action in actions:
+            animations = actions[row.action]()
+            entry += animations if isinstance(animations, (list, tuple)) else [animations]
+        if entry:
+            timeline.setdefault(t, []).extend(entry)
+        t += row.duration if row.duration is not None else duration
+
+    if steps is not None:
+        for entry in steps:
+            timeline.setdefault(t, []).extend(entry)
+    return timeline
+
+
+def _planned_action(action: Callable) -> PlannedAnimation:
+    """
+    Stand-in for the animation of a creature action in a dry run. The run time comes from the ``rt`` of the
+    method, if it is a :func:`creature_action` (possibly wrapped in ``functools.partial``, whose arguments are
+    used); the creature (or the function) is the target for overlaps. Other actions cannot be timed without
+    being called, so they are planned as untimed, with a warning.
+    """
+
+    args, kwargs = (), {}
+    while isinstance(action, functools.partial):
+        args, kwargs = action.args + args, {**action.keywords, **kwargs}
+        action = action.func
+    target = getattr(action, "__self__", action)
+    if not inspect.ismethod(action) and args:  # A method taken from the class, with the creature as first argument.
+        target, args = args[0], args[1:]
+
+    name = getattr(action, "__name__", type(action).__name__)
+    planned_run_time = getattr(action, "planned_run_time", None)
+    if planned_run_time is None:
+        warnings.warn(f"The action {name!r} is not a creature_action, so its run time is unknown: "
+                      f"it is timed as 0 seconds in the dry run", stacklevel=3)
+        return PlannedAnimation(name, 0, target, creature_method=name, timed=False)
+    return PlannedAnimation(name, planned_run_time(*args, **kwargs), target, creature_method=name)
+
+
+def _flatten(animations) -> list:
+    """
+    Flatten the entries given to the builder (lists of animations, like the steps of :func:`script_sequencer`), and build the ``mobject.animate`` ones.
+    """
+
+    flat = []
+    for anim in animations:
+        if isinstance(anim, (list, tuple)):
+            flat += _flatten(anim)
+            continue
+        if hasattr(anim, 'build') and not hasattr(anim, 'get_run_time'):
+            anim = anim.build()
+        if not hasattr(anim, 'get_run_time'):
+            raise TypeError(
+                f"Timeline only accepts Animation objects. "
+                f"Got {type(anim).__name__}. "
+                f"Use 'mobject.animate.method()' or Animation classes like 'Create(mobject)'."
+            )
+        flat.append(anim)
+    return flat
+
+
+def _run_time(anim) -> float:
+    return float(anim.get_run_time())
+
+
+def _animated_mobjects(anim) -> list:
+    """
+    The mobjects changed by an animation, looking inside animation groups.
+    """
+
+    if getattr(anim, "animations", None):
+        return [mobject for sub in anim.animations for mobject in _animated_mobjects(sub)]
+    mobject = getattr(anim, "mobject", None)
+    return [mobject] if mobject is not None else []
+
+
+def _animated_keys(anim) -> set[int]:
+    """
+    Identities of the parts changed by an animation: the leaves of the family of each animated mobject (the mobject itself if it has no parts). Two animations touch the same parts exactly when they share a key, also when one animates a mobject and the other one of its parts.
+    """
+
+    keys = set()
+    for mobject in _animated_mobjects(anim):
+        get_family = getattr(mobject, "get_family", None)
+        if get_family is None:  # Placeholders of dry runs, like dialogue strings.
+            keys.add(id(mobject))
+        else:
+            keys.update(id(member) for member in get_family() if not member.submobjects)
+    return keys
@@ -1,53 +1,124 @@
-from ..my_imports import *
-from .beeper import *
+from collections.abc import Callable, Iterable
+import functools
+from .schedule import PlannedAnimation
+from .voice import Voice
+from .. import profiling
 
 __all__ = ["script_sequencer"]
 
 def script_sequencer(
         # Eats a creature, which is a mobject
-        all_texts: list[VMobject],  # Eats a script of text. This is a list with Text as entries
-        triangle_next_text: VMobject,
-        animation_rc: float = there_and_back_with_pause,
+        all_texts: Iterable,  # Eats a script of text. A list with Text as entries, or a lazy source of them
+        triangle_next_text,
+        animation_rc: Callable = None,
         animation_rt: float = 4,
         fade_last=True,  # fade out the last text
+        dry_run: bool = False,
+        voice: Voice = None,
+        typewriter: bool = False,
+        text_box=None,
         ):
     
     """
-    This function merges together a list of actions for the creature and a list of text to synchronise with the aforementioned actions. It has an inner counter called counter_script.  
+    This function merges together a list of actions for the creature and a list of text to synchronise with the aforementioned actions.
 
-    If the counter is at 0, this load_script_tex function will display the first entry of the text list inside the chosen box and the first animation for the creature in such list. It will also FadeIn a triangle simulating a "next text icon" in the chosen box. It will add +1 to the counter_script.
+    For the first entry of the text, it will display it inside the chosen box. It will also FadeIn a triangle simulating a "next text icon" in the chosen box.
 
-    If the counter_script is greater than 0, the function will erase the previous text and the triangle and write the next text at the same time it commands the creature the next action. 
+    For every following entry, the function will erase the previous text and the triangle and write the next text at the same time it commands the creature the next action. After the last entry, it erases the last text (if fade_last).
+
+    The texts are consumed one at a time, so all_texts can be a lazy source, like a generator or :func:`iter_dialogue_tex`. Line N is only materialised when it is about to be shown, and the sequencer drops line N-1 once its :class:`Fwc` fade-out has been played. Long scripts then use roughly constant memory.
 
     Args:
         - creature (VMobject): Creature to animation
-        - all_texts (list[VMobject]): List of tex of what the creature will say.
+        - all_texts (Iterable[VMobject]): List (or any iterable) of tex of what the creature will say.
         - triangle_next_text (VMobject): Triangle simulating next text in the box.
-        - animation_rc: The desired rate_func for the animations. Defaults to there_and_back_with_pause.
+        - animation_rc: Not used at the moment, the animations keep their own rate_func. Defaults to None.
         - animation_rt: The desired run_time for the creature animation. Defaults to 4 seconds. 
+        - voice (Voice): Write the texts with :class:`Speak` in this voice instead of :class:`Create`, so the creature "talks". Defaults to None (silent).
+        - typewriter (bool): Write the texts with :class:`Typewriter` instead of :class:`Create` (or :class:`Speak`), which only redraws the glyphs that change in each frame. Defaults to False.
+        - text_box (Text_Box): Write the texts in the text slots of this box instead of showing each text mobject (see :meth:`Text_Box.write`), and make its triangle blink instead of fading it out and in on every line. The scene then keeps the same few mobjects over the whole script. triangle_next_text is not used and can be None. Defaults to None.
+        - dry_run (bool): Yield :class:`PlannedAnimation` instead of animations, to time a script with :func:`timing_report` without building anything. The texts can then be plain strings (e.g. the dialogue column of the script) and the triangle can be None. Defaults to False.
 
     """
 
-    # counts number of entries + 1. I assume last one to erase final text.
-    for iteration in range(len(all_texts) + bool(fade_last)):
-        if iteration < len(all_texts):
-            type_de_script = [Create(all_texts[iteration], run_time=animation_rt), 
-                              FadeIn(triangle_next_text, run_time=animation_rt)]
+    if text_box is not None:
+        yield from _slot_steps(all_texts, text_box, animation_rt, fade_last, dry_run, voice)
+        return
+
+    if dry_run:
+        create, fade_in, fwc, fade_out = (_planned(name) for name in ("Create", "FadeIn", "Fwc", "FadeOut"))
+        if triangle_next_text is None:
+            triangle_next_text = "triangle"
+    else:
+        # Imported here so dry runs work without loading manim.
+        from manim import Create, FadeIn, FadeOut
+        from .beeper import Fwc, Speak
+        from .typewriter import Typewriter
+        create, fade_in, fwc, fade_out = Create, FadeIn, Fwc, FadeOut
+        if typewriter:
+            create = functools.partial(Typewriter, voice=voice)
+        elif voice is not None:
+            create = functools.partial(Speak, voice=voice)
+
+    previous_text = None
+    for text in profiling.profiled_iter(all_texts, "script_sequencer text", "sequencer"):
+        if previous_text is None:
+            yield [create(text, run_time=animation_rt),
+                   fade_in(triangle_next_text, run_time=animation_rt)]
+        else:
+            yield [fwc(previous_text, run_time=0.08),
+                   fade_out(triangle_next_text, run_time=0.08),
+                   create(text, run_time=animation_rt),
+                   fade_in(triangle_next_text, run_time=animation_rt)]
+        # Only the previous step (already played by now) referenced the older text.
+        previous_text = text
 
-        if iteration == 0:
-            counter_script = type_de_script
+    if fade_last and previous_text is not None:
+        yield [fade_out(triangle_next_text, run_time=0.08),
+               fwc(previous_text, run_time=0.08)]
 
-        elif iteration < len(all_texts):
-            counter_script = [Fwc(all_texts[iteration-1], run_time=0.08), 
-                              FadeOut(triangle_next_text, run_time=0.08), 
-                              Create(all_texts[iteration], run_time=animation_rt), 
-                              FadeIn(triangle_next_text, run_time=animation_rt)]
 
-        elif iteration == len(all_texts):
-            counter_script = [FadeOut(triangle_next_text, run_time=0.08), 
-                              Fwc(all_texts[iteration-1], run_time=0.08)]
+def _slot_steps(all_texts: Iterable, text_box, animation_rt: float, fade_last: bool, dry_run: bool, voice: Voice):
+    """
+    Steps of :func:`script_sequencer` with the text slots and the blinking triangle of a :class:`Text_Box`.
+    """
+
+    if dry_run:
+        write, blink, fwc, fade_out = (_planned(name) for name in ("WriteInSlot", "BlinkIndicator", "Fwc", "FadeOut"))
+        triangle = "triangle"
+        slots = ["text slot 1", "text slot 2"]  # Placeholders of the two slots of the box, used in turn.
+    else:
+        from manim import FadeOut
+        from .beeper import Fwc
+        fwc, fade_out = Fwc, FadeOut
+        triangle = text_box.get_triangle()
 
+    previous_slot = None
+    for text in profiling.profiled_iter(all_texts, "script_sequencer text", "sequencer"):
+        if dry_run:
+            writing = write(slots[0], run_time=animation_rt)
+            writing.label = text if isinstance(text, str) else getattr(text, "tex_string", None)  # Shown in the report.
+            slots.reverse()
+            blinking = blink(triangle, run_time=animation_rt)
         else:
-            counter_script = Wait(0.001)
+            writing = text_box.write(text, run_time=animation_rt, voice=voice)
+            blinking = text_box.blink(run_time=animation_rt)
+        if previous_slot is None:
+            yield [writing, blinking]
+        else:
+            yield [fwc(previous_slot, run_time=0.08), writing, blinking]
+        previous_slot = writing.mobject
+
+    if fade_last and previous_slot is not None:
+        yield [fade_out(triangle, run_time=0.08),
+               fwc(previous_slot, run_time=0.08)]
+
+
+def _planned(name: str) -> Callable:
+    """
+    Stand-in for an animation class in a dry run.
+    """
 
-        yield counter_script
+    def planned(mobject, run_time: float) -> PlannedAnimation:
+        return PlannedAnimation(name, run_time, mobject)
+    return planned
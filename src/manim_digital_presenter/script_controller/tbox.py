@@ -1,7 +1,43 @@
 from manim import *
 import csv
+from .text_slot import TextSlot, WriteInSlot
 
-__all__ = ["Text_Box"]
+__all__ = ["Text_Box", "BlinkIndicator"]
+
+
+class BlinkIndicator(Animation):
+    """
+    Makes a mobject pulse, like the "next text" indicator of RPG dialogue boxes: its opacity goes down and back up every ``period`` seconds, and is full again at the end. Only the opacity changes, in place, so the same indicator can blink on every line of a script instead of being faded out and in again.
+
+    :param mobject: The mobject, usually the triangle of a :class:`Text_Box`.
+    :type mobject: VMobject
+
+    :param period: Duration of one blink, in seconds. Defaults to 1.
+    :type period: float, optional
+
+    :param dim: Lowest opacity, as a fraction of the original one. Defaults to 0.
+    :type dim: float, optional
+
+    """
+
+    def __init__(self, mobject: VMobject, period: float = 1, dim: float = 0, **kwargs):
+        super().__init__(mobject, rate_func=linear, introducer=True, **kwargs)
+        self.period = period
+        self.dim = dim
+        self._opacities = [(member, member.get_fill_opacity(), member.get_stroke_opacity())
+                           for member in mobject.family_members_with_points()]
+
+    def create_starting_mobject(self) -> Mobject:
+        return Mobject()  # Only the opacities change, and they are stored in __init__.
+
+    def interpolate_mobject(self, alpha: float):
+        if alpha >= 1:
+            level = 1
+        else:
+            level = self.dim + (1 - self.dim) * (0.5 + 0.5 * np.cos(TAU * alpha * self.run_time / self.period))
+        for member, fill_opacity, stroke_opacity in self._opacities:
+            member.set_fill(opacity=level * fill_opacity, family=False)
+            member.set_stroke(opacity=level * stroke_opacity, family=False)
 
 class Text_Box(VGroup):
     """
@@ -44,6 +80,9 @@ class Text_Box(VGroup):
     :ivar triangle: The Triangle component serving as the next indicator
     :vartype triangle: Triangle
 
+    :ivar text_slots: Two slots for the dialogue, used in turn by :meth:`write`: one line fades out of a slot while the next is written in the other.
+    :vartype text_slots: tuple[TextSlot, TextSlot]
+
     Example usage:
 
     .. code-block:: python
@@ -116,6 +155,10 @@ class Text_Box(VGroup):
 
         super().__init__(self.box, self.triangle, **kwargs)
 
+        # Not submobjects: the slots come and go from the scene while the box stays.
+        self.text_slots = (TextSlot(), TextSlot())
+        self._next_slot = 0
+
     def get_box(self) -> RoundedRectangle:
         """
         Return the dialogue box component.
@@ -154,5 +197,61 @@ class Text_Box(VGroup):
         """
         return self.box.get_center()
 
+    def write(self, text: VMobject, run_time: float = 4, voice=None, **kwargs) -> WriteInSlot:
+        """
+        Return an animation writing a dialogue line in the next text slot of the box. The slots are used in turn and keep their glyphs, so a long script reuses the same mobjects (see :class:`TextSlot`).
+
+        :param text: The line, usually from :func:`create_dialogue_tex` at ``self.get_center()``
+        :type text: VMobject
+
+        :param run_time: Run time of the writing. Defaults to 4
+        :type run_time: float, optional
+
+        :param voice: If given, the line is also spoken with this voice. Defaults to None (silent)
+        :type voice: Voice, optional
+
+        :return: The animation. Its mobject is the slot, to fade it out with :class:`Fwc` before the next line.
+        :rtype: WriteInSlot
 
+        """
+        slot = self.text_slots[self._next_slot]
+        self._next_slot = 1 - self._next_slot
+        return WriteInSlot(slot, text, voice=voice, run_time=run_time, **kwargs)
+
+    def blink(self, run_time: float = 4, period: float = 1) -> BlinkIndicator:
+        """
+        Return an animation making the triangle blink, see :class:`BlinkIndicator`.
+
+        :param run_time: Run time of the animation. Defaults to 4
+        :type run_time: float, optional
+
+        :param period: Duration of one blink. Defaults to 1
+        :type period: float, optional
+
+        :rtype: BlinkIndicator
+
+        """
+        return BlinkIndicator(self.triangle, period=period, run_time=run_time)
 
+    def paginate(self, dialogue: list, font_size: float = 35, metrics=None, padding: float = 0.3) -> list:
+        """
+        Wrap and split dialogue lines into pages that fit in the box, see :func:`paginate_dialogue`.
+
+        :param dialogue: The dialogue lines, or the rows of :func:`iter_script_rows`.
+        :type dialogue: Iterable[str | ScriptRow]
+
+        :param font_size: Font size of the text. Defaults to 35
+        :type font_size: float, optional
+
+        :param metrics: Widths of the font. Defaults to None (an estimate on the safe side for Comic Sans, the font of create_dialogue_tex)
+        :type metrics: GlyphMetrics, optional
+
+        :param padding: Margin kept free inside the box. Defaults to 0.3
+        :type padding: float, optional
+
+        :return: One entry per page
+        :rtype: list[str | ScriptRow]
+
+        """
+        from .layout import paginate_dialogue
+        return paginate_dialogue(dialogue, self, font_size=font_size, metrics=metrics, padding=padding)
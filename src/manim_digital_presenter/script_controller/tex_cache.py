@@ -0,0 +1,318 @@
+from manim import *
+from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
+from .. import metrics
+
+__all__ = ["TexCache", "default_tex_cache", "tex_key", "tex_to_arrays", "arrays_to_tex"]
+
+# Bump it whenever the layout of the stored arrays changes, so old entries are never read back.
+_CACHE_FORMAT = 1
+
+
+def tex_to_arrays(tex: VMobject) -> dict[str, np.ndarray]:
+    """
+    Flatten a :class:`Tex` (or any :class:`VMobject`) into plain NumPy arrays: the path points of
+    every glyph and its style. :func:`arrays_to_tex` builds the mobject back without LaTeX.
+
+    :param tex: The mobject to flatten.
+    :type tex: VMobject
+
+    :return: A dictionary with the arrays ``points``, ``leaf_offsets``, ``group_sizes``,
+        ``fill_rgba``, ``stroke_rgba`` and ``stroke_width``.
+    :rtype: dict[str, np.ndarray]
+
+    """
+
+    leaves = []
+    group_sizes = []
+    for group in tex.submobjects or [tex]:
+        group_leaves = group.family_members_with_points()
+        leaves += group_leaves
+        group_sizes.append(len(group_leaves))
+
+    return {
+        "points": np.concatenate([leaf.points for leaf in leaves]) if leaves else np.zeros((0, 3)),
+        "leaf_offsets": np.cumsum([0] + [len(leaf.points) for leaf in leaves]),
+        "group_sizes": np.array(group_sizes, dtype=int),
+        "fill_rgba": np.array([[*ManimColor(leaf.get_fill_color()).to_rgb(), leaf.get_fill_opacity()]
+                               for leaf in leaves]).reshape(-1, 4),
+        "stroke_rgba": np.array([[*ManimColor(leaf.get_stroke_color()).to_rgb(), leaf.get_stroke_opacity()]
+                                 for leaf in leaves]).reshape(-1, 4),
+        "stroke_width": np.array([leaf.get_stroke_width() for leaf in leaves], dtype=float),
+    }
+
+
+def tex_key(line: str,
+            tex_template: TexTemplate,
+            font_size: float,
+            tex_color: ParsableManimColor) -> str:
+    """
+    Return the content address of a dialogue line: a hash of the line text, the LaTeX template
+    (preamble, compiler and output format), the font size and the colour.
+
+    :return: A hexadecimal SHA-256 digest.
+    :rtype: str
+
+    """
+
+    content = json.dumps([
+        _CACHE_FORMAT,
+        line,
+        getattr(tex_template, "body", str(tex_template)),
+        getattr(tex_template, "tex_compiler", None),
+        getattr(tex_template, "output_format", None),
+        float(font_size),
+        ManimColor(tex_color).to_hex(),
+    ])
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def arrays_to_tex(arrays: dict[str, np.ndarray], tex_string: str = None) -> VGroup:
+    """
+    Build a mobject back from the arrays of :func:`tex_to_arrays`. It has the same structure as the
+    original :class:`Tex`: one group per substring, with one :class:`VMobject` per glyph.
+
+    :param arrays: The arrays created by :func:`tex_to_arrays`.
+    :type arrays: dict[str, np.ndarray]
+
+    :param tex_string: The LaTeX source of the mobject, stored as its ``tex_string``. Defaults to None.
+    :type tex_string: str, optional
+
+    :return: The rebuilt mobject.
+    :rtype: VGroup
+
+    """
+
+    points = arrays["points"]
+    offsets = arrays["leaf_offsets"]
+    fill_rgba = arrays["fill_rgba"]
+    stroke_rgba = arrays["stroke_rgba"]
+    stroke_width = arrays["stroke_width"]
+
+    leaves = []
+    for i in range(len(offsets) - 1):
+        leaf = VMobject()
+        leaf.set_points(points[offsets[i]:offsets[i + 1]])
+        leaf.set_fill(ManimColor(fill_rgba[i, :3]), opacity=fill_rgba[i, 3])
+        leaf.set_stroke(ManimColor(stroke_rgba[i, :3]), width=stroke_width[i], opacity=stroke_rgba[i, 3])
+        leaves.append(leaf)
+
+    groups = []
+    start = 0
+    for size in arrays["group_sizes"]:
+        groups.append(VGroup(*leaves[start:start + size]))
+        start += size
+
+    tex = VGroup(*groups)
+    tex.tex_string = tex_string
+    return tex
+
+
+class TexCache:
+    """
+    Persistent, content-addressed cache of compiled dialogue lines. Each entry stores the path
+    geometry of one :class:`Tex` as NumPy arrays (see :func:`tex_to_arrays`), keyed on the line text,
+    the LaTeX template, the font size and the colour. Later runs, and other scenes, load the lines
+    from the disk without invoking LaTeX.
+
+    The cache has a size cap. When it is exceeded, the least recently used entries are evicted.
+
+    :param directory: Folder where the entries are stored. If None, defaults to ``<media_dir>/dialogue_cache``.
+    :type directory: str | Path, optional
+
+    :param max_bytes: Size cap of the cache in bytes. Defaults to 256 MB.
+    :type max_bytes: int, optional
+
+    :ivar hits: Number of lines loaded from the cache.
+    :vartype hits: int
+
+    :ivar misses: Number of lines that had to be compiled with LaTeX.
+    :vartype misses: int
+
+    :ivar evictions: Number of entries removed to respect ``max_bytes``.
+    :vartype evictions: int
+
+    Example usage:
+
+    .. code-block:: python
+
+       from manim_digital_presenter import *
+
+       cache = TexCache(max_bytes=64 * 2**20)
+       texts = create_dialogue_tex(dialogue, cache=cache)
+       print(cache.stats())
+
+    """
+
+    def __init__(self,
+                 directory: str | Path = None,
+                 max_bytes: int = 256 * 2**20):
+        if directory is None:
+            directory = Path(config.get_dir("media_dir")) / "dialogue_cache"
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = None  # name -> (last use, size), loaded lazily from the disk.
+
+    def key(self,
+            line: str,
+            tex_template: TexTemplate,
+            font_size: float,
+            tex_color: ParsableManimColor) -> str:
+        """
+        Return the content address of a dialogue line, see :func:`tex_key`.
+
+        :return: A hexadecimal SHA-256 digest.
+        :rtype: str
+
+        """
+
+        return tex_key(line, tex_template, font_size, tex_color)
+
+    def get(self, key: str) -> dict[str, np.ndarray] | None:
+        """
+        Return the arrays stored under a key, or None if they are not in the cache.
+        """
+
+        file = self._path(key)
+        try:
+            with np.load(file) as stored:
+                arrays = dict(stored)
+        except (FileNotFoundError, ValueError, OSError):
+            self.misses += 1
+            metrics.count("tex_cache.misses")
+            return None
+
+        self.hits += 1
+        metrics.count("tex_cache.hits")
+        self._touch(file)
+        return arrays
+
+    def put(self, key: str, arrays: dict[str, np.ndarray]):
+        """
+        Store the arrays of a line and evict the least recently used entries if the cache grew
+        over ``max_bytes``.
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file = self._path(key)
+        # Write to a temporary file first, so other processes never read half-written entries.
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "wb") as stream:
+            np.savez(stream, **arrays)
+        os.replace(temporary, file)
+
+        entries = self._load_entries()
+        entries[file.name] = (os.path.getmtime(file), os.path.getsize(file))
+        self._evict()
+
+    def get_or_create(self,
+                      line: str,
+                      tex_template: TexTemplate = TexFontTemplates.comic_sans,
+                      font_size: float = 35,
+                      tex_color: ParsableManimColor = WHITE) -> VGroup:
+        """
+        Return the mobject of a dialogue line, loading it from the cache or compiling it with LaTeX
+        (and storing it) on a miss.
+
+        :return: The mobject of the line, see :func:`arrays_to_tex`.
+        :rtype: VGroup
+
+        """
+
+        key = self.key(line, tex_template, font_size, tex_color)
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = tex_to_arrays(Tex(line, tex_template=tex_template, font_size=font_size, color=tex_color))
+            self.put(key, arrays)
+        return arrays_to_tex(arrays, tex_string=line)
+
+    def size(self) -> int:
+        """
+        Return the size of the cache on the disk, in bytes.
+        """
+
+        return sum(size for _, size in self._load_entries().values())
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the hit/miss counters of the cache and its current size.
+
+        :rtype: dict[str, int]
+
+        """
+
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._load_entries()),
+                "bytes": self.size()}
+
+    def clear(self):
+        """
+        Remove every entry of the cache from the disk.
+        """
+
+        for name in list(self._load_entries()):
+            self._remove(name)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def _load_entries(self) -> dict[str, tuple[float, int]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.directory.is_dir():
+                for entry in os.scandir(self.directory):
+                    if entry.name.endswith(".npz"):
+                        stat = entry.stat()
+                        self._entries[entry.name] = (stat.st_mtime, stat.st_size)
+        return self._entries
+
+    def _touch(self, file: Path):
+        # The modification time of an entry is its last use, so LRU survives between runs.
+        try:
+            os.utime(file)
+            self._load_entries()[file.name] = (os.path.getmtime(file), os.path.getsize(file))
+        except OSError:
+            pass
+
+    def _remove(self, name: str):
+        try:
+            os.remove(self.directory / name)
+        except FileNotFoundError:
+            pass
+        self._load_entries().pop(name, None)
+
+    def _evict(self):
+        entries = self._load_entries()
+        total = self.size()
+        for name, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            self._remove(name)
+            self.evictions += 1
+            total -= size
+
+
+_DEFAULT_CACHES = {}
+
+
+def default_tex_cache() -> TexCache:
+    """
+    Return the shared :class:`TexCache` of the current media folder, used by
+    :func:`create_dialogue_tex` when ``cache=True``.
+
+    :rtype: TexCache
+
+    """
+
+    directory = Path(config.get_dir("media_dir")) / "dialogue_cache"
+    if directory not in _DEFAULT_CACHES:
+        _DEFAULT_CACHES[directory] = TexCache(directory)
+    return _DEFAULT_CACHES[directory]
@@ -0,0 +1,109 @@
+from ..my_imports import *
+from .. import metrics
+from .typewriter import Typewriter
+from .voice import Voice, reveal_times
+
+__all__ = ["TextSlot", "WriteInSlot"]
+
+
+class TextSlot(VGroup):
+    """
+    A long-lived mobject that shows one dialogue line at a time. It keeps a pool of glyphs, and loading a line copies the points and style of its glyphs into the pool, in place. The glyphs left over by a shorter line lose their points, so they are skipped by the renderer and by the animations. The pool only grows up to the longest line of the script. The scene then keeps the same few mobjects over a whole script, instead of adding one new mobject per line.
+
+    The line is written at the position of its mobject, so create it where it should be shown (e.g. ``create_dialogue_tex(dialogue, position=text_box.get_center())``).
+
+    :ivar glyphs: The pool of glyphs. The first :attr:`size` show the current line.
+    :vartype glyphs: list[VMobject]
+
+    :ivar size: Number of glyphs of the current line.
+    :vartype size: int
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        slot = TextSlot()
+        for text in texts:
+            self.play(WriteInSlot(slot, text, run_time=2))
+            self.play(Fwc(slot, run_time=0.08))
+
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.glyphs = []
+        self.size = 0
+        self.tex_string = None
+
+    def load(self, text: VMobject):
+        """
+        Show a dialogue line in the slot, reusing the glyphs of the pool.
+
+        :param text: The line, usually from :func:`create_dialogue_tex`. It is not modified and can be dropped afterwards.
+        :type text: VMobject
+
+        """
+
+        leaves = text.family_members_with_points()
+        missing = len(leaves) - len(self.glyphs)
+        if missing > 0:
+            self.glyphs += [VMobject() for _ in range(missing)]
+            self.add(*self.glyphs[-missing:])
+            metrics.count("text_slot.glyphs_allocated", missing)
+        metrics.count("text_slot.glyphs_reused", len(leaves) - max(missing, 0))
+
+        for glyph, leaf in zip(self.glyphs, leaves):
+            glyph.set_points(leaf.points)
+            glyph.match_style(leaf, family=False)
+        for glyph in self.glyphs[len(leaves):self.size]:
+            glyph.points = np.zeros((0, self.dim))
+        self.size = len(leaves)
+        self.tex_string = getattr(text, "tex_string", None)
+
+    def get_glyphs(self) -> list[VMobject]:
+        """
+        Return the glyphs of the current line, in the order they are written.
+
+        :rtype: list[VMobject]
+
+        """
+
+        return self.glyphs[:self.size]
+
+
+class WriteInSlot(Typewriter):
+    """
+    :class:`Typewriter` for a :class:`TextSlot`: the line is loaded into the slot when the animation begins, then written glyph after glyph. Building the animation does not touch the slot, so a whole script of them can be scheduled at once (as :func:`script_timeline` does), and each line replaces the previous one when its turn comes.
+
+    :param slot: The slot to write in.
+    :type slot: TextSlot
+
+    :param text: The line, usually from :func:`create_dialogue_tex`.
+    :type text: VMobject
+
+    :param voice: If given, the line is also spoken with this voice, see :class:`Typewriter`. Defaults to None (silent).
+    :type voice: Voice, optional
+
+    :param sound_gain: Gain of the voice in dB. Defaults to 0.
+    :type sound_gain: float, optional
+
+    """
+
+    def __init__(self,
+                 slot: TextSlot,
+                 text: VMobject,
+                 voice: Voice = None,
+                 sound_gain: float = 0,
+                 **kwargs):
+        super().__init__(slot, **kwargs)
+        self.text = text
+        if voice is not None:
+            self.sound_to_play = voice.line(text, self.run_time)
+            self.sound_gain = sound_gain
+
+    def begin(self):
+        self.mobject.load(self.text)
+        self.text = None  # The slot has its points now.
+        self.glyphs = self.mobject.get_glyphs()
+        self.reveal_times = reveal_times(len(self.glyphs), self.run_time)
+        super().begin()
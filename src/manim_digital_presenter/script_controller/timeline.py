@@ -1,11 +1,31 @@
 from ..my_imports import *
+from .schedule import TimelineBuilder
+from .beeper import Fwc
+from .audio import AudioTrack
+from .dry_run import TimingReport, timing_report
+from .. import profiling
+from dataclasses import fields, is_dataclass
+import functools
+import hashlib
+import heapq
+import inspect
 
-__all__ = ["play_timeline"]
+__all__ = ["play_timeline", "TimelineEngine"]
 
-def play_timeline(scene, timeline):
+def play_timeline(scene, timeline, segments: bool = True, seed: int = None, dry_run: bool = False) -> TimingReport | None:
     """
     Enhanced Abulafia Timeline supporting both Animation objects and 
     mobject.animate syntax.
+
+    The timeline can also be a :class:`TimelineBuilder`, which is validated before playing.
+
+    The timeline is played by a :class:`TimelineEngine`: only the animations running at each frame are
+    stepped, and each one is detached from the scene as soon as it ends.
+
+    The timeline is cut into segments at every dialogue change (each :class:`Fwc`), and every segment is
+    played as its own ``play`` call, hashed on its animations, the state of their mobjects and the seed. Manim
+    caches each segment as a partial movie, so after editing one line of a script only the segments that
+    changed are rendered again.
     
     Example:
         timeline = {
@@ -14,42 +34,386 @@ def play_timeline(scene, timeline):
             2: [square.animate.rotate(PI/2),             # Multiple animations
                 text.animate.set_color(YELLOW)]
         }
+
+    :param segments: Whether to cut the timeline at dialogue changes. If False, it is played as one single wait. Defaults to True.
+    :type segments: bool, optional
+
+    :param seed: Seed added to the hash of every segment. Defaults to None (the ``random_seed`` of the scene).
+    :type seed: int, optional
+
+    :param dry_run: Do not play anything, only time the timeline (see :func:`timing_report`). The scene is not touched and can be None. Defaults to False.
+    :type dry_run: bool, optional
+
+    :return: The timing report if ``dry_run``, else None.
+    :rtype: TimingReport | None
+
     """
-    
-    previous_t = 0
-    ending_time = 0
-    
-    for t, anims in sorted(timeline.items()):
-        to_wait = t - previous_t
-        if to_wait > 0:
-            scene.wait(to_wait)
-        previous_t = t
-        
-        if not isinstance(anims, Iterable):
-            anims = [anims]
-        
-        for anim in anims:
-            if hasattr(anim, 'build') and not isinstance(anim, Animation):
-                # This fixes the Abulafia animation issues with inbuilt methods. 
-                # The idea is to transform the method into some animation to pass it through timeline
-                anim = anim.build()
-            # Verify this is an Animation object
-            if not isinstance(anim, Animation):
-                raise TypeError(
-                    f"Timeline only accepts Animation objects. "
-                    f"Got {type(anim).__name__}. "
-                    f"Use 'mobject.animate.method()' or Animation classes like 'Create(mobject)'."
-                )
-            
-            # Convert animation to updater
-            turn_animation_into_updater(anim)
-            scene.add(anim.mobject)
-            
-            # Handle optional sound attribute
-            if hasattr(anim, "sound_to_play") and anim.sound_to_play:
-                scene.add_sound(anim.sound_to_play)
-                
-            ending_time = max(ending_time, t + anim.run_time)
-    
-    if ending_time > t:
-        scene.wait(ending_time - t)
+
+    if dry_run:
+        return timing_report(timeline)
+    if isinstance(timeline, TimelineBuilder):
+        timeline = timeline.build()
+    TimelineEngine(timeline).play(scene, segments=segments, seed=seed)
+
+
+def _timeline_animations(anims) -> list[Animation]:
+    """
+    Normalise one entry of a timeline (an animation, a ``mobject.animate`` builder or a list of them) into a list of animations.
+    """
+
+    if not isinstance(anims, Iterable):
+        anims = [anims]
+
+    animations = []
+    for anim in anims:
+        if hasattr(anim, 'build') and not isinstance(anim, Animation):
+            # This fixes the Abulafia animation issues with inbuilt methods. 
+            # The idea is to transform the method into some animation to pass it through timeline
+            anim = anim.build()
+        # Verify this is an Animation object
+        if not isinstance(anim, Animation):
+            raise TypeError(
+                f"Timeline only accepts Animation objects. "
+                f"Got {type(anim).__name__}. "
+                f"Use 'mobject.animate.method()' or Animation classes like 'Create(mobject)'."
+            )
+        animations.append(anim)
+    return animations
+
+
+class TimelineEngine:
+    """
+    Plays a timeline from one single updater. The animations are indexed by their start and end times: a pointer walks the starts, and the running animations are kept in a heap ordered by their end. At each frame only the running animations are stepped, so the cost of a frame depends on how many animations overlap, not on the length of the script. When an animation ends it is finished and cleaned up from the scene (e.g. the text of a :class:`FadeOut` is removed).
+
+    Big time steps (skipped or cached animations) are fine: every animation starting and ending inside the step is still begun and finished, in order.
+
+    :param timeline: Maps start times to an animation, a ``mobject.animate`` builder or a list of them.
+    :type timeline: dict[float, Animation | list]
+
+    :ivar duration: Time at which the last animation of the timeline ends.
+    :vartype duration: float
+
+    :ivar time: Current time of the timeline.
+    :vartype time: float
+
+    :ivar audio: The sounds of the played animations (e.g. the beeps of :class:`Fwc`), mixed into the movie at the end of :meth:`play`.
+    :vartype audio: AudioTrack
+
+    Example usage:
+
+    .. code-block:: python
+
+        engine = TimelineEngine({0: Create(square), 1: circle.animate.shift(UP)})
+        engine.play(self)
+
+    """
+
+    def __init__(self, timeline: dict[float, Animation | Iterable]):
+        self.entries = [(float(t), anim)
+                        for t, anims in sorted(timeline.items(), key=lambda item: item[0])
+                        for anim in _timeline_animations(anims)]
+        self.starts = np.array([t for t, _ in self.entries], dtype=float)
+        self.ends = np.array([t + anim.get_run_time() for t, anim in self.entries], dtype=float)
+        self.duration = float(self.ends.max()) if len(self.entries) else 0
+        self.time = 0
+        self.scene = None
+        self._next = 0  # Index of the next entry to start.
+        self._active = {}  # index -> animation, in start order.
+        self._ending = []  # Heap of (end, index) of the active entries.
+        self._sounds = []  # (time, sound, gain) of the animations started since the last segment was played.
+        self.audio = AudioTrack()  # Sounds of the played segments, at their time in the movie.
+        self._carrier = Mobject()
+
+    def play(self, scene: Scene, segments: bool = True, seed: int = None):
+        """
+        Play the whole timeline in a scene, one ``play`` call per segment (see :meth:`segments`).
+
+        :param scene: The scene where the timeline is played.
+        :type scene: Scene
+
+        :param segments: Whether to cut the timeline at dialogue changes. Defaults to True.
+        :type segments: bool, optional
+
+        :param seed: Seed added to the hash of every segment. Defaults to None (the ``random_seed`` of the scene).
+        :type seed: int, optional
+
+        """
+
+        if seed is None:
+            seed = getattr(scene, "random_seed", None)
+        spans = self.segments() if segments else [(0, self.duration)]
+        spans = [(start, end) for start, end in spans if end > start]  # Manim refuses plays of no length.
+
+        self.attach(scene)
+        try:
+            for start, end in spans:
+                self.advance_to(start)
+                movie_time = scene.renderer.time
+                scene.play(_TimelineSegment(end - start, self.segment_hash(start, end, seed)))
+                # The frames of the segment may be short of its end by a fraction of a frame.
+                self.advance_to(end)
+                self._add_sounds(scene, movie_time, start)
+        finally:
+            # Even if a segment fails, the sounds of the segments already in the movie are kept.
+            self.detach()
+            self._mix_sounds(scene)
+
+    def segments(self) -> list[tuple[float, float]]:
+        """
+        Cut the timeline at the start of every :class:`Fwc`, i.e. wherever the dialogue changes.
+
+        :return: The (start, end) of every segment.
+        :rtype: list[tuple[float, float]]
+
+        """
+
+        cuts = [t for t, anim in self.entries if isinstance(anim, Fwc) and 0 < t < self.duration]
+        cuts = np.unique([0, *cuts, self.duration])
+        return [(float(start), float(end)) for start, end in zip(cuts[:-1], cuts[1:])]
+
+    def segment_hash(self, start: float, end: float, seed: int = None) -> str:
+        """
+        Hash of the part of the timeline between two times: the animations running in it (their type, times, settings, rate function and the current state of their mobjects) and the seed. It is meant to be computed just before the segment is played.
+
+        :rtype: str
+
+        """
+
+        digest = hashlib.sha256(repr((start, end, seed)).encode())
+        for index, (t, anim) in enumerate(self.entries):
+            if t < end and (self.ends[index] > start or t >= start):
+                digest.update(repr((t, self.ends[index])).encode())
+                _hash_animation(digest, anim)
+        return digest.hexdigest()
+
+    def attach(self, scene: Scene):
+        """
+        Add the engine to a scene, so it advances with every frame played (or waited) by the scene.
+
+        :param scene: The scene where the timeline is played.
+        :type scene: Scene
+
+        """
+
+        self.scene = scene
+        self._carrier.add_updater(self._update)
+        scene.add(self._carrier)
+
+    def detach(self):
+        """
+        Play whatever is left of the timeline instantly and remove the engine from the scene.
+        """
+
+        self.advance_to(max(self.time, self.duration))
+        self._carrier.remove_updater(self._update)
+        self.scene.remove(self._carrier)
+
+    def active(self) -> list[Animation]:
+        """
+        Return the animations running at the current time.
+
+        :rtype: list[Animation]
+
+        """
+
+        return list(self._active.values())
+
+    def _update(self, mob, dt):
+        profiler = profiling._active
+        if profiler is None:
+            self.advance_to(self.time + max(dt, 0))
+        else:
+            profiler.call("play_timeline step", "timeline", self.advance_to, self.time + max(dt, 0))
+
+    def advance_to(self, time: float):
+        """
+        Move the timeline forward to a given time: start the animations whose start has been reached, finish the ones that ended and step the rest.
+
+        :param time: The new time of the timeline. Times before the current one are ignored.
+        :type time: float
+
+        """
+
+        dt = time - self.time
+        if dt < 0:
+            return
+        self.time = time
+
+        # Starts and ends are handled in time order (ends first on ties), even if the step covers many of them.
+        while True:
+            next_start = self.starts[self._next] if self._next < len(self.entries) else np.inf
+            next_end = self._ending[0][0] if self._ending else np.inf
+            if min(next_start, next_end) > time:
+                break
+            if next_end <= next_start:
+                self._stop(heapq.heappop(self._ending)[1])
+            else:
+                self._start(self._next)
+                self._next += 1
+
+        profiler = profiling._active
+        for index, anim in self._active.items():
+            alpha = (time - self.starts[index]) / anim.get_run_time()
+            if profiler is None:
+                self._step(anim, alpha, dt)
+            else:
+                profiler.call(_animation_name(anim), "animation", self._step, anim, alpha, dt)
+
+    @staticmethod
+    def _step(anim: Animation, alpha: float, dt: float):
+        anim.interpolate(alpha)
+        anim.update_mobjects(dt)
+
+    def _start(self, index: int):
+        start, anim = self.entries[index]
+        anim.suspend_mobject_updating = False
+        self.scene.add(anim.mobject)
+        anim.begin()
+
+        # Handle optional sound attribute
+        if getattr(anim, "sound_to_play", None):
+            self._sounds.append((start, anim.sound_to_play, getattr(anim, "sound_gain", 0)))
+
+        self._active[index] = anim
+        heapq.heappush(self._ending, (self.ends[index], index))
+
+    def _stop(self, index: int):
+        anim = self._active.pop(index)
+        anim.finish()
+        anim.clean_up_from_scene(self.scene)
+
+    def _add_sounds(self, scene: Scene, movie_time: float, start: float):
+        """
+        Move the sounds of the segment just played to :attr:`audio`, at their time in the movie. They are
+        kept even when the segment comes from the cache (where :meth:`Scene.add_sound` would drop them).
+        """
+
+        if scene.renderer.time > movie_time:  # The segment is part of the movie (rendered or cached).
+            for t, sound, gain in self._sounds:
+                self.audio.add(movie_time + t - start, sound, gain)
+        self._sounds.clear()
+
+    def _mix_sounds(self, scene: Scene):
+        """
+        Mix the sounds of the timeline and add them to the movie, one overlay per minute of sound (see :meth:`AudioTrack.chunks`).
+        """
+
+        if self.audio.events:
+            self.audio.add_to_scene(scene)
+            self.audio.clear()
+
+
+def _animation_name(anim: Animation) -> str:
+    """
+    Name of an animation in profiles: its type, and the creature method that built it, if any.
+    """
+
+    method = getattr(anim, "creature_method", None)
+    return f"{type(anim).__name__}[{method}]" if method else type(anim).__name__
+
+
+class _TimelineSegment(Wait):
+    """
+    The wait of one segment of a timeline. The hash of the segment is part of the animation, so it
+    is part of the hash manim uses to cache the partial movie.
+    """
+
+    def __init__(self, run_time: float, segment_hash: str, **kwargs):
+        self.segment_hash = segment_hash
+        super().__init__(run_time=run_time, **kwargs)
+
+
+def _hash_animation(digest, anim: Animation, seen: dict = None):
+    """
+    Feed the digest with the type, run time and settings of an animation: every attribute, including its rate function, the mobjects it animates and its sub-animations. The line of a :class:`WriteInSlot` is one of them, so it is hashed even before it is loaded into its slot.
+    """
+
+    digest.update(repr((type(anim).__name__, anim.get_run_time())).encode())
+    _hash_value(digest, vars(anim), {} if seen is None else seen)
+
+
+def _hash_value(digest, value, seen: dict):
+    """
+    Feed the digest with a setting of an animation. Objects of unknown types are only hashed on their type, so
+    the hash never depends on memory addresses.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        digest.update(repr(value).encode())
+        return
+    if isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+        return
+    if id(value) in seen:  # Shared or cyclic references.
+        digest.update(b"<seen>")
+        return
+    seen[id(value)] = value  # Kept alive, so that its id is not reused by a temporary.
+    if isinstance(value, Mobject):
+        _hash_mobject(digest, value)
+    elif isinstance(value, Animation):
+        _hash_animation(digest, value, seen)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _hash_value(digest, value[key], seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        digest.update(repr((type(value).__name__, len(value))).encode())
+        for item in sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value:
+            _hash_value(digest, item, seen)
+    elif is_dataclass(value) and not isinstance(value, type):
+        digest.update(type(value).__name__.encode())
+        for item in fields(value):
+            _hash_value(digest, getattr(value, item.name), seen)
+    elif callable(value):
+        _hash_function(digest, value, seen)
+    else:
+        digest.update(type(value).__name__.encode())
+
+
+def _hash_function(digest, func, seen: dict):
+    """
+    Feed the digest with a function (like a rate function): its code, defaults and closure, so two lambdas
+    only hash the same if they compute the same thing.
+    """
+
+    if isinstance(func, functools.partial):
+        _hash_value(digest, (func.func, func.args, func.keywords), seen)
+    elif inspect.ismethod(func):
+        _hash_value(digest, (func.__func__, func.__self__), seen)
+    elif hasattr(func, "__code__"):
+        _hash_code(digest, func.__code__)
+        closure = [_cell_contents(cell) for cell in func.__closure__ or ()]
+        _hash_value(digest, (func.__defaults__, func.__kwdefaults__, closure), seen)
+    else:  # Builtins, ufuncs, classes...
+        digest.update(repr((getattr(func, "__module__", None),
+                            getattr(func, "__qualname__", type(func).__name__))).encode())
+
+
+def _cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:  # Not assigned yet.
+        return None
+
+
+def _hash_code(digest, code):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if inspect.iscode(const):  # Nested functions.
+            _hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _hash_mobject(digest, mobject: Mobject):
+    """
+    Feed the digest with the points and colours of a mobject and its family.
+    """
+
+    for mob in mobject.get_family():
+        for name in ("points", "fill_rgbas", "stroke_rgbas"):
+            array = getattr(mob, name, None)
+            if array is not None:
+                digest.update(np.ascontiguousarray(array).tobytes())
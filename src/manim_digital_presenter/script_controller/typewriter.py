@@ -0,0 +1,94 @@
+from ..my_imports import *
+from .voice import Voice, default_voice, reveal_times
+
+__all__ = ["Typewriter"]
+
+
+class Typewriter(Animation):
+    """
+    Writes a dialogue line glyph after glyph with the same reveal as :class:`Create` (``lag_ratio=1``), but only touches the glyphs that change in each frame. Each glyph gets an equal slot of the run time and is drawn with the rate function inside its slot, as in :class:`Create`. :class:`Create` recomputes a partial path for every glyph of the line on every frame. Here the glyph order and the full and hidden points of every glyph are stored once, in :meth:`begin`. In each frame, the glyphs whose slot ended since the previous frame get their final points, and only the glyph of the current slot is drawn partially. The cost of a frame is proportional to the glyphs that changed, not to the length of the line.
+
+    :param mobject: The dialogue line, usually from :func:`create_dialogue_tex`.
+    :type mobject: VMobject
+
+    :param voice: If given, the line is also spoken with this voice, as :class:`Speak` does. Defaults to None (silent).
+    :type voice: Voice, optional
+
+    :param sound_gain: Gain of the voice in dB. Defaults to 0.
+    :type sound_gain: float, optional
+
+    :ivar glyphs: The glyphs, in the order they are written.
+    :vartype glyphs: list[VMobject]
+
+    :ivar reveal_times: Time at which each glyph starts to be written, since the start of the animation.
+    :vartype reveal_times: np.ndarray
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        texts = create_dialogue_tex(dialogue, position=text_box.get_center())
+        self.play(Typewriter(texts[0], run_time=4))
+
+    """
+
+    def __init__(self,
+                 mobject: VMobject,
+                 voice: Voice = None,
+                 sound_gain: float = 0,
+                 rate_func: Callable = smooth,
+                 **kwargs):
+        super().__init__(mobject, rate_func=rate_func, introducer=True, **kwargs)
+        self.glyphs = mobject.family_members_with_points()
+        self.reveal_times = reveal_times(len(self.glyphs), self.run_time)
+        if voice is not None:
+            self.sound_to_play = voice.line(mobject, self.run_time)
+            self.sound_gain = sound_gain
+        self._shown = 0  # The glyphs before this index are complete.
+        self._partial = None  # Index of the glyph drawn partially, if any.
+        self._full = []
+        self._hidden = []
+        self._scratch = VMobject()
+
+    def create_starting_mobject(self) -> Mobject:
+        return Mobject()  # The points of the glyphs are stored in begin(): no need for a copy of the line.
+
+    def begin(self):
+        self._full = [glyph.points.copy() for glyph in self.glyphs]
+        # What Create shows before a glyph starts: all its points collapsed on the first one.
+        self._hidden = [np.repeat(points[:1], len(points), axis=0) for points in self._full]
+        # How much of a glyph is drawn before and after its slot, as in Create: usually 0 and 1.
+        self._before, self._after = self.rate_func(0), self.rate_func(1)
+        for index in range(len(self.glyphs)):
+            self._draw(index, self._before)
+        self._shown, self._partial = 0, None
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        count = len(self.glyphs)
+        position = min(max(alpha, 0), 1) * count
+        shown = min(int(position), count)
+
+        for index in range(self._shown, shown):
+            self._draw(index, self._after)
+        for index in range(shown, self._shown):  # The animation may be played backwards.
+            self._draw(index, self._before)
+        partial = shown if shown < count else None
+        if self._partial is not None and self._partial != partial and self._partial >= shown:
+            self._draw(self._partial, self._before)
+        if partial is not None:
+            self._draw(partial, self.rate_func(position - shown))
+        self._shown, self._partial = shown, partial
+
+    def _draw(self, index: int, proportion: float):
+        """
+        Draw a proportion of a glyph, as :class:`Create` does.
+        """
+
+        if proportion >= 1:
+            self.glyphs[index].points = self._full[index].copy()
+        elif proportion <= 0:
+            self.glyphs[index].points = self._hidden[index].copy()
+        else:
+            self._scratch.points = self._full[index]
+            self.glyphs[index].pointwise_become_partial(self._scratch, 0, proportion)
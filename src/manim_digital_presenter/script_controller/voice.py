@@ -0,0 +1,236 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import re
+
+import numpy as np
+
+__all__ = ["Voice", "VoiceLine", "default_voice", "spoken_text", "reveal_times"]
+
+# LaTeX commands and math delimiters are not read aloud.
+_LATEX = re.compile(r"\\[A-Za-z]+|[${}^_]")
+
+
+def spoken_text(line) -> str:
+    """
+    The characters of a dialogue line that get a voice blip: letters and digits, without LaTeX commands.
+
+    :param line: The line, or its mobject (the ``tex_string`` of a :class:`Tex`, or the ``text`` of a :class:`Text`).
+    :type line: str | Mobject
+
+    :rtype: str
+
+    """
+
+    if not isinstance(line, str):
+        line = getattr(line, "tex_string", None) or getattr(line, "text", None) or ""
+    return "".join(character for character in _LATEX.sub("", line) if character.isalnum())
+
+
+def _glyph_indices(line) -> tuple[list[int], int]:
+    """
+    Index of the glyph of each spoken character of a line (see :func:`spoken_text`), and the number of glyphs. Every character that is not a space or LaTeX markup is one glyph, as in a :class:`Tex`. For a mobject, the indices are scaled to its actual number of glyphs.
+    """
+
+    glyph_count = None
+    if not isinstance(line, str):
+        members = getattr(line, "family_members_with_points", None)
+        glyph_count = len(members()) if members is not None else None
+        line = getattr(line, "tex_string", None) or getattr(line, "text", None) or ""
+    visible = [character for character in _LATEX.sub("", line) if not character.isspace()]
+    indices = [index for index, character in enumerate(visible) if character.isalnum()]
+    if glyph_count is None or glyph_count == len(visible) or not visible:
+        return indices, len(visible)
+    return [index * glyph_count // len(visible) for index in indices], glyph_count
+
+
+# rate function -> (progress grid, non-decreasing rate values), to invert the rate functions by interpolation.
+_INVERSES = {}
+
+
+def reveal_times(count: int, run_time: float, rate_func: Callable = None) -> np.ndarray:
+    """
+    Time at which each of ``count`` glyphs starts to be written when they are revealed one after the other over ``run_time``.
+
+    :class:`Create` (``lag_ratio=1``), :class:`Speak` and :class:`Typewriter` give each glyph an equal slot of the run time and apply their rate function inside the slot, so glyph ``i`` starts at ``i / count * run_time`` whatever the rate function. That is the default. For a reveal that applies its rate function to the whole line instead (glyph ``i`` appears when ``rate_func(alpha)`` reaches ``i / count``), pass that rate function: it is tabulated once and inverted.
+
+    :param count: Number of glyphs (or characters).
+    :type count: int
+
+    :param run_time: Run time of the animation, in seconds.
+    :type run_time: float
+
+    :param rate_func: Rate function applied to the whole line, if any. Defaults to None (one slot per glyph, as :class:`Create`).
+    :type rate_func: Callable, optional
+
+    :rtype: np.ndarray
+
+    """
+
+    if rate_func is None:
+        return run_time * np.arange(count) / max(count, 1)
+    inverse = _INVERSES.get(rate_func)
+    if inverse is None:
+        grid = np.linspace(0, 1, 513)
+        values = np.array([rate_func(t) for t in grid], dtype=float)
+        inverse = _INVERSES[rate_func] = grid, np.maximum.accumulate(values)
+    grid, values = inverse
+    return run_time * np.interp(np.arange(count) / max(count, 1), values, grid)
+
+
+@dataclass(frozen=True)
+class VoiceLine:
+    """
+    The voice track of one dialogue line, made by :meth:`Voice.line`. It can be the ``sound_to_play`` of an animation, and be mixed by :class:`AudioTrack` like a sound file.
+
+    :ivar text: The spoken characters of the line.
+    :ivar run_time: Run time of the animation revealing the line.
+    :ivar times: Time of each blip since the start of the line, in seconds.
+    :ivar samples: The track, as a float32 array of shape (frames, 1).
+    :ivar rate: Sample rate of the track.
+
+    """
+
+    text: str
+    run_time: float
+    times: np.ndarray = field(repr=False, compare=False)
+    samples: np.ndarray = field(repr=False, compare=False)
+    rate: int = 48000
+
+
+class Voice:
+    """
+    Procedural "voice" of a creature, as in classic RPGs: a short blip for the characters of a dialogue line, at the moment they are written on screen. Nothing is recorded or spoken, the blips are synthesised with NumPy.
+
+    The blips follow the reveal of :class:`Create` over the run time of the line: each blip starts with the glyph of its character. Each character gets its own pitch around ``pitch``, always the same for the same character, so a line always sounds the same. The track of each line is cached, and :meth:`Eyes.talk` bounces the eyes at the same times.
+
+    :param pitch: Base frequency of the blips, in Hz. Defaults to 220.
+    :type pitch: float, optional
+
+    :param variation: Spread of the pitch of the characters, in semitones above and below ``pitch``. Defaults to 4.
+    :type variation: int, optional
+
+    :param blip: Length of one blip, in seconds. Defaults to 0.05.
+    :type blip: float, optional
+
+    :param every: Blip every that many characters. Defaults to 2.
+    :type every: int, optional
+
+    :param volume: Peak amplitude of a blip, between 0 and 1. Defaults to 0.25.
+    :type volume: float, optional
+
+    :param waveform: "square" (chiptune) or "sine". Defaults to "square".
+    :type waveform: str, optional
+
+    :param rate: Sample rate of the track. Defaults to 48000.
+    :type rate: int, optional
+
+    **Example usage:**
+
+    .. code-block:: python
+
+        voice = Voice(pitch=300)
+        texts = create_dialogue_tex(dialogue)
+        self.play(Speak(texts[0], voice=voice, run_time=4), bloby.talk(texts[0], rt=4, voice=voice))
+
+    """
+
+    def __init__(self,
+                 pitch: float = 220,
+                 variation: int = 4,
+                 blip: float = 0.05,
+                 every: int = 2,
+                 volume: float = 0.25,
+                 waveform: str = "square",
+                 rate: int = 48000):
+        if waveform not in ("square", "sine"):
+            raise ValueError(f"waveform must be 'square' or 'sine', not {waveform!r}")
+        self.pitch = pitch
+        self.variation = variation
+        self.blip = blip
+        self.every = every
+        self.volume = volume
+        self.waveform = waveform
+        self.rate = rate
+        self._lines = {}
+
+        # One blip per semitone, computed once: a line is then only slices of these.
+        t = np.arange(round(blip * rate)) / rate
+        frequencies = pitch * 2 ** (np.arange(-variation, variation + 1) / 12)
+        waves = np.sin(2 * np.pi * frequencies[:, None] * t)
+        if waveform == "square":
+            waves = np.sign(waves)
+        envelope = np.minimum(1, t / 0.004) * (1 - t / blip)  # Short attack against clicks, linear decay.
+        self._blips = (volume * waves * envelope).astype(np.float32)
+
+    def character_times(self, text: str, run_time: float, rate_func: Callable = None) -> np.ndarray:
+        """
+        Time at which each character is written, if the line is revealed over ``run_time`` one character after the other (see :func:`reveal_times`).
+
+        :param text: The spoken characters, see :func:`spoken_text`.
+        :type text: str
+
+        :param run_time: Run time of the animation, in seconds.
+        :type run_time: float
+
+        :param rate_func: Rate function applied to the whole line, if any. Defaults to None (one slot per character, as :class:`Create`).
+        :type rate_func: Callable, optional
+
+        :rtype: np.ndarray
+
+        """
+
+        return reveal_times(len(text), run_time, rate_func)
+
+    def line(self, line, run_time: float, rate_func: Callable = None) -> VoiceLine:
+        """
+        Return the voice track of a dialogue line, from the cache if it was already synthesised. Each blip starts with the glyph of its character: every character that is not a space or LaTeX markup is one glyph, revealed at the times of :func:`reveal_times`. With the mobject of the line, its actual glyphs are counted.
+
+        :param line: The line, or its mobject, see :func:`spoken_text`.
+        :type line: str | Mobject
+
+        :param run_time: Run time of the animation revealing the line, in seconds.
+        :type run_time: float
+
+        :param rate_func: Rate function applied to the whole line by that animation, see :func:`reveal_times`. Defaults to None (:class:`Create`, :class:`Speak` and :class:`Typewriter`, whatever their rate function).
+        :type rate_func: Callable, optional
+
+        :rtype: VoiceLine
+
+        """
+
+        text = spoken_text(line)
+        indices, glyph_count = _glyph_indices(line)
+        key = (text, glyph_count, tuple(indices), float(run_time), rate_func)
+        voice_line = self._lines.get(key)
+        if voice_line is None:
+            voice_line = self._lines[key] = self._synthesise(text, indices, glyph_count, float(run_time), rate_func)
+        return voice_line
+
+    def _synthesise(self, text: str, indices: list[int], glyph_count: int, run_time: float, rate_func: Callable) -> VoiceLine:
+        text = text[::self.every]
+        times = reveal_times(glyph_count, run_time, rate_func)[indices[::self.every]] if text else np.zeros(0)
+        length = self._blips.shape[1]
+        semitones = np.array([ord(character) * 7 % (2 * self.variation + 1) for character in text], dtype=int)
+        offsets = np.round(times * self.rate).astype(int)
+        samples = np.zeros((offsets[-1] + length if len(offsets) else 0, 1), dtype=np.float32)
+        for offset, blip in zip(offsets.tolist(), self._blips[semitones]):
+            samples[offset:offset + length, 0] += blip  # Overlapping blips add up.
+        samples.setflags(write=False)
+        return VoiceLine(text, run_time, times, samples, self.rate)
+
+
+_DEFAULT_VOICE = None
+
+
+def default_voice() -> Voice:
+    """
+    Return the shared :class:`Voice` used when none is given, so its cache is shared too.
+
+    :rtype: Voice
+
+    """
+
+    global _DEFAULT_VOICE
+    if _DEFAULT_VOICE is None:
+        _DEFAULT_VOICE = Voice()
+    return _DEFAULT_VOICE
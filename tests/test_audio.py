@@ -0,0 +1,40 @@
+import wave
+
+import numpy as np
+
+from manim_digital_presenter.script_controller.audio import AudioTrack
+
+
+def beeps(count: int, every: float) -> AudioTrack:
+    track = AudioTrack()
+    for i in range(count):
+        track.add(every * i, gain=-6 if i % 2 else 0)
+    return track
+
+
+def test_chunks_add_up_to_the_mix():
+    track = beeps(40, 3)
+    full, rate = track.mix(start=0)
+    rebuilt = np.zeros_like(full)
+    for time, samples, chunk_rate in track.chunks(length=20):
+        assert chunk_rate == rate
+        offset = round(time * rate)
+        rebuilt[offset:offset + len(samples)] += samples
+    np.testing.assert_allclose(rebuilt, full, atol=1e-6)
+
+
+def test_chunks_stay_small_on_long_timelines():
+    track = beeps(500, 3)  # 25 minutes.
+    sizes = [samples.nbytes for _, samples, _ in track.chunks(length=60)]
+    assert len(sizes) == 25
+    assert max(sizes) < 70 * 48000 * 4 * 2  # About a minute of stereo float32, not 25.
+
+
+def test_export_matches_the_mix(tmp_path):
+    track = beeps(30, 3)
+    full, rate = track.mix(start=0)
+    with wave.open(track.export(str(tmp_path / "beeps.wav"), length=10)) as stream:
+        assert stream.getframerate() == rate
+        frames = np.frombuffer(stream.readframes(stream.getnframes()), dtype=np.int16)
+    expected = (np.clip(full, -1, 1) * 32767).astype(np.int16).ravel()
+    np.testing.assert_array_equal(frames, expected)
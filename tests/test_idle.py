@@ -0,0 +1,13 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim_digital_presenter.presenter.idle import IdleBehaviour
+
+
+def test_behaviour_without_update_cannot_be_created():
+    class Forgetful(IdleBehaviour):
+        pass
+
+    with pytest.raises(TypeError, match="update"):
+        Forgetful()
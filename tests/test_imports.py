@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from import_budget import IMPORT_BUDGET_MS, IMPORTS
+
+
+def time_import(statement: str) -> tuple[float, bool]:
+    """
+    Run an import statement in a fresh interpreter and return how long it took (milliseconds) and whether it imported manim.
+    """
+
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(1e3 * (time.perf_counter() - start), 'manim' in sys.modules)")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT / "src"), os.environ.get("PYTHONPATH")]))}
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env).stdout
+    elapsed, manim = output.split()
+    return float(elapsed), manim == "True"
+
+
+@pytest.mark.parametrize("name", [name for name, (_, manim_allowed) in IMPORTS.items() if not manim_allowed])
+def test_import_budget(name):
+    statement, _ = IMPORTS[name]
+    runs = [time_import(statement) for _ in range(3)]
+    assert not any(manim for _, manim in runs), f"{statement!r} imports manim"
+    assert min(elapsed for elapsed, _ in runs) <= IMPORT_BUDGET_MS[name]
@@ -0,0 +1,27 @@
+from manim_digital_presenter.script_controller.layout import GlyphMetrics, paginate_dialogue, wrap_dialogue
+from manim_digital_presenter.script_controller.loader import ScriptRow
+
+TEXT = ("Hello there, this is a rather long line of dialogue that should wrap over several lines "
+        "of the box, with {\\bf bold words} and $x^2 + y$ too.")
+
+
+def test_default_metrics_leave_room_for_comic_sans():
+    wide = GlyphMetrics(scale=1.2)
+    for line in wrap_dialogue(TEXT, 6):
+        assert wide.width(line) <= 6
+    assert len(wrap_dialogue(TEXT, 6)) >= len(wrap_dialogue(TEXT, 6, metrics=GlyphMetrics()))
+
+
+def test_groups_and_math_are_not_broken():
+    lines = wrap_dialogue(TEXT, 3)
+    assert any("{\\bf bold words}" in line for line in lines)
+    assert any("$x^2 + y$" in line for line in lines)
+
+
+def test_pages_of_rows():
+    row = ScriptRow("surprise", TEXT, 1.0, 4.0, 3)
+    pages = paginate_dialogue([row, ScriptRow("none", "short")], (6, 1.2))
+    assert len(pages) > 2
+    assert (pages[0].action, pages[0].start) == ("surprise", 1.0)
+    assert all((page.action, page.start, page.duration) == ("", None, 4.0) for page in pages[1:-1])
+    assert pages[-1] == ScriptRow("none", "short")
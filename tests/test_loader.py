@@ -0,0 +1,45 @@
+import pytest
+
+from manim_digital_presenter.script_controller.loader import ScriptRow, iter_script_rows, load_csv_dialogue
+from manim_digital_presenter.script_controller.schedule import script_timeline
+
+
+def write_script(tmp_path, text: str) -> str:
+    script = tmp_path / "script.csv"
+    script.write_text(text)
+    return str(script)
+
+
+def test_delimiter_inside_dialogue(tmp_path):
+    script = write_script(tmp_path, "a/ see 1/2 and/or\n"
+                                    "b/and/or/4/2\n"
+                                    "c/$1/2$ of it/3\n"
+                                    'd/"half is 1/2"\n')
+    rows = list(iter_script_rows(script))
+    assert [(row.action, row.dialogue, row.start, row.duration) for row in rows] == [
+        ("a", " see 1/2 and/or", None, None),
+        ("b", "and/or", 4, 2),
+        ("c", "$1/2$ of it", 3, None),
+        ("d", "half is 1/2", None, None),
+    ]
+    assert load_csv_dialogue(script) == (["a", "b", "c", "d"], [row.dialogue for row in rows])
+
+
+def test_timing_columns(tmp_path):
+    rows = list(iter_script_rows(write_script(tmp_path, "a/hello\nb/hi//1.5\n# comment\n\nc/bye/7\n")))
+    assert rows == [ScriptRow("a", "hello", None, None, 1),
+                    ScriptRow("b", "hi", None, 1.5, 2),
+                    ScriptRow("c", "bye", 7, None, 5)]
+
+
+def test_malformed_rows(tmp_path):
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_script_rows(write_script(tmp_path, "a/hello\nnope\n")))
+    with pytest.raises(ValueError, match="negative"):
+        list(iter_script_rows(write_script(tmp_path, "a/hello/-1\n")))
+
+
+def test_timeline_with_too_few_steps():
+    rows = [ScriptRow("none", "one", line_number=1), ScriptRow("none", "two", line_number=2)]
+    with pytest.raises(ValueError, match="row 2"):
+        script_timeline(rows, steps=iter([["first step"]]))
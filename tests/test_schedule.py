@@ -0,0 +1,55 @@
+import functools
+
+import pytest
+
+from manim_digital_presenter.presenter.actions import creature_action
+from manim_digital_presenter.script_controller.dry_run import timing_report
+from manim_digital_presenter.script_controller.loader import ScriptRow
+from manim_digital_presenter.script_controller.schedule import PlannedAnimation, TimelineBuilder, script_timeline
+
+
+class Part:
+    """
+    Minimal mobject: a tree of parts with ``get_family``, like manim's.
+    """
+
+    def __init__(self, *submobjects):
+        self.submobjects = list(submobjects)
+
+    def get_family(self):
+        return [self] + [member for sub in self.submobjects for member in sub.get_family()]
+
+
+def test_overlap_between_mobject_and_its_part():
+    sight = Part(Part(), Part())
+    schedule = TimelineBuilder()
+    first = schedule.at(0, PlannedAnimation("look_at", 2, sight))
+    second = schedule.at(1, PlannedAnimation("shift", 2, sight.submobjects[0]))
+    schedule.at(1, PlannedAnimation("shift", 2, Part()))
+    assert schedule.overlaps() == [(first, second)]
+    with pytest.raises(ValueError, match="overlapping"):
+        schedule.validate(min_gap=0)
+
+
+class Blob(Part):
+    @creature_action
+    def wave(self, rf=None, rt=2):
+        raise AssertionError("Actions are not called in a dry run")
+
+
+def test_dry_run_times_partial_actions():
+    blob = Blob()
+    rows = [ScriptRow("wave", "hi"), ScriptRow("slow", "hello"), ScriptRow("class", "bye")]
+    actions = {"wave": blob.wave, "slow": functools.partial(blob.wave, rt=5),
+               "class": functools.partial(Blob.wave, blob, None, 4)}
+    timeline = script_timeline(rows, actions, dry_run=True)
+    assert [(anim.run_time, anim.mobject) for anims in timeline.values() for anim in anims] == [(2, blob), (5, blob), (4, blob)]
+
+
+def test_dry_run_marks_other_actions_untimed():
+    rows = [ScriptRow("jump", "hi")]
+    with pytest.warns(UserWarning, match="'<lambda>' is not a creature_action"):
+        timeline = script_timeline(rows, {"jump": lambda: None}, dry_run=True)
+    report = timing_report(timeline)
+    assert [entry.timed for entry in report.untimed()] == [False]
+    assert "1 untimed" in report.format()
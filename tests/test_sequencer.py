@@ -0,0 +1,23 @@
+import pytest
+
+import manim_digital_presenter
+from manim_digital_presenter._lazy import lazy_exports
+from manim_digital_presenter.script_controller.sequencer import script_sequencer
+
+
+def test_dry_run_with_text_box_alternates_slots():
+    steps = list(script_sequencer(["one", "two", "three"], None, animation_rt=3, dry_run=True, text_box="box"))
+    writes = [next(anim for anim in step if anim.name == "WriteInSlot") for step in steps[:3]]
+    assert [write.mobject for write in writes] == ["text slot 1", "text slot 2", "text slot 1"]
+    assert [write.label for write in writes] == ["one", "two", "three"]
+    # Each line fades out of the slot it was written in.
+    fades = [next(anim for anim in step if anim.name == "Fwc") for step in steps[1:]]
+    assert [fade.mobject for fade in fades] == ["text slot 1", "text slot 2", "text slot 1"]
+
+
+def test_top_level_names_are_unique():
+    from manim_digital_presenter import presenter, script_controller
+    assert not set(presenter.__all__) & set(script_controller.__all__)
+    assert {"Blink", "BlinkIndicator"} <= set(manim_digital_presenter.__all__)
+    with pytest.raises(ValueError, match="'Blink'"):
+        lazy_exports("manim_digital_presenter", {"presenter": ["Blink"], "script_controller": ["Blink"]})
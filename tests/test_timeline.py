@@ -0,0 +1,45 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim_digital_presenter.script_controller.text_slot import TextSlot, WriteInSlot
+from manim_digital_presenter.script_controller.timeline import TimelineEngine
+
+
+def line(count):
+    return manim.VGroup(*(manim.Square(0.1).shift(0.12 * i * manim.RIGHT) for i in range(count)))
+
+
+def test_segment_hash_covers_the_line_of_a_slot():
+    slot = TextSlot()
+    hashes = {TimelineEngine({0: WriteInSlot(slot, text, run_time=2)}).segment_hash(0, 2)
+              for text in (line(5), line(6))}
+    assert len(hashes) == 2
+
+
+def segment_hash(anim):
+    return TimelineEngine({0: anim}).segment_hash(0, anim.get_run_time())
+
+
+def test_segment_hash_covers_animation_settings():
+    square = manim.Square()
+    assert segment_hash(manim.Rotate(square, angle=manim.PI / 2)) != segment_hash(manim.Rotate(square, angle=manim.PI / 3))
+    assert segment_hash(manim.Rotate(square, angle=1)) == segment_hash(manim.Rotate(square, angle=1))
+
+
+def test_segment_hash_covers_lambda_rate_funcs():
+    square = manim.Square()
+    assert (segment_hash(manim.FadeOut(square, rate_func=lambda t: t**2))
+            != segment_hash(manim.FadeOut(square, rate_func=lambda t: t**3)))
+
+
+class RecordingScene(manim.Scene):
+    def play(self, *animations, **kwargs):
+        self.played = getattr(self, "played", []) + list(animations)
+
+
+@pytest.mark.parametrize("segments", [True, False])
+def test_empty_timeline_plays_nothing(segments):
+    scene = RecordingScene()
+    TimelineEngine({}).play(scene, segments=segments)
+    assert getattr(scene, "played", []) == []
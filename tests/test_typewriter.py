@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim_digital_presenter.script_controller.typewriter import Typewriter
+
+
+def line():
+    return manim.VGroup(*(manim.Square(0.1).shift(0.12 * i * manim.RIGHT) for i in range(12)))
+
+
+@pytest.mark.parametrize("rate_func", [manim.smooth, manim.linear, manim.there_and_back])
+def test_same_reveal_as_create(rate_func):
+    created, typed = line(), line()
+    create = manim.Create(created, rate_func=rate_func, run_time=2)
+    typewriter = Typewriter(typed, rate_func=rate_func, run_time=2)
+    create.begin()
+    typewriter.begin()
+    for alpha in np.linspace(0, 1, 49):
+        create.interpolate(alpha)
+        typewriter.interpolate(alpha)
+        for expected, glyph in zip(created.family_members_with_points(), typed.family_members_with_points()):
+            np.testing.assert_allclose(glyph.points, expected.points, atol=1e-9)
+    np.testing.assert_allclose(typewriter.reveal_times, 2 * np.arange(12) / 12)
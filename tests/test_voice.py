@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from manim_digital_presenter.script_controller.voice import Voice, reveal_times
+
+
+def test_blips_start_with_their_glyph():
+    voice = Voice(every=1)
+    line = voice.line("Hi, you 2!", run_time=4)
+    # Glyphs: H i , y o u 2 ! -> the spoken ones are 0, 1, 3, 4, 5, 6 of 8.
+    np.testing.assert_allclose(line.times, 4 * np.array([0, 1, 3, 4, 5, 6]) / 8)
+
+
+def test_reveal_times_of_a_global_rate_function():
+    times = reveal_times(4, 2, rate_func=lambda t: t**2)
+    np.testing.assert_allclose(times, 2 * np.sqrt(np.arange(4) / 4), atol=1e-2)
+
+
+def test_blips_follow_create():
+    manim = pytest.importorskip("manim")
+    from manim_digital_presenter.script_controller.beeper import Speak
+
+    glyphs = manim.VGroup(*(manim.Square(0.1).shift(0.2 * i * manim.RIGHT) for i in range(10)))
+    glyphs.tex_string = "abcdefghij"
+    speak = Speak(glyphs, voice=Voice(every=1), run_time=4)
+    count = len(glyphs.family_members_with_points())
+    for index, time in enumerate(speak.sound_to_play.times):
+        # The glyph is still hidden when its blip starts, and being drawn right after.
+        assert speak.get_sub_alpha(time / 4, index, count) == pytest.approx(0, abs=1e-6)
+        assert speak.get_sub_alpha(time / 4 + 0.01, index, count) > 0